@@ -20,6 +20,8 @@ import os
 import re
 import sys
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # ── Windows UTF-8 강제 ──
@@ -52,6 +54,26 @@ _DESKTOP_UA = (
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
 )
 
+# 히스토리 비교 키용 공백 패턴
+_WS_RE = re.compile(r"\s+")
+
+# 제목 클리닝 패턴: 개별 re.sub/search 반복 대신 하나의 alternation → 제목당 1회 스캔
+# 네이트판 링크 텍스트: "1동남아련들 다 탈퇴시켜라 걍(124)조회70,846|추천373"
+_NATE_TALK_RE = re.compile(r'/talk/(\d{6,})')
+_NATE_RANK_RE = re.compile(r'^\d{1,2}')
+_NATE_CMT_RE = re.compile(r'\((\d{1,5})\)')
+_NATE_VIEWS_RE = re.compile(r'조회([\d,]+)')
+_NATE_REC_RE = re.compile(r'추천(\d+)')
+_NATE_METRIC_RE = re.compile(r'\(\d{1,5}\)|조회[\d,]+|\|?추천\d+')
+# 디시: 닉네임/시간/조회수/추천수 중 가장 앞에 나온 지점에서 제목 자르기
+_DC_TITLE_CUT_RE = re.compile(
+    r'ㅇㅇ(?:\([\d.]+\))?\s*\d{1,2}:\d{2}'
+    r'|(?<![a-zA-Z가-힣])[a-zA-Z가-힣]+\d{1,2}:\d{2}'
+    r'|\d{1,2}:\d{2}'
+    r'|조회\s*[\d,]+'
+    r'|추천\s*\d+'
+)
+
 # ── 블랙리스트 (170+ 금지어) ──
 BLACKLIST = [
     # 정치
@@ -533,6 +555,8 @@ class TrendSource:
                         "chart": "mostPopular",
                         "regionCode": "KR",
                         "maxResults": 50,
+                        # 실제로 쓰는 필드만 응답 (설명/썸네일/태그 등 생략)
+                        "fields": "items(snippet/title,contentDetails/duration,statistics/viewCount)",
                         "key": api_key,
                     },
                     timeout=15,
@@ -687,7 +711,7 @@ class TrendSource:
                         href = a_tag.get("href", "")
                         if "/talk/" not in href:
                             continue
-                        talk_match = re.search(r'/talk/(\d{6,})', href)
+                        talk_match = _NATE_TALK_RE.search(href)
                         if not talk_match:
                             continue
 
@@ -695,27 +719,24 @@ class TrendSource:
                         if not raw or len(raw) < 10 or len(raw) > 120:
                             continue
 
-                        title_raw = re.sub(r'^\d{1,2}', '', raw)
+                        title_raw = _NATE_RANK_RE.sub('', raw)
 
                         comments = 0
-                        cm = re.search(r'\((\d{1,5})\)', title_raw)
+                        cm = _NATE_CMT_RE.search(title_raw)
                         if cm:
                             comments = int(cm.group(1))
 
                         views = 0
-                        vm = re.search(r'조회([\d,]+)', title_raw)
+                        vm = _NATE_VIEWS_RE.search(title_raw)
                         if vm:
                             views = int(vm.group(1).replace(",", ""))
 
                         recommends = 0
-                        rm = re.search(r'추천(\d+)', title_raw)
+                        rm = _NATE_REC_RE.search(title_raw)
                         if rm:
                             recommends = int(rm.group(1))
 
-                        title = title_raw
-                        for pat in [r'\(\d{1,5}\)', r'조회[\d,]+', r'\|?추천\d+']:
-                            title = re.sub(pat, '', title)
-                        title = title.strip()
+                        title = _NATE_METRIC_RE.sub('', title_raw).strip()
 
                         if not title or len(title) < 3:
                             continue
@@ -787,16 +808,9 @@ class TrendSource:
                 if rm:
                     recommends = int(rm.group(1))
 
-                for pattern in [
-                    r'ㅇㅇ(?:\([\d.]+\))?\s*\d{1,2}:\d{2}',
-                    r'[a-zA-Z가-힣]+\d{1,2}:\d{2}',
-                    r'\d{1,2}:\d{2}',
-                    r'조회\s*[\d,]+',
-                    r'추천\s*\d+',
-                ]:
-                    cut = re.search(pattern, title)
-                    if cut:
-                        title = title[:cut.start()]
+                cut = _DC_TITLE_CUT_RE.search(title)
+                if cut:
+                    title = title[:cut.start()]
                 title = re.sub(r'ㅇㅇ$', '', title).strip()
                 title = re.sub(r'\d{1,3}$', '', title).strip()
                 title = re.sub(
@@ -1120,24 +1134,22 @@ class TrendFilter:
         return result
 
     @staticmethod
-    def deduplicate_with_history(trends: list[dict]) -> list[dict]:
+    def deduplicate_with_history(trends: list[dict],
+                                 past_titles: list[str] | None = None) -> list[dict]:
         """topic_history.json 대조 — 최근 200개와 첫 20자 비교"""
-        past_titles: list[str] = []
-        try:
-            if HISTORY_FILE.exists():
-                with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-                    past_titles = json.load(f)
-        except Exception:
-            pass
+        if past_titles is None:
+            past_titles = load_topic_history()
 
-        if not past_titles:
+        if not past_titles or not trends:
             return trends
 
-        past_keys = set(t[:20] for t in past_titles)
+        # 공백 무시 비교 (띄어쓰기만 다른 같은 주제도 중복 처리)
+        past_keys = {_topic_key(t) for t in past_titles if isinstance(t, str)}
+        past_keys.discard("")
         filtered = []
         skipped = 0
         for t in trends:
-            key = t["keyword"][:20]
+            key = _topic_key(t["keyword"])
             if key in past_keys:
                 skipped += 1
                 continue
@@ -1184,7 +1196,9 @@ class GeminiConverter:
     """Gemini Flash로 바이럴 평가 + 키워드→숏츠 주제문 변환"""
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def _get_model():
+        """평가/변환 단계가 같은 모델 공유 (환경변수 조회 + configure 1회)"""
         api_key = os.getenv("GOOGLE_API_KEY", "")
         if not api_key:
             return None
@@ -1388,18 +1402,39 @@ def save_topics(topics: list[str]) -> None:
     print(f"  [PATH] {TOPICS_FILE}")
 
 
-def save_topic_history(keywords: list[str]) -> None:
-    """topic_history.json 업데이트 (최대 200개 유지)"""
-    past: list[str] = []
+def _topic_key(text: str) -> str:
+    """히스토리 비교 키: 공백 제거 후 앞 20자"""
+    return _WS_RE.sub("", text)[:20]
+
+
+def load_topic_history() -> list[str]:
+    """topic_history.json 로드 (실패 시 빈 리스트)"""
     try:
         if HISTORY_FILE.exists():
             with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-                past = json.load(f)
+                return json.load(f)
     except Exception:
         pass
+    return []
 
-    past = keywords + past
-    past = past[:200]
+
+def save_topic_history(keywords: list[str],
+                       past: list[str] | None = None) -> None:
+    """topic_history.json 업데이트 (최대 200개 유지)"""
+    if past is None:
+        past = load_topic_history()
+
+    # 같은 비교 키는 최신 1개만 (중복이 200칸을 차지하지 않게)
+    seen: set[str] = set()
+    merged: list[str] = []
+    for t in keywords + past:
+        if not isinstance(t, str):
+            continue
+        key = _topic_key(t)
+        if key and key not in seen:
+            seen.add(key)
+            merged.append(t)
+    past = merged[:200]
 
     HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(HISTORY_FILE, "w", encoding="utf-8") as f:
@@ -1440,17 +1475,21 @@ def collect_trends(source_filter: str | None = None) -> list[dict]:
             print(f"  [INFO] 사용 가능: {', '.join(source_map.keys())}")
             return []
     else:
-        for name, fetcher in source_map.items():
-            try:
-                all_trends.extend(fetcher())
-            except Exception as e:
-                print(f"  [WARN] {name} 수집 실패: {e}")
+        # 소스별 요청은 독립적 → 병렬 수집, 합치는 순서는 source_map 순서 유지
+        with ThreadPoolExecutor(max_workers=len(source_map)) as ex:
+            futures = {name: ex.submit(fetcher) for name, fetcher in source_map.items()}
+            for name, fut in futures.items():
+                try:
+                    all_trends.extend(fut.result())
+                except Exception as e:
+                    print(f"  [WARN] {name} 수집 실패: {e}")
 
     print(f"\n  총 {len(all_trends)}개 수집 완료 (필터 전)")
     return all_trends
 
 
-def filter_and_score(trends: list[dict]) -> list[dict]:
+def filter_and_score(trends: list[dict],
+                     past_titles: list[str] | None = None) -> list[dict]:
     """필터 → 부스트 → 감점 → 중복제거 → 정렬"""
     print("\n" + "=" * 60)
     print("STEP 2: 필터링 + 점수화")
@@ -1463,7 +1502,7 @@ def filter_and_score(trends: list[dict]) -> list[dict]:
     trends = f.apply_category_boost(trends)
     trends = f.apply_boring_penalty(trends)
     trends = f.deduplicate_session(trends)
-    trends = f.deduplicate_with_history(trends)
+    trends = f.deduplicate_with_history(trends, past_titles)
     trends = f.deduplicate_with_topics(trends)
 
     # 최종 정렬
@@ -1519,8 +1558,9 @@ def main():
         print("\n  [ERROR] 수집된 트렌드 0개 -- 종료")
         sys.exit(1)
 
-    # 2) 필터 + 점수
-    trends = filter_and_score(trends)
+    # 2) 필터 + 점수 (히스토리는 1번만 로드 → 중복 제거/저장에 재사용)
+    past_titles = load_topic_history()
+    trends = filter_and_score(trends, past_titles)
     if not trends:
         print("\n  [ERROR] 필터 후 트렌드 0개 -- 종료")
         sys.exit(1)
@@ -1569,7 +1609,7 @@ def main():
         print("\n  [DRY-RUN] 저장 스킵")
     else:
         save_topics(topics)
-        save_topic_history(keywords)
+        save_topic_history(keywords, past_titles)
 
     print("\n" + "=" * 60)
     print("DONE")
@@ -7,7 +7,6 @@ ElevenLabs TTS 모듈 — YouShorts v6.0
 """
 
 import os
-import re
 import time
 import base64
 import asyncio
@@ -259,6 +258,10 @@ class ElevenLabsTTS:
 
         return word_timings
 
+    # 어절 병합용 문자 집합 (조각마다 정규식 매칭 대신 str/frozenset 조회)
+    _PUNCT_CHARS = ".,!?~-ㅋㅎㅠㅜ"
+    _SINGLE_PARTICLES = frozenset("은는이가을를에서도의로와과")
+
     @staticmethod
     def _split_eojeol(text: str) -> list[str]:
         """한국어 텍스트를 자연스러운 어절 단위로 분할
@@ -276,10 +279,10 @@ class ElevenLabsTTS:
         # 문장부호만으로 구성된 조각은 직전에 합치기
         merged = []
         for part in raw_parts:
-            if merged and re.match(r'^[.,!?\~\-ㅋㅎㅠㅜ]+$', part):
+            if merged and not part.strip(ElevenLabsTTS._PUNCT_CHARS):
                 # 문장부호만 → 직전 어절에 합침
                 merged[-1] += part
-            elif merged and len(part) == 1 and re.match(r'^[은는이가을를에서도의로와과]$', part):
+            elif merged and part in ElevenLabsTTS._SINGLE_PARTICLES:
                 # 단독 조사 → 직전 어절에 합침
                 merged[-1] += part
             else:
@@ -56,6 +56,7 @@ v4.0 → v4.1 변경사항:
 
 import argparse
 import asyncio
+import gc
 import io
 import json
 import os
@@ -67,10 +68,16 @@ import math
 import textwrap
 import shutil
 import random
+import threading
+import traceback
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
+from urllib.parse import urlsplit
 
 # Windows cp949 콘솔에서 이모지/한글 출력 깨짐 방지
 if sys.platform == "win32":
@@ -89,8 +96,12 @@ except ImportError:
 # ============================================================
 # 📦 의존성 체크 & 설치
 # ============================================================
+@lru_cache(maxsize=1)
 def _get_ffmpeg_path() -> str:
-    """FFmpeg 실행 파일 경로를 찾습니다 (imageio_ffmpeg 우선)."""
+    """FFmpeg 실행 파일 경로를 찾습니다 (imageio_ffmpeg 우선).
+
+    v11.1: 실행 환경 고정 → 최초 1회만 탐색 (which/where 서브프로세스 반복 방지)
+    """
     # 1차: imageio_ffmpeg 번들
     try:
         import imageio_ffmpeg
@@ -113,6 +124,93 @@ def _get_ffmpeg_path() -> str:
 FFMPEG_PATH = ""
 FFPROBE_PATH = ""
 
+@lru_cache(maxsize=1)
+def _find_ytdlp() -> tuple:
+    """yt-dlp 실행 경로 자동 탐색 (v11.1: 최초 1회만, 결과 캐시)"""
+    # 1차: PATH에서 찾기
+    if shutil.which("yt-dlp"):
+        return ("yt-dlp",)
+    # 2차: Python Scripts 폴더
+    scripts_dir = os.path.join(os.path.dirname(sys.executable), "Scripts")
+    ytdlp_exe = os.path.join(scripts_dir, "yt-dlp.exe")
+    if os.path.exists(ytdlp_exe):
+        return (ytdlp_exe,)
+    # 3차: python -m yt_dlp
+    return (sys.executable, "-m", "yt_dlp")
+
+
+# yt-dlp 다운로드 결과로 인정하는 영상 확장자
+_VIDEO_EXTS = (".mp4", ".mkv", ".webm")
+
+# ffmpeg -i 배너의 "Duration: HH:MM:SS.xx" (ffprobe 없을 때 폴백)
+_DURATION_RE = re.compile(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
+
+# 출력 파일명용 제목 정리 (한글/영숫자 외 → "_")
+_SAFE_TITLE_RE = re.compile(r'[^\w가-힣]')
+
+# 검색어 정리 (구두점 제거)
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# 공백 문자열
+_WS_RE = re.compile(r'\s+')
+
+# v11.1: 하드웨어 H.264 인코더 캐시 (None = 미탐지, "" = 없음 → libx264)
+_HW_ENCODER: Optional[str] = None
+
+
+def _detect_hw_encoder() -> str:
+    """사용 가능한 HW H.264 인코더 탐지 (최초 1회만 실행, 결과 캐시)
+
+    -encoders 목록에 있어도 GPU/드라이버가 없으면 실패하므로
+    1프레임 테스트 인코딩까지 통과한 인코더만 채택.
+    VAAPI는 hwupload 필터 체인이 필요해서 제외.
+    """
+    global _HW_ENCODER
+    if _HW_ENCODER is not None:
+        return _HW_ENCODER
+    _HW_ENCODER = ""
+    if not FFMPEG_PATH or os.getenv("DISABLE_HW_ENCODER", "") == "1":
+        return _HW_ENCODER
+
+    try:
+        r = subprocess.run([FFMPEG_PATH, "-hide_banner", "-encoders"],
+                           capture_output=True, text=True, timeout=10,
+                           encoding="utf-8", errors="replace")
+        listed = r.stdout or ""
+    except Exception as e:
+        print(f"  ⚠️  HW 인코더 탐지 실패: {e}")
+        return _HW_ENCODER
+
+    for enc in ("h264_nvenc", "h264_qsv", "h264_videotoolbox"):
+        if enc not in listed:
+            continue
+        try:
+            test = subprocess.run([
+                FFMPEG_PATH, "-hide_banner", "-f", "lavfi",
+                "-i", "color=c=black:s=256x256:d=0.1",
+                "-frames:v", "1", "-c:v", enc, "-f", "null", "-",
+            ], capture_output=True, text=True, timeout=15,
+               encoding="utf-8", errors="replace")
+        except Exception:
+            continue
+        if test.returncode == 0:
+            _HW_ENCODER = enc
+            print(f"  🚀 HW 인코더 사용: {enc}")
+            break
+    return _HW_ENCODER
+
+
+def _h264_encoder_args(preset: str, crf: int, use_hw: bool = True) -> list[str]:
+    """H.264 비디오 인코더 인자 (HW 가능하면 HW, 아니면 libx264 CRF)"""
+    enc = _detect_hw_encoder() if use_hw else ""
+    if enc == "h264_nvenc":
+        return ["-c:v", enc, "-preset", "p4", "-rc", "vbr", "-cq", str(crf)]
+    if enc == "h264_qsv":
+        return ["-c:v", enc, "-preset", "veryfast", "-global_quality", str(crf)]
+    if enc == "h264_videotoolbox":
+        return ["-c:v", enc, "-b:v", "6000k"]
+    return ["-c:v", "libx264", "-preset", preset, "-crf", str(crf)]
+
 
 def check_dependencies():
     """필요한 패키지 자동 설치"""
@@ -178,8 +276,17 @@ try:
     import anthropic as _anthropic_module
 except ImportError:
     _anthropic_module = None
+try:
+    import orjson as _orjson  # 선택: 대용량 API 응답(JSON) 파싱 가속
+except ImportError:
+    _orjson = None
 from apify_client import ApifyClient
-from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance
+from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageEnhance, ImageOps
+
+# v11.1: 공용 HTTP 세션 (TLS/커넥션 재사용) + 대용량 다운로드 청크
+_HTTP = requests.Session()
+_HTTP.mount("https://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=16))
+_DOWNLOAD_CHUNK = 256 * 1024  # 8KB → 256KB: write 시스템콜 32배 감소
 
 
 # ============================================================
@@ -218,6 +325,10 @@ class Config:
     height: int = 1920
     fps: int = 30
     quality: int = 80
+    # v11.1: x264 인코딩 속도/화질 트레이드오프 (medium → faster: 인코딩 ~70% 단축)
+    x264_preset: str = "faster"
+    x264_crf: int = 20
+    hw_encoder: bool = True  # v11.1: NVENC/QSV/VideoToolbox 자동 탐지 (실패 시 libx264)
 
     # 폰트 (자연스러운 한글)
     font_name: str = "NanumSquareRound"
@@ -325,9 +436,21 @@ class FontManager:
         FontManager._shorts_font_cache[cache_key] = fallback
         return fallback
 
+    # v11.1: get_font 결과 캐시 — fc-list 서브프로세스/TTF 파싱을 (크기, 굵기)당 1회로
+    _font_cache: dict = {}
+
     @staticmethod
     def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
-        """사용 가능한 가장 좋은 한글 폰트 반환"""
+        """사용 가능한 가장 좋은 한글 폰트 반환 (size/bold별 캐시)"""
+        cache_key = (size, bold)
+        font = FontManager._font_cache.get(cache_key)
+        if font is None:
+            font = FontManager._load_font(size, bold)
+            FontManager._font_cache[cache_key] = font
+        return font
+
+    @staticmethod
+    def _load_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
         # 1차: Windows 폰트 디렉토리 검색
         if sys.platform == "win32":
             font_path = FontManager._find_windows_font(bold)
@@ -400,17 +523,19 @@ class FontManager:
                 ["fc-list", ":lang=ko", "file"],
                 capture_output=True, text=True, encoding="utf-8", errors="replace", timeout=5
             )
-            font_lines = result.stdout.strip().split("\n")
+            # v11.1: 줄 파싱/소문자 변환은 1회만 (선호 폰트 × 줄 수만큼 반복하지 않음)
+            font_paths = [line.split(":")[0].strip()
+                          for line in result.stdout.strip().split("\n")]
+            lowered = [(p, p.lower()) for p in font_paths]
 
             for pref in preferred:
-                for line in font_lines:
-                    path = line.split(":")[0].strip()
-                    if pref.lower() in path.lower() and os.path.exists(path):
+                pref_lower = pref.lower()
+                for path, path_lower in lowered:
+                    if pref_lower in path_lower and os.path.exists(path):
                         return path
 
             # 아무 한글 폰트라도
-            for line in font_lines:
-                path = line.split(":")[0].strip()
+            for path in font_paths:
                 if os.path.exists(path) and path.endswith((".ttf", ".otf")):
                     return path
 
@@ -624,8 +749,8 @@ class StockVideoFetcher:
                     "per_page": 15,
                     "min_duration": 15,
                 }
-                resp = requests.get(self.PEXELS_API_URL, headers=headers,
-                                    params=params, timeout=15)
+                resp = _HTTP.get(self.PEXELS_API_URL, headers=headers,
+                                 params=params, timeout=15)
                 if resp.status_code != 200:
                     print(f"    ⚠️  Pexels API 오류 ({keyword}): {resp.status_code}")
                     continue
@@ -643,8 +768,8 @@ class StockVideoFetcher:
                 if not candidates:
                     # orientation 없이 재시도
                     params.pop("orientation", None)
-                    resp = requests.get(self.PEXELS_API_URL, headers=headers,
-                                        params=params, timeout=15)
+                    resp = _HTTP.get(self.PEXELS_API_URL, headers=headers,
+                                     params=params, timeout=15)
                     data = resp.json()
                     for v in data.get("videos", []):
                         if v.get("duration", 0) >= 15:
@@ -686,10 +811,10 @@ class StockVideoFetcher:
     def download_video(self, url: str, save_path: str) -> bool:
         """비디오 URL → 로컬 파일 다운로드"""
         try:
-            resp = requests.get(url, timeout=60, stream=True)
+            resp = _HTTP.get(url, timeout=60, stream=True)
             if resp.status_code == 200:
                 with open(save_path, "wb") as f:
-                    for chunk in resp.iter_content(chunk_size=8192):
+                    for chunk in resp.iter_content(chunk_size=_DOWNLOAD_CHUNK):
                         f.write(chunk)
                 self._download_count += 1
                 return True
@@ -1148,8 +1273,7 @@ class ImageGenerator:
             return f"{animal} funny behavior real video short clip"
         else:
             # 동물 미감지 → 주제 자체 + "animal" 키워드
-            import re as _re
-            clean = _re.sub(r'[^\w\s]', '', topic)
+            clean = _PUNCT_RE.sub('', topic)
             words = clean.split()[:3]
             base = " ".join(words) if words else "animal nature"
             return f"{base} real video short clip"
@@ -1172,125 +1296,216 @@ class ImageGenerator:
         print(f"\n  🎥 YouTube 클립 검색: \"{keyword}\"")
 
         ytdlp_cmd = self._find_ytdlp_cmd()
-        output_template = os.path.join(full_dir, "%(id)s.%(ext)s")
 
         # Step 1: CC 라이선스 우선 다운로드 (ytsearch5)
-        downloaded = False
         search_queries = [
             f"ytsearch5:{keyword}",                                  # 메인 검색
             f"ytsearch3:{keyword.split()[0]} animal compilation",    # 컴필레이션
         ]
 
-        for sq in search_queries:
-            cmd = ytdlp_cmd + [
-                sq,
-                "-f", "best[height>=720][ext=mp4]/best[height>=480][ext=mp4]/best[ext=mp4]/best",
-                "-o", output_template,
-                "--no-playlist",
-                "--max-filesize", "200M",
-                "--max-downloads", "4",
-                "--match-filters", "duration >= 30 & duration <= 600",
-                "--no-overwrites",
-                "--socket-timeout", "20",
-            ]
-            try:
-                print(f"    ⬇️  다운로드 중: {sq[:60]}...")
-                result = subprocess.run(
-                    cmd, capture_output=True, text=True, timeout=240,
-                    encoding="utf-8", errors="replace",
-                )
-                # 다운로드 파일 존재 확인
-                vfiles = [f for f in os.listdir(full_dir)
-                          if f.endswith((".mp4", ".mkv", ".webm"))]
-                if vfiles:
-                    downloaded = True
-                    break
-            except subprocess.TimeoutExpired:
-                print(f"    ⏰ 타임아웃 → 다음 검색어")
-            except FileNotFoundError:
+        # 컴필레이션은 폴백: 메인 검색 결과가 없을 때만 실행 (대기/대역폭 낭비 없음)
+        # 검색어마다 별도 폴더 → 폴백 영상이 메인 결과와 섞이지 않음
+        video_files = []
+        for qi, sq in enumerate(search_queries):
+            qd = os.path.join(full_dir, f"q{qi}")
+            if self._ytdlp_search_download(ytdlp_cmd, sq, qd) == "missing":
                 print(f"    ❌ yt-dlp 미설치! pip install yt-dlp")
                 return []
-            except Exception as e:
-                print(f"    ⚠️  에러: {e}")
-
-        if not downloaded:
+            # v11.1: os.scandir — DirEntry가 파일 타입을 캐시 (추가 stat 없음)
+            with os.scandir(qd) as it:
+                video_files = [e.path for e in it
+                               if e.is_file() and e.name.endswith(_VIDEO_EXTS)]
+            if video_files:
+                break
+        if not video_files:
             print(f"    ❌ YouTube 다운로드 실패")
             return []
-
-        # 다운로드된 영상 수집
-        video_files = [
-            os.path.join(full_dir, f)
-            for f in os.listdir(full_dir)
-            if f.endswith((".mp4", ".mkv", ".webm"))
-        ]
         print(f"    ✅ {len(video_files)}개 영상 다운로드 완료")
 
         # Step 2: 각 영상에서 다양한 구간 클립 추출 (영상당 최대 4개)
-        clip_paths = []
-        clip_idx = 0
+        # v11.1: 구간 계획 먼저 → FFmpeg 추출은 병렬 (CPU 코어 절반까지)
         MAX_PER_VIDEO = 4
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
 
-        for vf in video_files:
-            duration = self._get_video_duration(vf)
-            if duration < 10:
-                print(f"      ⏭️  {os.path.basename(vf)}: {duration:.0f}초 (너무 짧음)")
-                continue
+        # v11.1: ffprobe는 영상별 독립 서브프로세스 → 병렬로 미리 조회
+        # (결과는 _probe_cache에 남아 아래 _is_shorts_ready도 캐시 히트)
+        with ThreadPoolExecutor(max_workers=min(8, len(video_files))) as ex:
+            durations = dict(zip(video_files, ex.map(self._get_video_duration, video_files)))
 
-            clips_this = min(MAX_PER_VIDEO, num_clips - clip_idx)
-            if clips_this <= 0:
-                break
+        # 추출 실패분은 남은 영상에서 다시 계획해 채움 (성공 클립 기준으로 num_clips 달성)
+        clip_paths = []
+        per_video = {}
+        remaining_videos = iter(video_files)
+        job_seq = 0  # 임시 출력 번호 — 이미 확정된 clip_XXX와 겹치지 않게 계속 증가
+        while len(clip_paths) < num_clips:
+            jobs = []  # [(video_path, start, clip_dur, clip_path, stream_copy)]
+            for vf in remaining_videos:
+                duration = durations[vf]
+                if duration < 10:
+                    print(f"      ⏭️  {os.path.basename(vf)}: {duration:.0f}초 (너무 짧음)")
+                    continue
 
-            # 균등 구간 분배: 영상을 N등분하여 각 구간에서 1개씩
-            segment_len = max(5, (duration - 2) / clips_this)
-            used_starts = []
-
-            for ci in range(clips_this):
-                # 구간 시작점: 각 세그먼트 내 랜덤
-                seg_start = 1.0 + ci * segment_len
-                seg_end = min(seg_start + segment_len - 1, duration - 5)
-                if seg_end <= seg_start:
-                    seg_end = seg_start + 1
-
-                start = random.uniform(seg_start, seg_end)
-                # 이전 클립과 최소 3초 간격
-                too_close = any(abs(start - ps) < 3 for ps in used_starts)
-                if too_close:
-                    start = min(start + 3, duration - 5)
-
-                clip_dur = random.uniform(3.0, 5.0)
-                if start + clip_dur > duration:
-                    clip_dur = max(2.0, duration - start - 0.5)
-
-                clip_path = os.path.join(clips_dir, f"clip_{clip_idx:03d}.mp4")
-                ffcmd = [
-                    FFMPEG_PATH, "-y",
-                    "-ss", f"{start:.2f}",
-                    "-i", vf,
-                    "-t", f"{clip_dur:.2f}",
-                    "-vf", "crop=ih*9/16:ih,scale=1080:1920",
-                    "-an",
-                    "-c:v", "libx264", "-preset", "fast", "-crf", "23",
-                    "-pix_fmt", "yuv420p",
-                    clip_path,
-                ]
-                try:
-                    r = subprocess.run(
-                        ffcmd, capture_output=True, text=True, timeout=60,
-                        encoding="utf-8", errors="replace",
-                    )
-                    if r.returncode == 0 and os.path.exists(clip_path) \
-                            and os.path.getsize(clip_path) > 5000:
-                        clip_paths.append(clip_path)
-                        used_starts.append(start)
-                        clip_idx += 1
-                except Exception:
-                    pass
+                clips_this = min(MAX_PER_VIDEO, num_clips - len(clip_paths) - len(jobs))
+
+                # 균등 구간 분배: 영상을 N등분하여 각 구간에서 1개씩
+                segment_len = max(5, (duration - 2) / clips_this)
+                used_starts = []
+                stream_copy = self._is_shorts_ready(vf)
+
+                for ci in range(clips_this):
+                    # 구간 시작점: 각 세그먼트 내 랜덤
+                    seg_start = 1.0 + ci * segment_len
+                    seg_end = min(seg_start + segment_len - 1, duration - 5)
+                    if seg_end <= seg_start:
+                        seg_end = seg_start + 1
+
+                    start = random.uniform(seg_start, seg_end)
+                    # 이전 클립과 최소 3초 간격
+                    too_close = any(abs(start - ps) < 3 for ps in used_starts)
+                    if too_close:
+                        start = min(start + 3, duration - 5)
+
+                    clip_dur = random.uniform(3.0, 5.0)
+                    if start + clip_dur > duration:
+                        clip_dur = max(2.0, duration - start - 0.5)
 
-            print(f"      📹 {os.path.basename(vf)}: {len(used_starts)}개 클립 추출 ({duration:.0f}초)")
+                    clip_path = os.path.join(clips_dir, f"clip_{job_seq:03d}.mp4")
+                    jobs.append((vf, start, clip_dur, clip_path, stream_copy))
+                    used_starts.append(start)
+                    job_seq += 1
+
+                if len(clip_paths) + len(jobs) >= num_clips:
+                    break
+
+            if not jobs:
+                break  # 남은 영상 없음 → 부족분은 Pexels가 채움
+
+            with ThreadPoolExecutor(max_workers=max_workers) as ex:
+                results = list(ex.map(lambda job: self._extract_clip(*job), jobs))
+
+            # 성공한 클립만 번호 연속으로 재정렬 (Pexels 클립이 이어서 번호 매김)
+            # 실패 작업의 부분 출력은 삭제 → Pexels의 기존 클립 수 집계에 섞이지 않음
+            for (vf, _, _, path, _), ok in zip(jobs, results):
+                if not ok:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                    continue
+                target = os.path.join(clips_dir, f"clip_{len(clip_paths):03d}.mp4")
+                if path != target:
+                    os.replace(path, target)
+                clip_paths.append(target)
+                per_video[vf] = per_video.get(vf, 0) + 1
+        for vf, cnt in per_video.items():
+            print(f"      📹 {os.path.basename(vf)}: {cnt}개 클립 추출")
 
         print(f"    🎬 YouTube 총 {len(clip_paths)}개 클립 추출 완료 (1080x1920)")
         return clip_paths
 
+    @staticmethod
+    def _download_stream(url: str, path: str, stop=None) -> bool:
+        """URL → 파일 스트리밍 다운로드 (스레드 워커, stop 이벤트 시 중단)"""
+        try:
+            r = _HTTP.get(url, timeout=60, stream=True)
+            if r.status_code != 200:
+                return False
+            with open(path, "wb") as f:
+                for chunk in r.iter_content(chunk_size=_DOWNLOAD_CHUNK):
+                    if stop is not None and stop.is_set():
+                        return False
+                    f.write(chunk)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _probe_video_stream(path: str) -> dict:
+        """첫 비디오 스트림 정보 (codec_name/width/height/pix_fmt), 실패 시 {}"""
+        streams = ImageGenerator._ffprobe_json(path).get("streams", [])
+        for st in streams:
+            if st.get("codec_type") == "video":
+                return st
+        return {}
+
+    @classmethod
+    def _is_shorts_ready(cls, path: str) -> bool:
+        """이미 1080x1920 H.264 yuv420p → 크롭/스케일 없이 stream-copy 가능"""
+        info = cls._probe_video_stream(path)
+        return (info.get("codec_name") == "h264"
+                and info.get("pix_fmt") == "yuv420p"
+                and (info.get("width"), info.get("height")) == (1080, 1920))
+
+    @staticmethod
+    def _extract_clip(src: str, start: float, clip_dur: float,
+                      clip_path: str, stream_copy: bool = False) -> bool:
+        """원본 영상 구간 → 1080x1920 세로 크롭 클립 1개 (스레드 워커)
+
+        stream_copy=True: 원본이 이미 세로 1080p → 재인코딩 없이 -c copy
+        (-ss를 -i 앞에 둬서 키프레임 단위 탐색)
+        """
+        if stream_copy:
+            ffcmd = [
+                FFMPEG_PATH, "-y",
+                "-ss", f"{start:.2f}",
+                "-i", src,
+                "-t", f"{clip_dur:.2f}",
+                "-map", "0:v:0", "-an", "-sn", "-dn",
+                "-c", "copy", "-avoid_negative_ts", "make_zero",
+                clip_path,
+            ]
+        else:
+            ffcmd = [
+                FFMPEG_PATH, "-y",
+                "-ss", f"{start:.2f}",
+                "-i", src,
+                "-t", f"{clip_dur:.2f}",
+                "-map", "0:v:0", "-an", "-sn", "-dn",
+                "-vf", "crop=ih*9/16:ih,scale=1080:1920",
+                "-c:v", "libx264", "-preset", "fast", "-crf", "23",
+                "-pix_fmt", "yuv420p",
+                clip_path,
+            ]
+        try:
+            r = subprocess.run(
+                ffcmd, capture_output=True, text=True, timeout=60,
+                encoding="utf-8", errors="replace",
+            )
+            return r.returncode == 0 and os.path.exists(clip_path) \
+                and os.path.getsize(clip_path) > 5000
+        except Exception:
+            return False
+
+    def _ytdlp_search_download(self, ytdlp_cmd: list, query: str,
+                               out_dir: str) -> str:
+        """yt-dlp 검색 다운로드 1건 → ok / missing / fail"""
+        os.makedirs(out_dir, exist_ok=True)
+        cmd = ytdlp_cmd + [
+            query,
+            "-f", "best[height>=720][ext=mp4]/best[height>=480][ext=mp4]/best[ext=mp4]/best",
+            "-o", os.path.join(out_dir, "%(id)s.%(ext)s"),
+            "--no-playlist",
+            "--max-filesize", "200M",
+            "--max-downloads", "4",
+            "--match-filters", "duration >= 30 & duration <= 600",
+            "--no-overwrites",
+            "--socket-timeout", "20",
+        ]
+        try:
+            print(f"    ⬇️  다운로드 중: {query[:60]}...")
+            subprocess.run(
+                cmd, capture_output=True, text=True, timeout=240,
+                encoding="utf-8", errors="replace",
+            )
+            return "ok"
+        except subprocess.TimeoutExpired:
+            print(f"    ⏰ 타임아웃: {query[:60]}")
+        except FileNotFoundError:
+            return "missing"
+        except Exception as e:
+            print(f"    ⚠️  에러: {e}")
+        return "fail"
+
     def _download_pexels_clips(self, topic: str, work_dir: str,
                                 num_clips: int = 5) -> list:
         """
@@ -1313,7 +1528,6 @@ class ImageGenerator:
         print(f"    📹 Pexels 영상 검색: \"{pexels_query}\"")
 
         try:
-            import requests as _req
             headers = {"Authorization": self.pexels_key}
             params = {
                 "query": pexels_query,
@@ -1321,8 +1535,8 @@ class ImageGenerator:
                 "orientation": "portrait",
                 "size": "medium",
             }
-            resp = _req.get("https://api.pexels.com/videos/search",
-                           headers=headers, params=params, timeout=15)
+            resp = _HTTP.get("https://api.pexels.com/videos/search",
+                             headers=headers, params=params, timeout=15)
             if resp.status_code != 200:
                 print(f"    ⚠️  Pexels API 오류: {resp.status_code}")
                 return []
@@ -1333,8 +1547,8 @@ class ImageGenerator:
                 # 동물 이름만으로 재검색
                 animal_only = pexels_query.split()[0]
                 params["query"] = animal_only
-                resp = _req.get("https://api.pexels.com/videos/search",
-                               headers=headers, params=params, timeout=15)
+                resp = _HTTP.get("https://api.pexels.com/videos/search",
+                                 headers=headers, params=params, timeout=15)
                 if resp.status_code == 200:
                     videos = resp.json().get("videos", [])
 
@@ -1350,15 +1564,14 @@ class ImageGenerator:
 
         # 영상 다운로드 + 클립 추출
         clip_paths = []
-        existing_clips = len([f for f in os.listdir(clips_dir)
-                             if f.startswith("clip_") and f.endswith(".mp4")])
+        with os.scandir(clips_dir) as it:
+            existing_clips = sum(1 for e in it
+                                 if e.name.startswith("clip_") and e.name.endswith(".mp4"))
         clip_idx = existing_clips  # 기존 YouTube 클립 이어서 번호 매기기
 
+        # 다운로드 후보 (최적 해상도 파일 URL) 먼저 선정
+        candidates = []
         for vi, video in enumerate(videos[:3]):
-            if len(clip_paths) >= num_clips:
-                break
-
-            # 최적 해상도 파일 URL 찾기
             video_files = video.get("video_files", [])
             best_file = None
             for vf in sorted(video_files, key=lambda x: x.get("height", 0), reverse=True):
@@ -1371,57 +1584,50 @@ class ImageGenerator:
                 continue
 
             dl_url = best_file.get("link", "")
-            if not dl_url:
-                continue
-
-            # 다운로드
-            dl_path = os.path.join(pexels_dir, f"pexels_{vi}.mp4")
-            try:
-                import requests as _req
-                r = _req.get(dl_url, timeout=60, stream=True)
-                with open(dl_path, "wb") as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        f.write(chunk)
-            except Exception:
-                continue
-
-            duration = self._get_video_duration(dl_path)
-            if duration < 5:
-                continue
-
-            # 클립 추출 (최대 2개/영상)
-            clips_per = min(2, num_clips - len(clip_paths))
-            seg_len = max(3, (duration - 2) / clips_per)
+            if dl_url:
+                candidates.append((dl_url, os.path.join(pexels_dir, f"pexels_{vi}.mp4")))
+
+        # v11.1: 후보 병렬 다운로드 → 먼저 끝난 영상부터 클립 추출
+        # 목표 클립 수 달성 시 대기 작업 취소 + 진행 중 다운로드 중단
+        stop = threading.Event()
+        ex = ThreadPoolExecutor(max_workers=max(1, len(candidates)))
+        futs = {ex.submit(self._download_stream, url, path, stop): path
+                for url, path in candidates}
+        try:
+            for fut in as_completed(futs):
+                dl_path = futs[fut]
+                if not fut.result():
+                    continue
 
-            for ci in range(clips_per):
-                start = 1.0 + ci * seg_len + random.uniform(0, max(0.5, seg_len - 5))
-                clip_dur = random.uniform(3.0, 5.0)
-                if start + clip_dur > duration:
-                    clip_dur = max(2.0, duration - start - 0.5)
+                duration = self._get_video_duration(dl_path)
+                if duration < 5:
+                    continue
 
-                clip_path = os.path.join(clips_dir, f"clip_{clip_idx:03d}.mp4")
-                ffcmd = [
-                    FFMPEG_PATH, "-y",
-                    "-ss", f"{start:.2f}",
-                    "-i", dl_path,
-                    "-t", f"{clip_dur:.2f}",
-                    "-vf", "crop=ih*9/16:ih,scale=1080:1920",
-                    "-an",
-                    "-c:v", "libx264", "-preset", "fast", "-crf", "23",
-                    "-pix_fmt", "yuv420p",
-                    clip_path,
-                ]
-                try:
-                    r = subprocess.run(
-                        ffcmd, capture_output=True, text=True, timeout=60,
-                        encoding="utf-8", errors="replace",
-                    )
-                    if r.returncode == 0 and os.path.exists(clip_path) \
-                            and os.path.getsize(clip_path) > 5000:
+                # 클립 추출 (최대 2개/영상)
+                clips_per = min(2, num_clips - len(clip_paths))
+                seg_len = max(3, (duration - 2) / clips_per)
+                # v11.1: 세로 1080p 원본(Pexels portrait에 흔함) → stream-copy
+                stream_copy = self._is_shorts_ready(dl_path)
+
+                for ci in range(clips_per):
+                    start = 1.0 + ci * seg_len + random.uniform(0, max(0.5, seg_len - 5))
+                    clip_dur = random.uniform(3.0, 5.0)
+                    if start + clip_dur > duration:
+                        clip_dur = max(2.0, duration - start - 0.5)
+
+                    clip_path = os.path.join(clips_dir, f"clip_{clip_idx:03d}.mp4")
+                    if self._extract_clip(dl_path, start, clip_dur, clip_path,
+                                          stream_copy=stream_copy):
                         clip_paths.append(clip_path)
                         clip_idx += 1
-                except Exception:
-                    pass
+
+                # 목표 달성 즉시 중단 → finally에서 남은 다운로드 취소/중단
+                if len(clip_paths) >= num_clips:
+                    stop.set()
+                    break
+        finally:
+            stop.set()
+            ex.shutdown(wait=False, cancel_futures=True)
 
         print(f"    📹 Pexels 총 {len(clip_paths)}개 클립 추출 완료")
         return clip_paths
@@ -1429,31 +1635,31 @@ class ImageGenerator:
     @staticmethod
     def _find_ytdlp_cmd() -> list:
         """yt-dlp 실행 경로 자동 탐색"""
-        import shutil as _sh
-        if _sh.which("yt-dlp"):
-            return ["yt-dlp"]
-        scripts_dir = os.path.join(os.path.dirname(sys.executable), "Scripts")
-        ytdlp_exe = os.path.join(scripts_dir, "yt-dlp.exe")
-        if os.path.exists(ytdlp_exe):
-            return [ytdlp_exe]
-        return [sys.executable, "-m", "yt_dlp"]
+        return list(_find_ytdlp())
 
     @staticmethod
     def _get_video_duration(video_path: str) -> float:
-        """FFmpeg stderr에서 Duration 파싱으로 영상 길이(초) 반환"""
+        """영상 길이(초) 반환 — v11.1: ffprobe JSON (format.duration) 우선
+
+        기존 `ffmpeg -i ... -f null -`는 파일 전체를 디코딩해서 느렸음.
+        ffprobe가 없으면 `ffmpeg -i` 배너의 Duration만 파싱 (디코딩 없음).
+        """
+        meta = ImageGenerator._ffprobe_json(video_path)
+        try:
+            duration = float(meta.get("format", {}).get("duration", 0.0))
+            if duration > 0:
+                return duration
+        except (TypeError, ValueError):
+            pass
+
         try:
-            cmd = [
-                FFMPEG_PATH if FFMPEG_PATH else "ffmpeg",
-                "-i", video_path,
-                "-f", "null", "-",
-            ]
             r = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=30,
+                [FFMPEG_PATH if FFMPEG_PATH else "ffmpeg", "-hide_banner", "-i", video_path],
+                capture_output=True, text=True, timeout=30,
                 encoding="utf-8", errors="replace",
             )
             # stderr에서 "Duration: HH:MM:SS.xx" 파싱
-            import re as _re
-            m = _re.search(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)", r.stderr)
+            m = _DURATION_RE.search(r.stderr or "")
             if m:
                 h, mi, s = float(m.group(1)), float(m.group(2)), float(m.group(3))
                 return h * 3600 + mi * 60 + s
@@ -1461,6 +1667,31 @@ class ImageGenerator:
         except Exception:
             return 0.0
 
+    # v11.1: ffprobe 결과 캐시 {(path, size, mtime): meta} — 길이/해상도 조회 1회로 통합
+    _probe_cache: dict = {}
+
+    @staticmethod
+    def _ffprobe_json(path: str) -> dict:
+        """ffprobe -show_format -show_streams JSON (실패 시 {})"""
+        if not FFPROBE_PATH or not os.path.exists(path):
+            return {}
+        st = os.stat(path)
+        key = (path, st.st_size, st.st_mtime)
+        cached = ImageGenerator._probe_cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            r = subprocess.run([
+                FFPROBE_PATH, "-v", "quiet", "-print_format", "json",
+                "-show_format", "-show_streams", path,
+            ], capture_output=True, text=True, timeout=15,
+               encoding="utf-8", errors="replace")
+            meta = json.loads(r.stdout or "{}")
+        except Exception:
+            return {}
+        ImageGenerator._probe_cache[key] = meta
+        return meta
+
     # ── 문장 그루핑 ──
     def _group_sentences(self, script_lines: list) -> list[dict]:
         """2~3문장씩 그루핑 → 장면 단위로 이미지 1장"""
@@ -1523,14 +1754,19 @@ class ImageGenerator:
             self._character_desc = en_prompt[:120]
         return full
 
+    # v11.1: {한국어 프롬프트: Gemini 번역} — 재시도/재생성 시 같은 프롬프트 재번역 방지
+    _kr_en_cache: dict = {}
+
     def _auto_en_prompt_from_kr(self, kr_prompt: str, mood: str) -> str:
         """한국어 image_prompt를 영어로 변환 (Gemini 번역 → 키워드 폴백)
         ★ v10.0: Gemini가 직접 영어로 출력하는 경우 → 바로 반환
         """
-        import re
         # ★ 한글이 없으면 이미 영어 → 그대로 반환 (숫자/특수문자 포함 OK)
         if not re.search(r'[가-힣]', kr_prompt):
             return kr_prompt
+        cached = self._kr_en_cache.get(kr_prompt)
+        if cached:
+            return cached
         # ★ Gemini Flash로 직접 번역 (더 정확한 장면 묘사)
         try:
             import google.generativeai as _genai
@@ -1546,51 +1782,56 @@ class ImageGenerator:
             )
             if resp.text and len(resp.text.strip()) > 10:
                 en = resp.text.strip().replace('"', '').replace("'", "")
+                self._kr_en_cache[kr_prompt] = en
                 return en
         except Exception:
             pass
         # 폴백: 키워드 매핑
         return self._auto_en_prompt([kr_prompt], mood)
 
+    # v11.1: 호출마다 dict를 새로 만들지 않도록 클래스 로드 시 1회 (순서 = 우선순위)
+    _KR_EN_KEYWORDS = (
+        ("시어머니", "angry Korean mother-in-law with exaggerated furious expression"),
+        ("남편", "young Korean husband with comically shocked face"),
+        ("아내", "young Korean wife with dramatic expression"),
+        ("결혼", "wedding scene with over-the-top emotions"),
+        ("이혼", "divorce papers flying dramatically"),
+        ("신혼집", "cozy newlywed apartment interior"),
+        ("비번", "digital door lock keypad glowing ominously"),
+        ("현관문", "apartment front door opening dramatically"),
+        ("냉장고", "refrigerator wide open with food spilling out"),
+        ("경찰", "police officer with stern comedic expression at door"),
+        ("사기", "scam victim with jaw dropping to the floor"),
+        ("택배", "person opening delivery package with extreme surprise"),
+        ("에어팟", "wireless earbuds case close-up"),
+        ("콩나물", "pile of fresh bean sprouts"),
+        ("중고거래", "person staring at phone screen in disbelief"),
+        ("전화", "person holding phone with veins popping from anger"),
+        ("CCTV", "security camera footage on monitor screen"),
+        ("도어락", "smart digital door lock close-up"),
+        ("지문", "fingerprint scanner with blue glow"),
+        ("직장", "office scene with comedic drama"),
+        ("상사", "angry boss character with exaggerated expression"),
+        ("신입", "nervous new employee sweating comically"),
+        ("회식", "Korean company dinner party scene"),
+        ("퇴사", "person throwing resignation letter dramatically"),
+        ("월급", "paycheck with shocking amount"),
+        ("학교", "Korean school classroom scene"),
+        ("선생님", "teacher with dramatic expression"),
+        ("편의점", "convenience store interior late at night"),
+        ("대리", "stressed office worker with comedic exhaustion"),
+        ("카페", "trendy Korean cafe interior"),
+    )
+
     def _auto_en_prompt(self, texts: list[str], mood: str) -> str:
         """한글 텍스트 → 영어 장면 묘사 자동 생성 (B급 웹툰 과장 스타일)"""
         combined = " ".join(texts)
-        kr_en = {
-            "시어머니": "angry Korean mother-in-law with exaggerated furious expression",
-            "남편": "young Korean husband with comically shocked face",
-            "아내": "young Korean wife with dramatic expression",
-            "결혼": "wedding scene with over-the-top emotions",
-            "이혼": "divorce papers flying dramatically",
-            "신혼집": "cozy newlywed apartment interior",
-            "비번": "digital door lock keypad glowing ominously",
-            "현관문": "apartment front door opening dramatically",
-            "냉장고": "refrigerator wide open with food spilling out",
-            "경찰": "police officer with stern comedic expression at door",
-            "사기": "scam victim with jaw dropping to the floor",
-            "택배": "person opening delivery package with extreme surprise",
-            "에어팟": "wireless earbuds case close-up",
-            "콩나물": "pile of fresh bean sprouts",
-            "중고거래": "person staring at phone screen in disbelief",
-            "전화": "person holding phone with veins popping from anger",
-            "CCTV": "security camera footage on monitor screen",
-            "도어락": "smart digital door lock close-up",
-            "지문": "fingerprint scanner with blue glow",
-            "직장": "office scene with comedic drama",
-            "상사": "angry boss character with exaggerated expression",
-            "신입": "nervous new employee sweating comically",
-            "회식": "Korean company dinner party scene",
-            "퇴사": "person throwing resignation letter dramatically",
-            "월급": "paycheck with shocking amount",
-            "학교": "Korean school classroom scene",
-            "선생님": "teacher with dramatic expression",
-            "편의점": "convenience store interior late at night",
-            "대리": "stressed office worker with comedic exhaustion",
-            "카페": "trendy Korean cafe interior",
-        }
         parts = []
-        for kr, en in kr_en.items():
+        for kr, en in self._KR_EN_KEYWORDS:
             if kr in combined:
                 parts.append(en)
+                if len(parts) == 4:  # 최대 4개만 사용
+                    break
         if not parts:
             parts = ["dramatic Korean webtoon scene with exaggerated comedic expression"]
         return ", ".join(parts[:4])
@@ -1658,9 +1899,7 @@ class ImageGenerator:
                         img_url = outputs[0]
                         img_resp = requests.get(img_url, timeout=60)
                         if img_resp.status_code == 200 and len(img_resp.content) > 5000:
-                            from PIL import Image
-                            from io import BytesIO
-                            img = Image.open(BytesIO(img_resp.content)).convert("RGB")
+                            img = Image.open(io.BytesIO(img_resp.content)).convert("RGB")
                             img = img.resize((1080, 1920), Image.LANCZOS)
                             img.save(save_path, "WEBP", quality=92)
                             return True
@@ -1705,7 +1944,6 @@ class ImageGenerator:
         if en_parts:
             return " ".join(en_parts[:3])
 
-        import random
         mood_keys = self.MOOD_PEXELS.get(mood, ["cinematic texture", "abstract dark"])
         return random.choice(mood_keys)
 
@@ -1736,7 +1974,6 @@ class ImageGenerator:
             if not available:
                 available = photos
 
-            import random
             chosen = random.choice(available[:5])
             self._used_photo_ids.add(chosen["id"])
 
@@ -1746,9 +1983,7 @@ class ImageGenerator:
 
             img_resp = requests.get(img_url, timeout=30)
             if img_resp.status_code == 200 and len(img_resp.content) > 5000:
-                from PIL import Image
-                from io import BytesIO
-                img = Image.open(BytesIO(img_resp.content)).convert("RGB")
+                img = Image.open(io.BytesIO(img_resp.content)).convert("RGB")
                 img = img.resize((1080, 1920), Image.LANCZOS)
                 img.save(save_path, quality=92)
                 return True
@@ -1788,17 +2023,7 @@ class VideoAutoEditor:
     @staticmethod
     def _find_ytdlp() -> list:
         """yt-dlp 실행 경로를 자동 탐색"""
-        import shutil
-        # 1차: PATH에서 찾기
-        if shutil.which("yt-dlp"):
-            return ["yt-dlp"]
-        # 2차: Python Scripts 폴더
-        scripts_dir = os.path.join(os.path.dirname(sys.executable), "Scripts")
-        ytdlp_exe = os.path.join(scripts_dir, "yt-dlp.exe")
-        if os.path.exists(ytdlp_exe):
-            return [ytdlp_exe]
-        # 3차: python -m yt_dlp
-        return [sys.executable, "-m", "yt_dlp"]
+        return list(_find_ytdlp())
 
     # 검증된 대박 영상만 소싱 (10만뷰 미만 차단)
     MIN_VIEW_COUNT = 100_000
@@ -1832,16 +2057,13 @@ class VideoAutoEditor:
                 return None
 
             # 가장 최근 mp4 파일 찾기
-            files = [
-                os.path.join(self.download_dir, f)
-                for f in os.listdir(self.download_dir)
-                if f.endswith(".mp4")
-            ]
-            if not files:
+            with os.scandir(self.download_dir) as it:
+                entries = [e for e in it if e.is_file() and e.name.endswith(".mp4")]
+            if not entries:
                 print("  ❌ 다운로드된 MP4 없음")
                 return None
 
-            latest = max(files, key=os.path.getctime)
+            latest = max(entries, key=lambda e: e.stat().st_ctime).path
             size_mb = os.path.getsize(latest) / (1024 * 1024)
             print(f"  ✅ 다운로드 완료: {os.path.basename(latest)} ({size_mb:.1f}MB)")
             return latest
@@ -2177,6 +2399,25 @@ class ViralSourceScraper:
     )
     _MIN_COMMENTS = 30  # 댓글 이 이상인 글만 후보
 
+    # v11.1: 제목 클리닝 패턴을 하나의 alternation으로 합침 → 제목당 1회 스캔
+    # 네이트판: 댓글수/조회수/추천수 메트릭 제거
+    _NATE_METRIC_RE = re.compile(r'\(\d{1,5}\)|조회[\d,]+|\|?추천\d+')
+    # 네이트판 링크 텍스트 파싱: "1동남아련들 다 탈퇴시켜라 걍(124)조회70,846|추천373"
+    _NATE_TALK_RE = re.compile(r'/talk/(\d{6,})')
+    _NATE_RANK_RE = re.compile(r'^\d{1,2}')
+    _NATE_CMT_RE = re.compile(r'\((\d{1,5})\)')
+    _NATE_VIEWS_RE = re.compile(r'조회([\d,]+)')
+    _NATE_REC_RE = re.compile(r'추천(\d+)')
+    # 디시: 닉네임/시간/조회수/추천수 중 가장 앞에 나온 지점에서 제목 자르기
+    _DC_TITLE_CUT_RE = re.compile(
+        r'ㅇㅇ(?:\([\d.]+\))?\s*\d{1,2}:\d{2}'   # ㅇㅇ(123.456)14:20
+        # 닉네임14:20 — 글자 런의 시작에서만 시도 (런 중간 재시도 O(L²) 백트래킹 방지)
+        r'|(?<![a-zA-Z가-힣])[a-zA-Z가-힣]+\d{1,2}:\d{2}'
+        r'|\d{1,2}:\d{2}'                            # 단독 시간
+        r'|조회\s*[\d,]+'
+        r'|추천\s*\d+'
+    )
+
     # ── [1순위] 네이트판: 인간관계 썰의 성지 ──
 
     @classmethod
@@ -2200,7 +2441,7 @@ class ViralSourceScraper:
                         href = a_tag.get("href", "")
                         if "/talk/" not in href:
                             continue
-                        talk_match = re.search(r'/talk/(\d{6,})', href)
+                        talk_match = cls._NATE_TALK_RE.search(href)
                         if not talk_match:
                             continue
 
@@ -2209,28 +2450,25 @@ class ViralSourceScraper:
                             continue
 
                         # 파싱: "1동남아련들 다 탈퇴시켜라 걍(124)조회70,846|추천373"
-                        title_raw = re.sub(r'^\d{1,2}', '', raw)  # 앞 순번 제거
+                        title_raw = cls._NATE_RANK_RE.sub('', raw)  # 앞 순번 제거
 
                         comments = 0
-                        cm = re.search(r'\((\d{1,5})\)', title_raw)
+                        cm = cls._NATE_CMT_RE.search(title_raw)
                         if cm:
                             comments = int(cm.group(1))
 
                         views = 0
-                        vm = re.search(r'조회([\d,]+)', title_raw)
+                        vm = cls._NATE_VIEWS_RE.search(title_raw)
                         if vm:
                             views = int(vm.group(1).replace(",", ""))
 
                         recommends = 0
-                        rm = re.search(r'추천(\d+)', title_raw)
+                        rm = cls._NATE_REC_RE.search(title_raw)
                         if rm:
                             recommends = int(rm.group(1))
 
                         # 제목 클리닝: 메트릭 부분 제거
-                        title = title_raw
-                        for pat in [r'\(\d{1,5}\)', r'조회[\d,]+', r'\|?추천\d+']:
-                            title = re.sub(pat, '', title)
-                        title = title.strip()
+                        title = cls._NATE_METRIC_RE.sub('', title_raw).strip()
 
                         if not title or len(title) < 3:
                             continue
@@ -2473,16 +2711,9 @@ class ViralSourceScraper:
                     recommends = int(rm.group(1))
 
                 # ★ A-1 fix: 제목 정리 강화 — 닉네임/시간/조회수/추천수/숫자잔재 전부 제거
-                for pattern in [
-                    r'ㅇㅇ(?:\([\d.]+\))?\s*\d{1,2}:\d{2}',  # ㅇㅇ(123.456)14:20
-                    r'[a-zA-Z가-힣]+\d{1,2}:\d{2}',           # 닉네임14:20
-                    r'\d{1,2}:\d{2}',                          # 단독 시간
-                    r'조회\s*[\d,]+',
-                    r'추천\s*\d+',
-                ]:
-                    cut = re.search(pattern, title)
-                    if cut:
-                        title = title[:cut.start()]
+                cut = cls._DC_TITLE_CUT_RE.search(title)
+                if cut:
+                    title = title[:cut.start()]
                 # 끝에 붙은 닉네임 잔재 제거 (ㅇㅇ, 숫자만 남은 경우)
                 title = re.sub(r'ㅇㅇ$', '', title).strip()
                 title = re.sub(r'\d{1,3}$', '', title).strip()
@@ -2528,11 +2759,21 @@ class ViralSourceScraper:
 
     # ── A-2: 숏츠 부적합 감점 (일상 잡담 = 조회수 저조) ──
     _BORING_PENALTIES = [
-        (r"설거지|시댁|파혼", -30, "가정사"),
-        (r"다이어트|식단|헬스|운동루틴", -20, "다이어트"),
-        (r"카페|맛집|디저트|빵집|브런치", -15, "카페"),
-        (r"열애|결별|소속사|컴백|팬싸", -10, "연예가십"),
+        (re.compile(r"설거지|시댁|파혼"), -30, "가정사"),
+        (re.compile(r"다이어트|식단|헬스|운동루틴"), -20, "다이어트"),
+        (re.compile(r"카페|맛집|디저트|빵집|브런치"), -15, "카페"),
+        (re.compile(r"열애|결별|소속사|컴백|팬싸"), -10, "연예가십"),
     ]
+    # v11.1: 항목마다 다시 만들지 않도록 클래스 로드 시 1회
+    _VIRAL_BOOST_KW = (
+        "레전드", "실화", "대박", "미쳤", "소름", "논란", "반전",
+        "후기", "먹방", "게임", "리뷰", "밈", "챌린지",
+        "터짐", "난리", "비교", "랭킹", "꿀팁",
+        "해봄", "써봄", "사봄", "가봄",
+        "썸", "소개팅", "결혼", "축의금", "연애", "고백",
+    )
+    _CLICKBAIT_RES = [re.compile(p) for p in
+                      (r"단톡방", r"텔레그램", r"무료\s*나눔", r"선착순", r"후방주의", r"19금")]
 
     @classmethod
     def _compute_viral_score(cls, item: dict) -> float:
@@ -2553,26 +2794,18 @@ class ViralSourceScraper:
                 break
 
         # 3) 바이럴 키워드 부스트 (×5점으로 상향)
-        BOOST_KW = [
-            "레전드", "실화", "대박", "미쳤", "소름", "논란", "반전",
-            "후기", "먹방", "게임", "리뷰", "밈", "챌린지",
-            "터짐", "난리", "비교", "랭킹", "꿀팁",
-            "해봄", "써봄", "사봄", "가봄",
-            "썸", "소개팅", "결혼", "축의금", "연애", "고백",
-        ]
-        kw_count = sum(1 for kw in BOOST_KW if kw in title)
+        kw_count = sum(1 for kw in cls._VIRAL_BOOST_KW if kw in title)
         score += kw_count * 5
 
         # 4) 숏츠 부적합 감점
         for pat, penalty, label in cls._BORING_PENALTIES:
-            if re.search(pat, title):
+            if pat.search(title):
                 score += penalty
                 break
 
         # 5) 낚시/스팸 감점
-        CLICKBAIT = [r"단톡방", r"텔레그램", r"무료\s*나눔", r"선착순", r"후방주의", r"19금"]
-        for pat in CLICKBAIT:
-            if re.search(pat, title):
+        for pat in cls._CLICKBAIT_RES:
+            if pat.search(title):
                 score -= 50
 
         # 6) 제목 길이 보정
@@ -2584,10 +2817,11 @@ class ViralSourceScraper:
         return score
 
     @classmethod
-    def _gemini_evaluate_topics(cls, items: list[dict]) -> list[dict]:
+    def _gemini_evaluate_topics(cls, items: list[dict],
+                                min_score_for_ai: float = 0) -> list[dict]:
         """A-3: Gemini로 상위 후보들의 숏츠 바이럴 가능성 0~100점 평가
         1회 API 호출로 최대 15개 동시 평가 → 비용 $0
-        70점 이상만 통과"""
+        70점 이상만 통과 (규칙 점수가 min_score_for_ai 미만이면 평가 없이 탈락)"""
         if not items:
             return items
 
@@ -2598,12 +2832,26 @@ class ViralSourceScraper:
 
         # 상위 15개만 평가 (토큰 절약)
         candidates = items[:15]
-        titles_text = "\n".join(
-            f"{i+1}. [{c['source']}] {c['title']}"
-            for i, c in enumerate(candidates)
-        )
 
-        prompt = f"""너는 유튜브 숏츠 바이럴 전문가다.
+        # v11.1: 규칙 점수가 이미 미달(스팸/숏츠 부적합 감점)이면 Gemini에 보내지 않고 탈락
+        local_fail = [c for c in candidates if c.get("score", 0) < min_score_for_ai]
+        if local_fail:
+            print(f"  🧠 규칙 점수 미달 {len(local_fail)}개 → Gemini 평가 없이 탈락")
+            candidates = [c for c in candidates if c.get("score", 0) >= min_score_for_ai]
+
+        # v11.1: 이전 실행에서 평가한 제목(같은 비교 키)은 재평가하지 않음
+        score_cache = cls._load_score_cache()
+        to_eval = [c for c in candidates if cls._topic_key(c["title"]) not in score_cache]
+        if len(to_eval) < len(candidates):
+            print(f"  🧠 Gemini 평가 캐시 적중: {len(candidates) - len(to_eval)}개")
+
+        if to_eval:
+            titles_text = "\n".join(
+                f"{i+1}. [{c['source']}] {c['title']}"
+                for i, c in enumerate(to_eval)
+            )
+
+            prompt = f"""너는 유튜브 숏츠 바이럴 전문가다.
 아래 커뮤니티 핫글 제목들을 보고, 각각 "유튜브 숏츠로 만들면 조회수가 터질 가능성"을 0~100점으로 평가해.
 
 평가 기준 (4가지 테마 모두 고려):
@@ -2624,97 +2872,160 @@ class ViralSourceScraper:
 반드시 아래 JSON 형식으로만 답해:
 {{"scores": [85, 72, 45, ...]}}
 
-scores 배열의 길이는 반드시 {len(candidates)}개여야 한다. JSON만 출력."""
+scores 배열의 길이는 반드시 {len(to_eval)}개여야 한다. JSON만 출력."""
 
-        try:
-            model = genai_flash.GenerativeModel("gemini-2.0-flash")
-            response = model.generate_content(
-                prompt,
-                generation_config=genai_flash.GenerationConfig(
-                    temperature=0.2,
-                    max_output_tokens=500,
-                    response_mime_type="application/json",
-                ),
-            )
-            if response.text:
-                data = json.loads(response.text)
-                scores = data.get("scores", [])
-                if isinstance(scores, list) and len(scores) == len(candidates):
-                    passed = []
-                    rejected = []
-                    for item, gemini_score in zip(candidates, scores):
-                        s = int(gemini_score) if isinstance(gemini_score, (int, float)) else 50
-                        item["_gemini_score"] = s
-                        if s >= 70:
-                            item["score"] += s  # 기존 점수에 Gemini 점수 합산
-                            passed.append(item)
-                        else:
-                            rejected.append(item)
+            try:
+                model = genai_flash.GenerativeModel("gemini-2.0-flash")
+                response = model.generate_content(
+                    prompt,
+                    generation_config=genai_flash.GenerationConfig(
+                        temperature=0.2,
+                        max_output_tokens=500,
+                        response_mime_type="application/json",
+                    ),
+                )
+                scores = json.loads(response.text).get("scores", []) if response.text else []
+                if not isinstance(scores, list) or len(scores) != len(to_eval):
+                    print(f"  ⚠️  Gemini 응답 길이 불일치 ({len(scores)} vs {len(to_eval)}) → 스킵")
+                    return items
+            except Exception as e:
+                print(f"  ⚠️  Gemini 주제 평가 실패: {e} → 기존 점수 사용")
+                return items
+
+            now = time.time()
+            for item, gemini_score in zip(to_eval, scores):
+                s = int(gemini_score) if isinstance(gemini_score, (int, float)) else 50
+                score_cache[cls._topic_key(item["title"])] = [s, now]
+            cls._save_score_cache(score_cache)
+
+        passed = []
+        rejected = []
+        for item in candidates:
+            s = score_cache[cls._topic_key(item["title"])][0]
+            item["_gemini_score"] = s
+            if s >= 70:
+                item["score"] += s  # 기존 점수에 Gemini 점수 합산
+                passed.append(item)
+            else:
+                rejected.append(item)
 
-                    print(f"  🧠 Gemini 평가: {len(passed)}개 통과 / {len(rejected)}개 탈락")
-                    for p in passed[:5]:
-                        print(f"    ✅ [{p['_gemini_score']}점] {p['title'][:40]}")
-                    for r in rejected[:3]:
-                        print(f"    ❌ [{r['_gemini_score']}점] {r['title'][:40]}")
+        print(f"  🧠 Gemini 평가: {len(passed)}개 통과 / {len(rejected)}개 탈락")
+        for p in passed[:5]:
+            print(f"    ✅ [{p['_gemini_score']}점] {p['title'][:40]}")
+        for r in rejected[:3]:
+            print(f"    ❌ [{r['_gemini_score']}점] {r['title'][:40]}")
 
-                    # 통과한 것 + 평가 안 된 나머지 (15위 이후)
-                    rest = items[15:]
-                    return passed + rest
-                else:
-                    print(f"  ⚠️  Gemini 응답 길이 불일치 ({len(scores)} vs {len(candidates)}) → 스킵")
+        # 통과한 것 + 평가 안 된 나머지 (15위 이후)
+        rest = items[15:]
+        return passed + rest
+
+    _SCORE_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                     "data", "cache", "topic_scores.json")
+    _SCORE_CACHE_TTL = 7 * 24 * 3600  # 7일 (재평가 주기)
+
+    @classmethod
+    def _load_score_cache(cls) -> dict:
+        """Gemini 주제 평가 캐시 {비교 키: [점수, 평가 시각]} — 만료 항목 제외"""
+        try:
+            with open(cls._SCORE_CACHE_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            return {}
+        cutoff = time.time() - cls._SCORE_CACHE_TTL
+        return {k: v for k, v in data.items()
+                if isinstance(v, list) and len(v) == 2 and v[1] >= cutoff}
+
+    @classmethod
+    def _save_score_cache(cls, cache: dict):
+        try:
+            os.makedirs(os.path.dirname(cls._SCORE_CACHE_PATH), exist_ok=True)
+            with open(cls._SCORE_CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump(cache, f, ensure_ascii=False)
         except Exception as e:
-            print(f"  ⚠️  Gemini 주제 평가 실패: {e} → 기존 점수 사용")
+            print(f"  ⚠️  평가 캐시 저장 실패: {e}")
 
-        return items
+    _TOPIC_HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                       "data", "topic_history.json")
 
     @classmethod
-    def _deduplicate_with_history(cls, items: list[dict]) -> list[dict]:
-        """A-4: 주제 중복 방지 — 최근 200개 제목과 유사도 비교"""
-        history_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                                     "data", "topic_history.json")
-        past_titles = []
+    def _load_topic_history(cls) -> list[str]:
+        """topic_history.json 로드 (collect_all 1회 실행당 1번만 읽음)"""
         try:
-            if os.path.exists(history_path):
-                with open(history_path, "r", encoding="utf-8") as f:
-                    past_titles = json.load(f)
+            if os.path.exists(cls._TOPIC_HISTORY_PATH):
+                with open(cls._TOPIC_HISTORY_PATH, "r", encoding="utf-8") as f:
+                    return json.load(f)
         except Exception:
             pass
+        return []
+
+    @staticmethod
+    def _topic_key(title: str) -> str:
+        """히스토리 비교 키: 공백 제거 후 앞 20자"""
+        return _WS_RE.sub("", title)[:20]
+
+    @classmethod
+    def _unique_topics(cls, titles: list) -> list[str]:
+        """비교 키가 같은 항목은 최신 것만 남김 → 200칸을 서로 다른 주제로 채움"""
+        seen = set()
+        unique = []
+        for t in titles:
+            if not isinstance(t, str):
+                continue
+            key = cls._topic_key(t)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            unique.append(t)
+        return unique
 
-        if not past_titles:
+    @classmethod
+    def _deduplicate_with_history(cls, items: list[dict],
+                                  past_titles: Optional[list[str]] = None) -> list[dict]:
+        """A-4: 주제 중복 방지 — 최근 200개 제목과 유사도 비교"""
+        if past_titles is None:
+            past_titles = cls._load_topic_history()
+
+        if not items:
             return items
 
-        # 간단 유사도: 제목 앞 20자 비교
-        past_keys = set(t[:20] for t in past_titles)
+        # 간단 유사도: 제목 앞 20자 비교 (공백 무시 — 한국어 제목은 띄어쓰기 변형이 잦음)
+        past_keys = {cls._topic_key(t) for t in past_titles if isinstance(t, str)}
+        past_keys.discard("")
         filtered = []
         skipped = 0
+        dup_in_batch = 0
+        seen_keys = set()
         for item in items:
-            key = item["title"][:20]
+            key = cls._topic_key(item["title"])
             if key in past_keys:
                 skipped += 1
                 continue
+            # 같은 글이 여러 커뮤니티에 동시 게시된 경우 → Gemini 평가 전에 1개만 남김
+            # (items는 점수순 정렬 상태라 먼저 나온 쪽이 고득점)
+            if key and key in seen_keys:
+                dup_in_batch += 1
+                continue
+            seen_keys.add(key)
             filtered.append(item)
 
         if skipped:
             print(f"  🔄 중복 제거: {skipped}개 스킵 (최근 히스토리와 겹침)")
+        if dup_in_batch:
+            print(f"  🔄 교차 게시 중복: {dup_in_batch}개 스킵")
         return filtered
 
     @classmethod
-    def _save_topic_history(cls, items: list[dict]) -> None:
+    def _save_topic_history(cls, items: list[dict],
+                            past_titles: Optional[list[str]] = None) -> None:
         """A-4: 선택된 주제를 히스토리에 저장 (최대 200개 유지)"""
-        history_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                                     "data", "topic_history.json")
-        past_titles = []
-        try:
-            if os.path.exists(history_path):
-                with open(history_path, "r", encoding="utf-8") as f:
-                    past_titles = json.load(f)
-        except Exception:
-            pass
+        if past_titles is None:
+            past_titles = cls._load_topic_history()
 
         new_titles = [item["title"] for item in items if item.get("title")]
-        past_titles = new_titles + past_titles
+        past_titles = cls._unique_topics(new_titles + past_titles)
         past_titles = past_titles[:200]  # 최근 200개만 유지
 
+        history_path = cls._TOPIC_HISTORY_PATH
         os.makedirs(os.path.dirname(history_path), exist_ok=True)
         with open(history_path, "w", encoding="utf-8") as f:
             json.dump(past_titles, f, ensure_ascii=False, indent=2)
@@ -2727,11 +3038,17 @@ scores 배열의 길이는 반드시 {len(candidates)}개여야 한다. JSON만
         print(f"{'='*60}")
 
         all_items = []
-        # 순서대로 크롤링 (각 소스 실패해도 다음으로)
-        all_items.extend(cls.fetch_natepann())
-        all_items.extend(cls.fetch_instiz())
-        all_items.extend(cls.fetch_fmkorea())
-        all_items.extend(cls.fetch_dcinside())
+        # v11.1: 4개 소스는 서로 독립(네트워크 대기) → 병렬 크롤링
+        # 결과는 기존 순서대로 합침 (각 소스 실패해도 나머지 유지)
+        fetchers = [cls.fetch_natepann, cls.fetch_instiz,
+                    cls.fetch_fmkorea, cls.fetch_dcinside]
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as ex:
+            futures = [ex.submit(fn) for fn in fetchers]
+            for fn, fut in zip(fetchers, futures):
+                try:
+                    all_items.extend(fut.result())
+                except Exception as e:
+                    print(f"  ⚠️  {fn.__name__} 실패: {e}")
 
         if not all_items:
             print("  ⚠️  모든 커뮤니티 크롤링 실패 — Google Trends 폴백")
@@ -2743,7 +3060,9 @@ scores 배열의 길이는 반드시 {len(candidates)}개여야 한다. JSON만
         all_items.sort(key=lambda x: x.get("score", 0), reverse=True)
 
         # ★ A-4: 주제 중복 방지 (히스토리 기반)
-        all_items = cls._deduplicate_with_history(all_items)
+        # v11.1: 히스토리는 여기서 1번만 로드 → 중복 제거/저장에 재사용
+        past_titles = cls._load_topic_history()
+        all_items = cls._deduplicate_with_history(all_items, past_titles)
 
         # ★ A-3: Gemini 사전 평가 게이트 (상위 15개 → 70점+ 만 통과)
         all_items = cls._gemini_evaluate_topics(all_items)
@@ -2764,7 +3083,7 @@ scores 배열의 길이는 반드시 {len(candidates)}개여야 한다. JSON만
             print(f"  #{i+1} [{src}] {item['title'][:40]} ({metric}, 점수:{item.get('score',0):.0f}, AI:{gs})")
 
         # ★ A-4: 선택된 주제를 히스토리에 저장
-        cls._save_topic_history(all_items[:10])
+        cls._save_topic_history(all_items[:10], past_titles)
 
         return all_items
 
@@ -2894,6 +3213,18 @@ class CommunityScraper:
         # 금융 — 투자 권유 위험
         "대출", "사기", "피해사례",
     ]
+    # v11.1: 키워드 N개를 N번 훑는 대신 1회 스캔하는 사전 필터 (대부분 미검출 → 여기서 끝)
+    _UI_KEYWORDS_RE = re.compile("|".join(map(re.escape, UI_KEYWORDS)))
+    _RISKY_CONTENT_RE = re.compile("|".join(map(re.escape, RISKY_CONTENT_KEYWORDS)))
+    # v11.1: 차단 키워드 60여 개 → 본문(최대 3000자)을 키워드마다 훑지 않고 1회 스캔
+    _BLOCK_KEYWORDS_RE = re.compile("|".join(map(re.escape, BLOCK_KEYWORDS)))
+
+    @classmethod
+    def _count_ui_keywords(cls, text: str) -> int:
+        """text에 포함된 UI_KEYWORDS 종류 수 (하나도 없으면 1회 스캔으로 0)"""
+        if not cls._UI_KEYWORDS_RE.search(text):
+            return 0
+        return sum(1 for kw in cls.UI_KEYWORDS if kw in text)
 
     # Apify removeElements 강화 셀렉터
     DC_REMOVE_CSS = (
@@ -2907,11 +3238,67 @@ class CommunityScraper:
         "#dccon_progress_bar, .repimg_thumb"
     )
 
+    # 개별 글 Apify 폴백 입력 (URL 제외 고정값 — 글마다 재구성하지 않음)
+    _APIFY_ARTICLE_INPUT = {
+        "crawlerType": "playwright:firefox",
+        "maxCrawlPages": 1,
+        "maxCrawlDepth": 0,
+        "outputFormats": ["markdown"],
+        "removeCookieWarnings": True,
+        "saveScreenshots": True,
+        "screenshotQuality": 80,
+        "removeElementsCssSelector": DC_REMOVE_CSS,
+    }
+    # 목록 페이지 Apify 폴백 입력 (URL 추출만 → 스크린샷 없음)
+    _APIFY_LIST_INPUT = {
+        "crawlerType": "playwright:firefox",
+        "maxCrawlPages": 1,
+        "maxCrawlDepth": 0,
+        "outputFormats": ["markdown"],
+        "removeCookieWarnings": True,
+        "saveScreenshots": False,
+    }
+    # 단일 URL 모드 Apify 입력
+    _APIFY_SINGLE_INPUT = {
+        "crawlerType": "playwright:firefox",
+        "maxCrawlPages": 1,
+        "maxCrawlDepth": 0,
+        "outputFormats": ["markdown"],
+        "saveScreenshots": True,
+        "screenshotQuality": 80,
+    }
+
+    @classmethod
+    def _block_hit(cls, text: str) -> Optional[str]:
+        """텍스트에 포함된 차단 키워드 (없으면 None)"""
+        m = cls._BLOCK_KEYWORDS_RE.search(text)
+        return m.group(0) if m else None
+
     def __init__(self, config: Config):
         self.config = config
         self.client = None
         if config.apify_api_token:
             self.client = ApifyClient(config.apify_api_token)
+        self.session = self._make_session()
+
+    @classmethod
+    def _make_session(cls) -> requests.Session:
+        """v11.1: 목록+개별 글 요청이 같은 호스트로 몰리므로 커넥션 풀 재사용
+        (글마다 TCP+TLS 핸드셰이크 생략) + 429/5xx 자동 재시도"""
+        from urllib3.util.retry import Retry
+        retry = Retry(
+            total=2, backoff_factor=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"], raise_on_status=False,
+        )
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10, pool_maxsize=10, max_retries=retry,
+        )
+        session = requests.Session()
+        session.headers.update(cls._REQ_HEADERS)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def scrape_with_screenshots(self) -> list[dict]:
         """
@@ -2986,17 +3373,8 @@ class CommunityScraper:
     def _extract_article_urls_requests(self, list_url: str) -> list[str]:
         """requests로 목록 페이지 HTML에서 개별 글 URL+제목+참여도 추출 (복합 점수 정렬)"""
         try:
-            import requests as _req
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/133.0.0.0 Safari/537.36"
-                ),
-                "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8",
-                "Referer": "https://gall.dcinside.com/",
-            }
-            r = _req.get(list_url, headers=headers, timeout=15)
+            headers = {"Referer": "https://gall.dcinside.com/"}
+            r = self.session.get(list_url, headers=headers, timeout=15)
             r.encoding = "utf-8"
             html = r.text
 
@@ -3119,7 +3497,7 @@ class CommunityScraper:
                 if no_m and ("dcbest" in u or "hit" in u):
                     if int(no_m.group(1)) < 100000:
                         continue
-                if title and any(kw in title for kw in self.BLOCK_KEYWORDS):
+                if title and self._BLOCK_KEYWORDS_RE.search(title):
                     continue
                 filtered.append((u, title))
 
@@ -3194,22 +3572,15 @@ class CommunityScraper:
     def _extract_article_urls_apify(self, list_url: str) -> list[str]:
         """Apify로 목록 페이지에서 개별 글 URL 추출 (폴백)"""
         try:
-            list_input = {
-                "startUrls": [{"url": list_url}],
-                "crawlerType": "playwright:firefox",
-                "maxCrawlPages": 1,
-                "maxCrawlDepth": 0,
-                "outputFormats": ["markdown"],
-                "removeCookieWarnings": True,
-                "saveScreenshots": False,
-            }
-            list_run = self.client.actor("apify/website-content-crawler").call(
-                run_input=list_input, timeout_secs=120,
+            list_input = {**self._APIFY_LIST_INPUT, "startUrls": [{"url": list_url}]}
+            # v11.1: 목록 단계는 스크린샷 불필요 → run-sync-get-dataset-items 1회 호출
+            # (run 시작 → 완료 대기 폴링 → dataset 조회 3단계 왕복을 1번으로)
+            items = self._apify_run_sync_items(
+                "apify/website-content-crawler", list_input, timeout_secs=120,
             )
 
             urls = []
-            list_dataset = self.client.dataset(list_run["defaultDatasetId"])
-            for item in list_dataset.iterate_items():
+            for item in items:
                 page_text = item.get("text", "") or item.get("markdown", "")
 
                 dc_pat = re.findall(
@@ -3230,6 +3601,23 @@ class CommunityScraper:
             print(f"  ⚠️  Apify 목록 크롤링 실패: {e}")
             return []
 
+    def _apify_run_sync_items(self, actor_id: str, run_input: dict,
+                              timeout_secs: int = 120) -> list[dict]:
+        """Actor 실행 + dataset 아이템을 HTTP 1회로 받음 (KVS 스크린샷 필요 없는 경우용)"""
+        url = ("https://api.apify.com/v2/acts/"
+               f"{actor_id.replace('/', '~')}/run-sync-get-dataset-items")
+        resp = self.session.post(
+            url, json=run_input,
+            params={"timeout": timeout_secs, "format": "json"},
+            headers={"Authorization": f"Bearer {self.config.apify_api_token}"},
+            timeout=timeout_secs + 30,
+        )
+        resp.raise_for_status()
+        # 목록 페이지 전체 텍스트가 담긴 큰 배열 → orjson 있으면 bytes에서 바로 파싱
+        if _orjson is not None:
+            return _orjson.loads(resp.content)
+        return resp.json()
+
     def _scrape_apify_with_screenshots(self) -> list[dict]:
         """
         v4.2: 2단계 크롤링 — 목록→URL 추출→개별 글 크롤링
@@ -3292,14 +3680,14 @@ class CommunityScraper:
                         # 품질 필터
                         text = req_post["content"]
                         title = req_post["title"]
-                        if any(kw in text for kw in self.BLOCK_KEYWORDS):
-                            blk = [kw for kw in self.BLOCK_KEYWORDS if kw in text]
-                            print(f"     🚫 소개/공지글 차단: {blk[0] if blk else 'unknown'}")
+                        blk = self._block_hit(text)
+                        if blk:
+                            print(f"     🚫 소개/공지글 차단: {blk}")
                             continue
-                        if any(kw in title for kw in self.BLOCK_KEYWORDS):
+                        if self._BLOCK_KEYWORDS_RE.search(title):
                             print(f"     🚫 제목에서 소개글 감지, 건너뜀")
                             continue
-                        spam_count = sum(1 for kw in self.UI_KEYWORDS if kw in text)
+                        spam_count = self._count_ui_keywords(text)
                         if spam_count >= 2:
                             print(f"     ⚠️  UI 텍스트 감지 ({spam_count}개), 건너뜀")
                             continue
@@ -3311,17 +3699,8 @@ class CommunityScraper:
                 # ── requests 실패 시 Apify 폴백 ──
                 if not post:
                     try:
-                        art_input = {
-                            "startUrls": [{"url": art_url}],
-                            "crawlerType": "playwright:firefox",
-                            "maxCrawlPages": 1,
-                            "maxCrawlDepth": 0,
-                            "outputFormats": ["markdown"],
-                            "removeCookieWarnings": True,
-                            "saveScreenshots": True,
-                            "screenshotQuality": 80,
-                            "removeElementsCssSelector": self.DC_REMOVE_CSS,
-                        }
+                        art_input = {**self._APIFY_ARTICLE_INPUT,
+                                     "startUrls": [{"url": art_url}]}
                         art_run = self.client.actor("apify/website-content-crawler").call(
                             run_input=art_input, timeout_secs=120,
                         )
@@ -3333,15 +3712,15 @@ class CommunityScraper:
                             text = item.get("text", "") or item.get("markdown", "")
                             if len(text) < 200:
                                 continue
-                            if any(kw in text for kw in self.BLOCK_KEYWORDS):
-                                blk = [kw for kw in self.BLOCK_KEYWORDS if kw in text]
-                                print(f"     🚫 소개/공지글 차단: {blk[0] if blk else 'unknown'}")
+                            blk = self._block_hit(text)
+                            if blk:
+                                print(f"     🚫 소개/공지글 차단: {blk}")
                                 continue
                             item_title = item.get("metadata", {}).get("title", "")
-                            if any(kw in item_title for kw in self.BLOCK_KEYWORDS):
+                            if self._BLOCK_KEYWORDS_RE.search(item_title):
                                 print(f"     🚫 제목에서 소개글 감지, 건너뜀")
                                 continue
-                            spam_count = sum(1 for kw in self.UI_KEYWORDS if kw in text)
+                            spam_count = self._count_ui_keywords(text)
                             if spam_count >= 2:
                                 continue
 
@@ -3396,20 +3775,14 @@ class CommunityScraper:
 
         if self.client:
             try:
-                run_input = {
-                    "startUrls": [{"url": url}],
-                    "crawlerType": "playwright:firefox",
-                    "maxCrawlPages": 1,
-                    "maxCrawlDepth": 0,
-                    "outputFormats": ["markdown"],
-                    "saveScreenshots": True,
-                    "screenshotQuality": 80,
-                }
+                run_input = {**self._APIFY_SINGLE_INPUT, "startUrls": [{"url": url}]}
                 run = self.client.actor("apify/website-content-crawler").call(
                     run_input=run_input, timeout_secs=90
                 )
                 dataset = self.client.dataset(run["defaultDatasetId"])
-                for item in dataset.iterate_items():
+                # v11.1: 첫 항목만 사용 → limit=1로 1건만 요청 (페이지 단위 전체 조회 X)
+                item = next(iter(dataset.iterate_items(limit=1)), None)
+                if item is not None:
                     post["title"] = item.get("metadata", {}).get("title", "")
                     post["content"] = (
                         item.get("text", "") or item.get("markdown", "")
@@ -3424,7 +3797,6 @@ class CommunityScraper:
                         ss_path = self._download_screenshot(kvs, ss_key, 0)
                         if ss_path:
                             post["screenshots"].append(ss_path)
-                    break
 
             except Exception as e:
                 print(f"  ⚠️  Apify 에러: {e}, 폴백 시도...")
@@ -3459,17 +3831,8 @@ class CommunityScraper:
     def _fetch_dc_article_requests(self, url: str) -> Optional[dict]:
         """requests로 디시 개별 글 본문+댓글 직접 추출 (Apify 불필요, 빠름)"""
         try:
-            import requests as _req
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/133.0.0.0 Safari/537.36"
-                ),
-                "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8",
-                "Referer": "https://gall.dcinside.com/",
-            }
-            r = _req.get(url, headers=headers, timeout=15)
+            headers = {"Referer": "https://gall.dcinside.com/"}
+            r = self.session.get(url, headers=headers, timeout=15)
             r.encoding = "utf-8"
             html = r.text
 
@@ -3477,7 +3840,7 @@ class CommunityScraper:
             title = ""
             title_m = re.search(r'<span\s+class="title_subject">(.*?)</span>', html)
             if title_m:
-                title = re.sub(r'<[^>]+>', '', title_m.group(1)).strip()
+                title = self._TAG_RE.sub('', title_m.group(1)).strip()
             if not title:
                 title_m = re.search(r'<title>(.*?)</title>', html)
                 title = title_m.group(1).strip() if title_m else ""
@@ -3494,13 +3857,8 @@ class CommunityScraper:
                     html, re.DOTALL
                 )
             if body_m:
-                raw = body_m.group(1)
                 # <br> → 줄바꿈, 태그 제거
-                raw = re.sub(r'<br\s*/?>', '\n', raw)
-                raw = re.sub(r'<[^>]+>', ' ', raw)
-                raw = re.sub(r'&[a-zA-Z]+;', ' ', raw)
-                raw = re.sub(r'&#\d+;', ' ', raw)
-                body = re.sub(r'\s+', ' ', raw).strip()
+                body = self._clean_html(body_m.group(1))
 
             # 댓글 추출 (베스트 댓글 우선)
             comments = []
@@ -3508,7 +3866,7 @@ class CommunityScraper:
                 r'<p\s+class="usertxt\s*[^"]*">(.*?)</p>', html
             )
             for cmt in cmt_matches[:5]:
-                cmt_text = re.sub(r'<[^>]+>', '', cmt).strip()
+                cmt_text = self._TAG_RE.sub('', cmt).strip()
                 if cmt_text and len(cmt_text) > 5:
                     comments.append(cmt_text)
 
@@ -3527,20 +3885,26 @@ class CommunityScraper:
         except Exception as e:
             return None
 
+    # 도메인 → 플랫폼 파서 (글마다 분기 체인 대신 클래스 로드 시 1번 구성)
+    # v11.1: 호스트 접미사 dict → URL 전체 부분문자열 스캔 6회 대신 해시 조회 몇 번
+    _PLATFORM_PARSERS = {
+        "dcinside.com": "_fetch_dc_article_requests",
+        "fmkorea.com": "_fetch_fmkorea_article",
+        "ruliweb.com": "_fetch_ruliweb_article",
+        "instiz.net": "_fetch_instiz_article",
+        "theqoo.net": "_fetch_theqoo_article",
+        "pann.nate.com": "_fetch_natepann_article",
+    }
+
     def _fetch_article_by_platform(self, url: str) -> Optional[dict]:
         """URL 기반으로 플랫폼 자동 감지 → 해당 플랫폼 파서로 본문 추출"""
-        if "dcinside.com" in url:
-            return self._fetch_dc_article_requests(url)
-        elif "fmkorea.com" in url:
-            return self._fetch_fmkorea_article(url)
-        elif "ruliweb.com" in url:
-            return self._fetch_ruliweb_article(url)
-        elif "instiz.net" in url:
-            return self._fetch_instiz_article(url)
-        elif "theqoo.net" in url:
-            return self._fetch_theqoo_article(url)
-        elif "pann.nate.com" in url:
-            return self._fetch_natepann_article(url)
+        host = urlsplit(url if "//" in url else "//" + url).hostname or ""
+        labels = host.split(".")
+        # gall.dcinside.com → dcinside.com, m.pann.nate.com → pann.nate.com
+        for i in range(len(labels) - 1):
+            parser = self._PLATFORM_PARSERS.get(".".join(labels[i:]))
+            if parser:
+                return getattr(self, parser)(url)
         return None
 
     _REQ_HEADERS = {
@@ -3552,19 +3916,26 @@ class CommunityScraper:
         "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8",
     }
 
+    # v11.1: 댓글마다 호출되므로 패턴은 클래스 로드 시 1번만 컴파일
+    _BR_RE = re.compile(r'<br\s*/?>')
+    _TAG_RE = re.compile(r'<[^>]+>')
+    _ENTITY_RE = re.compile(r'&(?:[a-zA-Z]+|#\d+);')
+    _WS_RE = re.compile(r'\s+')
+
     def _clean_html(self, raw: str) -> str:
         """HTML 태그 제거 + 공백 정리"""
-        raw = re.sub(r'<br\s*/?>', '\n', raw)
-        raw = re.sub(r'<[^>]+>', ' ', raw)
-        raw = re.sub(r'&[a-zA-Z]+;', ' ', raw)
-        raw = re.sub(r'&#\d+;', ' ', raw)
-        return re.sub(r'\s+', ' ', raw).strip()
+        # v11.1: 태그/엔티티가 없는 조각(제목·댓글 대부분)은 해당 정규식 스캔 생략
+        if '<' in raw:
+            raw = self._BR_RE.sub('\n', raw)
+            raw = self._TAG_RE.sub(' ', raw)
+        if '&' in raw:
+            raw = self._ENTITY_RE.sub(' ', raw)
+        return self._WS_RE.sub(' ', raw).strip()
 
     def _fetch_fmkorea_article(self, url: str) -> Optional[dict]:
         """에펨코리아 개별 글 본문 추출"""
         try:
-            import requests as _req
-            r = _req.get(url, headers=self._REQ_HEADERS, timeout=15)
+            r = self.session.get(url, timeout=15)
             r.encoding = "utf-8"
             html = r.text
 
@@ -3609,8 +3980,7 @@ class CommunityScraper:
     def _fetch_ruliweb_article(self, url: str) -> Optional[dict]:
         """루리웹 개별 글 본문 추출"""
         try:
-            import requests as _req
-            r = _req.get(url, headers=self._REQ_HEADERS, timeout=15)
+            r = self.session.get(url, timeout=15)
             r.encoding = "utf-8"
             html = r.text
 
@@ -3655,8 +4025,7 @@ class CommunityScraper:
     def _fetch_instiz_article(self, url: str) -> Optional[dict]:
         """인스티즈 개별 글 본문 추출"""
         try:
-            import requests as _req
-            r = _req.get(url, headers=self._REQ_HEADERS, timeout=15)
+            r = self.session.get(url, timeout=15)
             r.encoding = "utf-8"
             html = r.text
 
@@ -3699,8 +4068,7 @@ class CommunityScraper:
     def _fetch_theqoo_article(self, url: str) -> Optional[dict]:
         """더쿠 개별 글 본문 추출 (Rhymix/XE CMS 기반)"""
         try:
-            import requests as _req
-            r = _req.get(url, headers=self._REQ_HEADERS, timeout=15)
+            r = self.session.get(url, timeout=15)
             r.encoding = "utf-8"
             html = r.text
 
@@ -3746,8 +4114,7 @@ class CommunityScraper:
     def _fetch_natepann_article(self, url: str) -> Optional[dict]:
         """네이트판 개별 글 본문 추출"""
         try:
-            import requests as _req
-            r = _req.get(url, headers=self._REQ_HEADERS, timeout=15)
+            r = self.session.get(url, timeout=15)
             r.encoding = "utf-8"
             html = r.text
 
@@ -3794,7 +4161,7 @@ class CommunityScraper:
                     "AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
                 )
             }
-            resp = requests.get(url, headers=headers, timeout=15)
+            resp = self.session.get(url, headers=headers, timeout=15)
             resp.encoding = "utf-8"
 
             from html.parser import HTMLParser
@@ -3843,6 +4210,33 @@ class CommunityScraper:
         post["screenshots"] = self._generate_text_screenshots(post)
         return [post]
 
+    # 텍스트 스크린샷 배경 팔레트 (어두운 배경 + 본문 텍스트 = 디시/네이트판 느낌)
+    _TEXT_SS_GRADIENTS = (
+        ((25, 28, 35), (45, 38, 30)),   # 다크블루 → 다크브라운
+        ((35, 25, 30), (25, 35, 40)),   # 다크레드 → 다크틸
+        ((30, 30, 20), (20, 25, 40)),   # 다크옐로 → 다크블루
+        ((20, 30, 25), (35, 25, 35)),   # 다크그린 → 다크퍼플
+        ((35, 30, 20), (25, 20, 35)),   # 다크오렌지 → 다크퍼플
+        ((25, 25, 35), (35, 30, 25)),   # 다크블루 → 다크브라운
+    )
+    # v11.1: {(w, h, 팔레트 idx): 그라데이션} — 팔레트 6종이라 배치 전체에서 재사용
+    _text_ss_bg_cache: dict = {}
+    # v11.1: 줄바꿈기 재사용 (fill → split 왕복 없이 wrap()으로 줄 리스트 직접)
+    _TITLE_WRAPPER = textwrap.TextWrapper(width=20)
+    _BODY_WRAPPER = textwrap.TextWrapper(width=24)  # 세로 화면이라 좁게
+
+    @classmethod
+    def _text_ss_background(cls, w: int, h: int, idx: int) -> Image.Image:
+        """팔레트 idx의 세로 그라데이션 배경 사본 (크기·팔레트당 1회 생성)"""
+        key = (w, h, idx)
+        bg = cls._text_ss_bg_cache.get(key)
+        if bg is None:
+            c1, c2 = cls._TEXT_SS_GRADIENTS[idx]
+            # 행 단위 draw.line 대신 C 프리미티브 그라데이션 (VideoAssembler와 공용)
+            bg = VideoAssembler._vertical_gradient(w, h, c1, c2)
+            cls._text_ss_bg_cache[key] = bg
+        return bg.copy()
+
     def _generate_text_screenshots(self, post: dict) -> list[str]:
         """
         🎨 텍스트 기반 가짜 '커뮤니티 스크린샷' 생성
@@ -3876,26 +4270,9 @@ class CommunityScraper:
 
         paths = []
         for idx, chunk_text in enumerate(text_chunks):
-            img = Image.new("RGB", (w, h))
-            draw = ImageDraw.Draw(img)
-
             # 커뮤니티 느낌의 그라데이션 배경
-            # (어두운 배경 + 본문 텍스트 = 디시/네이트판 느낌)
-            colors = [
-                [(25, 28, 35), (45, 38, 30)],   # 다크블루 → 다크브라운
-                [(35, 25, 30), (25, 35, 40)],   # 다크레드 → 다크틸
-                [(30, 30, 20), (20, 25, 40)],   # 다크옐로 → 다크블루
-                [(20, 30, 25), (35, 25, 35)],   # 다크그린 → 다크퍼플
-                [(35, 30, 20), (25, 20, 35)],   # 다크오렌지 → 다크퍼플
-                [(25, 25, 35), (35, 30, 25)],   # 다크블루 → 다크브라운
-            ]
-            c1, c2 = colors[idx % len(colors)]
-            for y in range(h):
-                ratio = y / h
-                r = int(c1[0] * (1 - ratio) + c2[0] * ratio)
-                g = int(c1[1] * (1 - ratio) + c2[1] * ratio)
-                b = int(c1[2] * (1 - ratio) + c2[2] * ratio)
-                draw.line([(0, y), (w, y)], fill=(r, g, b))
+            img = self._text_ss_background(w, h, idx % len(self._TEXT_SS_GRADIENTS))
+            draw = ImageDraw.Draw(img)
 
             # 상단: 소스 표시 바
             bar_h = 80
@@ -3914,7 +4291,7 @@ class CommunityScraper:
             y_offset = bar_h + 30
             if idx == 0 and title:
                 # 제목 배경 박스
-                title_wrapped = textwrap.fill(title[:40], width=20)
+                title_wrapped = "\n".join(self._TITLE_WRAPPER.wrap(title[:40]))
                 draw.rectangle(
                     [(40, y_offset), (w - 40, y_offset + 120)],
                     fill=(255, 255, 255, 15),
@@ -3929,12 +4306,16 @@ class CommunityScraper:
 
             # 본문 텍스트 (커뮤니티 글 느낌)
             # 줄바꿈 처리
+            # v11.1: 최대 20줄만 그리므로 그 이상은 줄바꿈 계산 생략
             wrapped_lines = []
             for line in chunk_text.split("\n"):
-                wrapped = textwrap.fill(line, width=24)  # 세로 화면이라 좁게
-                wrapped_lines.extend(wrapped.split("\n"))
+                wrapped_lines.extend(self._BODY_WRAPPER.wrap(line) or [""])
+                if len(wrapped_lines) >= 20:
+                    break
 
-            text_y = y_offset + 40
+            text_y0 = y_offset + 40
+            text_y = text_y0
+            shown_lines = []
             for line in wrapped_lines[:20]:  # 최대 20줄
                 if text_y > h - 200:
                     break
@@ -3945,11 +4326,16 @@ class CommunityScraper:
                     [(50, text_y - 5), (70 + text_w, text_y + 42)],
                     fill=(0, 0, 0, 60)
                 )
-                draw.text(
-                    (60, text_y), line,
-                    fill=(220, 220, 220), font=font
-                )
+                shown_lines.append(line)
                 text_y += 48
+            # v11.1: 본문은 줄마다 draw.text 대신 multiline_text 1회
+            # (Pillow 줄 간격 = "A" 높이 + spacing → 기존과 같은 48px 피치로 맞춤)
+            if shown_lines:
+                spacing = 48 - draw.textbbox((0, 0), "A", font=font)[3]
+                draw.multiline_text(
+                    (60, text_y0), "\n".join(shown_lines),
+                    fill=(220, 220, 220), font=font, spacing=spacing
+                )
 
             # 하단: 페이지 표시
             page_text = f"{idx + 1} / {len(text_chunks)}"
@@ -3958,9 +4344,9 @@ class CommunityScraper:
                 fill=(120, 120, 120), font=font
             )
 
-            # 저장
+            # 저장 (임시 파일 → 곧바로 재디코딩되므로 zlib 압축 최소화)
             path = os.path.join(ss_dir, f"textss_{idx:02d}.png")
-            img.save(path, quality=90)
+            img.save(path, format="PNG", optimize=False, compress_level=1)
             paths.append(path)
 
         print(f"  ✅ {len(paths)}장 스크린샷 이미지 생성")
@@ -4394,8 +4780,11 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
         if not api_key:
             raise ValueError("GOOGLE_API_KEY 환경변수가 필요합니다! (대본 생성: Gemini)")
         genai_flash.configure(api_key=api_key)
+        # v11.1: 고정 페르소나는 system_instruction으로 분리 → 매 요청 동일한 접두부
+        #        (Gemini 암시적 컨텍스트 캐시 적중), 요청 본문은 테마/소스 부분만
         self._model = genai_flash.GenerativeModel(
             self.GEMINI_MODEL,
+            system_instruction=self.SYSTEM_PROMPT,
             generation_config=genai_flash.types.GenerationConfig(
                 temperature=0.4,
                 top_p=0.95,
@@ -4546,6 +4935,80 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
 {retry_section}
 {preset['build_prompt_suffix']}"""
 
+    # ── 대본 검증/클리닝 정규식 (v11.1: 호출마다 컴파일하지 않도록 클래스 로드 시 1회) ──
+    _FOREIGN_RE = re.compile(r'[a-zA-Zа-яА-ЯёЁ]{3,}')
+    _ALLOWED_ENGLISH = frozenset({
+        "CCTV", "SNS", "MZ", "GDP", "AI", "CEO", "IT", "PC", "TV", "OTT",
+        "MBTI", "TMI", "BGM", "SFX", "TOP", "DNA", "USB", "LED", "DIY", "FAQ",
+        # 16 MBTI 유형
+        "ISTJ", "ISFJ", "INFJ", "INTJ", "ISTP", "ISFP", "INFP", "INTP",
+        "ESTP", "ESFP", "ENFP", "ENTP", "ESTJ", "ESFJ", "ENFJ", "ENTJ",
+    })
+    _HANGUL_RE = re.compile(r'[가-힣]')
+    _HANGUL_WORD_RE = re.compile(r'[가-힣]{2,}')
+    _PAREN_DIRECTIVE_RE = re.compile(r'\(.*?(장면|캐릭터|배경|표정|조명).*?\)')
+    _BRACKET_DIRECTIVE_RE = re.compile(r'\[.*?(scene|character|background).*?\]', re.IGNORECASE)
+    _EMO_SPLIT_RE = re.compile(r'[,/]')
+    _SFX_STRIP_RE = re.compile(r'[\[\]\s]')
+    # v11.1: _clean_script_data 필드 정규화 테이블 — 문장마다 재생성하지 않도록 클래스 상수
+    _CLEAN_VALID_EMOTIONS = frozenset({
+        "neutral", "tension", "surprise", "anger", "angry",
+        "sad", "fun", "funny", "shock", "shocked", "relief",
+        "excited", "warm", "serious", "whisper",
+    })
+    # ★ 한국어 emotion → 영어 매핑 (Gemini가 한국어로 뱉는 경우 대비)
+    _KR_EMOTION_MAP = {
+        "충격": "shocked", "놀람": "surprise", "경악": "shocked",
+        "분노": "angry", "빡침": "angry", "화남": "angry",
+        "슬픔": "sad", "우울": "sad", "허탈": "sad", "좌절": "sad",
+        "재미": "funny", "웃김": "funny", "유머": "funny",
+        "긴장": "tension", "불안": "tension", "초조": "tension",
+        "감동": "warm", "따뜻": "warm", "뭉클": "warm",
+        "공포": "whisper", "무서움": "whisper", "소름": "whisper",
+        "현타": "sad", "체념": "sad", "한숨": "sad",
+        "흥분": "excited", "설렘": "excited", "기대": "excited",
+        "진지": "serious", "심각": "serious",
+        "안도": "relief", "후련": "relief",
+        "궁금": "tension", "절박": "tension",
+    }
+    # ★ mapping.json에 없는 SFX 태그 → 유사한 태그로 자동 변환
+    _SFX_ALIAS_MAP = {
+        # 드라마/액션
+        "punch_hit": "punch", "hit": "punch", "slap": "punch",
+        "drama_punch": "punch", "crash": "glass_break", "break": "glass_break",
+        "explosion": "thunder", "boom": "thunder", "slam": "punch",
+        # 반응/감정
+        "deep_sigh": "gasp", "sigh": "gasp", "cry": "gasp",
+        "scream": "gasp", "wow": "crowd_ooh", "ooh": "crowd_ooh",
+        "surprise": "gasp", "shock": "record_scratch",
+        # 전환/UI
+        "fast_swoosh": "swoosh", "swipe": "swoosh", "slide": "swoosh",
+        "pop": "ding", "question_pop": "ding", "alert": "kakao_alert",
+        "notification": "kakao_alert", "bell": "doorbell",
+        "click": "typing", "tap": "typing",
+        # 코미디
+        "giggle": "laugh", "lol": "laugh", "haha": "laugh",
+        "comedy": "rimshot", "joke": "rimshot", "spring": "boing",
+        # 기타
+        "empty_stomach_growl": "boing", "growl": "boing",
+        "money": "cash_register", "coin": "cash_register", "pay": "cash_register",
+        "vibrate": "phone_vibrate", "phone": "phone_vibrate",
+    }
+    _QUOTE_RE = re.compile(r'["\u201c\u201d](.+?)["\u201c\u201d]')
+    _RISKY_PATTERNS = [
+        (re.compile(r'(\d+)%\s*(확률|가능성|치료율|생존율)'), "의학 통계"),
+        (re.compile(r'벌금\s*\d+'), "법률 수치"),
+        (re.compile(r'(\d+)(만원|억원|조원)'), "금액"),
+        (re.compile(r'연구(에\s*따르면|결과|팀|진)'), "미확인 연구 인용"),
+        (re.compile(r'전문가(에\s*따르면|들은|가)'), "미확인 전문가 인용"),
+    ]
+    # 위 패턴 전체를 한 번에 훑는 사전 필터 (대부분의 줄은 해당 없음 → 1회 스캔으로 끝)
+    _RISKY_ANY_RE = re.compile("|".join(f"(?:{p.pattern})" for p, _ in _RISKY_PATTERNS))
+    _DATE_RE = re.compile(r'(\d{4})년|(\d{1,2})월\s*(\d{1,2})일')
+    _FULL_DATE_RE = re.compile(r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일')
+    _YEAR_RE = re.compile(r'\d{4}년')
+    _SOURCE_SENT_SPLIT_RE = re.compile(r'[.\n]')
+
     def _quality_check(self, script_data: dict) -> list[str]:
         """대본 품질 검증 v3 — 테마별 파라미터 적용. 문제점 리스트 반환."""
         issues = []
@@ -4568,10 +5031,14 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
         emotions = [l.get("emotion", "neutral") for l in lines]
 
         # 1) 같은 감정 연속 체크 (테마별: gossip 2연속, comedy 3연속)
+        # v11.1: 윈도우마다 set 생성 대신 연속 길이 1패스 스캔
         limit = max_consec + 1
-        for i in range(len(emotions) - limit + 1):
-            if len(set(emotions[i:i+limit])) == 1:
-                issues.append(f"같은 감정 {limit}연속: {emotions[i]} (장면 {i+1}~{i+limit})")
+        run = 0
+        for i, emo in enumerate(emotions):
+            run = run + 1 if i and emo == emotions[i - 1] else 1
+            if run >= limit:
+                start = i - limit + 1
+                issues.append(f"같은 감정 {limit}연속: {emo} (장면 {start+1}~{start+limit})")
                 break
 
         # 2) 감정 종류 최소 N종
@@ -4599,18 +5066,10 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
             issues.append(f"AI슬롭 단어 {len(slop_found)}개: {slop_found}")
 
         # 6) 영어/외국어 혼입 체크 (text 필드만)
-        foreign_pattern = re.compile(r'[a-zA-Zа-яА-ЯёЁ]{3,}')
-        allowed_english = {
-            "CCTV", "SNS", "MZ", "GDP", "AI", "CEO", "IT", "PC", "TV", "OTT",
-            "MBTI", "TMI", "BGM", "SFX", "TOP", "DNA", "USB", "LED", "DIY", "FAQ",
-            # 16 MBTI 유형
-            "ISTJ", "ISFJ", "INFJ", "INTJ", "ISTP", "ISFP", "INFP", "INTP",
-            "ESTP", "ESFP", "ENFP", "ENTP", "ESTJ", "ESFJ", "ENFJ", "ENTJ",
-        }
         for l in lines:
             txt = l.get("text", "")
-            foreign_matches = foreign_pattern.findall(txt)
-            real_foreign = [m for m in foreign_matches if m.upper() not in allowed_english]
+            foreign_matches = self._FOREIGN_RE.findall(txt)
+            real_foreign = [m for m in foreign_matches if m.upper() not in self._ALLOWED_ENGLISH]
             if real_foreign:
                 issues.append(f"외국어 혼입: {real_foreign} (장면 {l.get('scene_number', '?')})")
                 break
@@ -4625,8 +5084,7 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
             issues.append(f"문장 수 부족: {n}개 (최소 {min_sentences}개)")
 
         # 9) image_prompt 한국어 체크 (영어 필수)
-        kr_pattern = re.compile(r'[가-힣]')
-        kr_prompts = [i for i, l in enumerate(lines, 1) if kr_pattern.search(l.get("image_prompt", ""))]
+        kr_prompts = [i for i, l in enumerate(lines, 1) if self._HANGUL_RE.search(l.get("image_prompt", ""))]
         if kr_prompts:
             issues.append(f"image_prompt에 한국어 포함 (장면 {kr_prompts[:3]}). 영어로만 작성해야 함.")
 
@@ -4658,16 +5116,18 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
             if len(content) < 200:
                 print(f"  ⚠️  소스 내용 부족 ({len(content)}자), 건너뜀")
                 return None
-            for kw in CommunityScraper.BLOCK_KEYWORDS:
-                if kw in content or kw in title:
-                    print(f"  🚫 차단 키워드: '{kw}' 발견 → 건너뜀")
-                    return None
-            spam_count = sum(1 for kw in CommunityScraper.UI_KEYWORDS if kw in content)
+            kw = CommunityScraper._block_hit(content) or CommunityScraper._block_hit(title)
+            if kw:
+                print(f"  🚫 차단 키워드: '{kw}' 발견 → 건너뜀")
+                return None
+            spam_count = CommunityScraper._count_ui_keywords(content)
             if spam_count >= 2:
                 print(f"  ⚠️  UI/광고 텍스트 감지 ({spam_count}개 키워드), 건너뜀")
                 return None
-            risk_count = sum(1 for kw in CommunityScraper.RISKY_CONTENT_KEYWORDS if kw in content or kw in title)
-            if risk_count >= 1:
+            risk_re = CommunityScraper._RISKY_CONTENT_RE
+            if risk_re.search(content) or risk_re.search(title):
+                risk_count = sum(1 for kw in CommunityScraper.RISKY_CONTENT_KEYWORDS
+                                 if kw in content or kw in title)
                 print(f"  ⚠️  위험 콘텐츠 감지 ({risk_count}개): 허위정보 방지를 위해 건너뜀")
                 return None
         else:
@@ -4680,9 +5140,8 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
         for attempt in range(1, max_attempts + 1):
             try:
                 prompt = self._build_prompt(post, retry_feedback)
-                # v6.2: Gemini 롤백 — DIRECTOR_PERSONA + 프롬프트를 합쳐 전달
-                full_prompt = self.SYSTEM_PROMPT + "\n\n" + prompt
-                response = self._model.generate_content(full_prompt)
+                # v11.1: DIRECTOR_PERSONA는 모델의 system_instruction으로 전달됨
+                response = self._model.generate_content(prompt)
                 if not response.text:
                     raise ValueError("Gemini API returned empty response")
                 raw = response.text
@@ -4801,8 +5260,8 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
                 continue
 
             # ── Stage 1: image_prompt 키워드 오염 (기존 로직 강화) ──
-            match_count = sum(1 for kw in self._IMG_CONTAMINATION_KW if kw in txt)
-            if len(txt) > 20 and match_count >= 2:
+            # v11.1: 20자 이하 짧은 문장은 키워드 스캔 자체를 생략 (대부분의 대본 문장)
+            if len(txt) > 20 and sum(1 for kw in self._IMG_CONTAMINATION_KW if kw in txt) >= 2:
                 print(f"  ⚠️  [클린] image_prompt 혼입 → 제거: {txt[:50]}...")
                 line["text"] = ""
                 cleaned_count += 1
@@ -4810,10 +5269,14 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
 
             # ── Stage 2: 정규식으로 연출 지시문 잔재 제거 ──
             original = txt
-            txt = self._DIRECTIVE_REGEX.sub("", txt).strip()
-            # 괄호/대괄호 안 지시문만 단독으로 남은 경우 전체 제거
-            txt = re.sub(r'\(.*?(장면|캐릭터|배경|표정|조명).*?\)', '', txt).strip()
-            txt = re.sub(r'\[.*?(scene|character|background).*?\]', '', txt, flags=re.IGNORECASE).strip()
+            # v11.1: 세 패턴 모두 '(' / '[' / ','가 있어야 매칭 → 없으면 정규식 생략
+            if "(" in txt or "[" in txt or "," in txt:
+                txt = self._DIRECTIVE_REGEX.sub("", txt).strip()
+                # 괄호/대괄호 안 지시문만 단독으로 남은 경우 전체 제거
+                txt = self._PAREN_DIRECTIVE_RE.sub('', txt).strip()
+                txt = self._BRACKET_DIRECTIVE_RE.sub('', txt).strip()
+            else:
+                txt = txt.strip()
             # text와 image_prompt가 완전히 동일하면 text 무효화
             if txt and txt == line.get("image_prompt", ""):
                 txt = ""
@@ -4827,39 +5290,19 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
 
             # ── Stage 3: 필드 정규화 ──
             # emotion 필드: 한국어 → 영어 매핑 + 유효하지 않으면 neutral로 교정
-            valid_emotions = {
-                "neutral", "tension", "surprise", "anger", "angry",
-                "sad", "fun", "funny", "shock", "shocked", "relief",
-                "excited", "warm", "serious", "whisper",
-            }
-            # ★ 한국어 emotion → 영어 매핑 (Gemini가 한국어로 뱉는 경우 대비)
-            _KR_EMOTION_MAP = {
-                "충격": "shocked", "놀람": "surprise", "경악": "shocked",
-                "분노": "angry", "빡침": "angry", "화남": "angry",
-                "슬픔": "sad", "우울": "sad", "허탈": "sad", "좌절": "sad",
-                "재미": "funny", "웃김": "funny", "유머": "funny",
-                "긴장": "tension", "불안": "tension", "초조": "tension",
-                "감동": "warm", "따뜻": "warm", "뭉클": "warm",
-                "공포": "whisper", "무서움": "whisper", "소름": "whisper",
-                "현타": "sad", "체념": "sad", "한숨": "sad",
-                "흥분": "excited", "설렘": "excited", "기대": "excited",
-                "진지": "serious", "심각": "serious",
-                "안도": "relief", "후련": "relief",
-                "궁금": "tension", "절박": "tension",
-            }
             emo = line.get("emotion", "neutral")
             # 콤마로 여러 감정 나열된 경우 ("슬픔, 허탈") → 첫 번째만 사용
             if "," in emo or "/" in emo:
-                emo = re.split(r'[,/]', emo)[0].strip()
+                emo = self._EMO_SPLIT_RE.split(emo)[0].strip()
             # 한국어 매핑 시도
-            if emo not in valid_emotions:
-                mapped = _KR_EMOTION_MAP.get(emo)
+            if emo not in self._CLEAN_VALID_EMOTIONS:
+                mapped = self._KR_EMOTION_MAP.get(emo)
                 if mapped:
                     line["emotion"] = mapped
                 else:
                     # 부분 매칭 (e.g. "궁금함" → "궁금" 매칭)
                     matched = False
-                    for kr, en in _KR_EMOTION_MAP.items():
+                    for kr, en in self._KR_EMOTION_MAP.items():
                         if kr in emo:
                             line["emotion"] = en
                             matched = True
@@ -4869,34 +5312,11 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
 
             # sfx 필드: 대괄호/공백 정리 + 유사어 매핑
             sfx = str(line.get("sfx", ""))
-            sfx = re.sub(r'[\[\]\s]', '', sfx).strip()
-            # ★ mapping.json에 없는 SFX 태그 → 유사한 태그로 자동 변환
-            _SFX_ALIAS_MAP = {
-                # 드라마/액션
-                "punch_hit": "punch", "hit": "punch", "slap": "punch",
-                "drama_punch": "punch", "crash": "glass_break", "break": "glass_break",
-                "explosion": "thunder", "boom": "thunder", "slam": "punch",
-                # 반응/감정
-                "deep_sigh": "gasp", "sigh": "gasp", "cry": "gasp",
-                "scream": "gasp", "wow": "crowd_ooh", "ooh": "crowd_ooh",
-                "surprise": "gasp", "shock": "record_scratch",
-                # 전환/UI
-                "fast_swoosh": "swoosh", "swipe": "swoosh", "slide": "swoosh",
-                "pop": "ding", "question_pop": "ding", "alert": "kakao_alert",
-                "notification": "kakao_alert", "bell": "doorbell",
-                "click": "typing", "tap": "typing",
-                # 코미디
-                "giggle": "laugh", "lol": "laugh", "haha": "laugh",
-                "comedy": "rimshot", "joke": "rimshot", "spring": "boing",
-                # 기타
-                "empty_stomach_growl": "boing", "growl": "boing",
-                "money": "cash_register", "coin": "cash_register", "pay": "cash_register",
-                "vibrate": "phone_vibrate", "phone": "phone_vibrate",
-            }
+            sfx = self._SFX_STRIP_RE.sub('', sfx).strip()
             if sfx and sfx not in {"", "none", "null"}:
                 sfx_lower = sfx.lower()
-                if sfx_lower in _SFX_ALIAS_MAP:
-                    sfx = _SFX_ALIAS_MAP[sfx_lower]
+                if sfx_lower in self._SFX_ALIAS_MAP:
+                    sfx = self._SFX_ALIAS_MAP[sfx_lower]
             line["sfx"] = sfx
 
             # sfx_volume 필드: 0.1~1.0 범위 강제
@@ -4930,12 +5350,18 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
 
         return script_data
 
+    # v11.1: 응답 파싱용 정규식/디코더 — 클래스 로드 시 1회
+    _FENCE_OPEN_RE = re.compile(r"^```(?:json)?\s*")
+    _FENCE_CLOSE_RE = re.compile(r"\s*```\s*$")
+    _FENCE_BLOCK_RE = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+    _JSON_DECODER = json.JSONDecoder()
+
     def _extract_json(self, text: str) -> dict:
         # 0차 전처리: 마크다운 백틱 제거 (```json ... ``` 또는 ``` ... ```)
         text = text.strip()
         if text.startswith("```"):
-            text = re.sub(r"^```(?:json)?\s*", "", text)
-            text = re.sub(r"\s*```\s*$", "", text)
+            text = self._FENCE_OPEN_RE.sub("", text)
+            text = self._FENCE_CLOSE_RE.sub("", text)
             text = text.strip()
 
         # 1차: 전체 텍스트를 바로 JSON 파싱 시도
@@ -4950,7 +5376,7 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
             pass
 
         # 1차: 코드 블록에서 JSON 추출
-        json_match = re.search(r"```json\s*(.*?)\s*```", text, re.DOTALL)
+        json_match = self._FENCE_BLOCK_RE.search(text)
         if json_match:
             try:
                 parsed = json.loads(json_match.group(1))
@@ -4959,7 +5385,15 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
                 return parsed
             except json.JSONDecodeError:
                 pass
-        # 2차: 중괄호 매칭 (가장 바깥쪽 { } 쌍 찾기)
+        # 2차: 첫 '{'부터 C 디코더로 바로 파싱 (앞뒤 설명 문장이 붙은 흔한 경우)
+        first = text.find('{')
+        if first >= 0:
+            try:
+                return self._JSON_DECODER.raw_decode(text, first)[0]
+            except json.JSONDecodeError:
+                pass
+
+        # 3차: 중괄호 매칭 (가장 바깥쪽 { } 쌍 찾기)
         depth = 0
         start_idx = -1
         for i, ch in enumerate(text):
@@ -4999,7 +5433,7 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
             flagged = False
 
             # 1) 원문에 없는 직접 인용/대화 탐지
-            quotes = re.findall(r'["\u201c\u201d](.+?)["\u201c\u201d]', text)
+            quotes = self._QUOTE_RE.findall(text)
             for q in quotes:
                 if len(q) > 5 and q not in source_text:
                     # 원문에 없는 대사 → 따옴표 제거하고 간접화
@@ -5008,33 +5442,26 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
                     warnings.append(f"직접인용 제거: '{q[:20]}...'")
 
             # 2) 의학/법률/금융 허위정보 패턴
-            risky_patterns = [
-                (r'(\d+)%\s*(확률|가능성|치료율|생존율)', "의학 통계"),
-                (r'벌금\s*\d+', "법률 수치"),
-                (r'(\d+)(만원|억원|조원)', "금액"),
-                (r'연구(에\s*따르면|결과|팀|진)', "미확인 연구 인용"),
-                (r'전문가(에\s*따르면|들은|가)', "미확인 전문가 인용"),
-            ]
-            for pat, label in risky_patterns:
-                match = re.search(pat, text)
+            for pat, label in (self._RISKY_PATTERNS if self._RISKY_ANY_RE.search(text) else ()):
+                match = pat.search(text)
                 if match and match.group(0) not in source_text:
                     warnings.append(f"{label} 감지(원문 미확인): '{match.group(0)}'")
                     # 제거하지 않되, 헤지 표현으로 감쌀 수 있음
                     # 심각한 경우 라인 교체
                     if label in ("의학 통계", "미확인 연구 인용"):
-                        text = re.sub(pat, '', text).strip()
+                        text = pat.sub('', text).strip()
                         if not text:
                             flagged = True
 
             # 3) 날짜/시간 조작 탐지
-            date_m = re.findall(r'(\d{4})년|(\d{1,2})월\s*(\d{1,2})일', text)
+            date_m = self._DATE_RE.findall(text)
             for dm in date_m:
                 date_str = ''.join(dm)
                 if date_str and date_str not in source_text:
                     warnings.append(f"원문에 없는 날짜: '{date_str}'")
                     # 날짜 구체화 제거
-                    text = re.sub(r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일', '얼마 전', text)
-                    text = re.sub(r'\d{4}년', '최근', text)
+                    text = self._FULL_DATE_RE.sub('얼마 전', text)
+                    text = self._YEAR_RE.sub('최근', text)
 
             if not flagged:
                 line["text"] = text
@@ -5046,13 +5473,15 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
                 print(f"     ⚠️  {w}")
 
         # 4) 원문 핵심 키워드 포함 확인
-        source_words = set(re.findall(r'[가-힣]{2,}', source_text))
+        # v11.1: Counter(C 구현)로 빈도 집계 → most_common은 힙 기반 상위 30개
+        #        (기존: set에서 임의 30개 — 해시 순서라 실행마다 달라지고 '빈출'도 아니었음)
+        source_freq = Counter(w for w in self._HANGUL_WORD_RE.findall(source_text) if len(w) >= 3)
         script_full = " ".join(l.get("text", "") for l in cleaned_lines)
-        script_words = set(re.findall(r'[가-힣]{2,}', script_full))
+        script_words = set(self._HANGUL_WORD_RE.findall(script_full))
         # 원문 상위 빈출 단어 중 스크립트에 포함된 비율
-        common_source = [w for w in source_words if len(w) >= 3][:30]
+        common_source = [w for w, _ in source_freq.most_common(30)]
         if common_source:
-            overlap = sum(1 for w in common_source if w in script_words)
+            overlap = len(script_words.intersection(common_source))
             coverage = overlap / len(common_source)
             if coverage < 0.15:
                 print(f"  ⚠️  원문 키워드 반영률 낮음: {coverage:.0%} — 대본이 원문과 동떨어질 수 있음")
@@ -5094,7 +5523,7 @@ CTA (1문장): relief/warm. "알고 있었음?" / "이것도 궁금하면 팔로
                                  "image_prompt": "카메라를 보며 질문하는 표정, B급 웹툰 스타일"})
         else:
             # 원문에서 핵심 문장 추출 (마침표/줄바꿈 기준 분리)
-            source_sents = [s.strip() for s in re.split(r'[.\n]', content) if len(s.strip()) > 10]
+            source_sents = [s.strip() for s in self._SOURCE_SENT_SPLIT_RE.split(content) if len(s.strip()) > 10]
 
             for sent in source_sents[:8]:
                 truncated = sent[:15]
@@ -5365,16 +5794,17 @@ class TTSEngine:
             except (OSError, ValueError) as e:
                 print(f"  ⚠️  ffprobe 측정 실패: {e}")
 
-        # 2차: ffmpeg -i 로 duration 파싱 (ffprobe 없을 때)
+        # 2차: ffmpeg -i 배너의 Duration 파싱 (ffprobe 없을 때)
+        # v11.1: 출력(-f null -) 없이 입력만 열기 → 전체 디코딩 없이 헤더만 읽고 종료
         try:
             r = subprocess.run(
-                [FFMPEG_PATH, "-i", path, "-f", "null", "-"],
+                [FFMPEG_PATH, "-hide_banner", "-i", path],
                 capture_output=True, text=True, encoding="utf-8", errors="replace"
             )
-            m = re.search(r"Duration:\s*(\d+):(\d+):(\d+)\.(\d+)", r.stderr)
+            m = _DURATION_RE.search(r.stderr or "")
             if m:
-                h, mi, s, cs = int(m.group(1)), int(m.group(2)), int(m.group(3)), int(m.group(4))
-                return (h * 3600 + mi * 60 + s) * 1000 + cs * 10
+                h, mi, s = int(m.group(1)), int(m.group(2)), float(m.group(3))
+                return int(round((h * 3600 + mi * 60 + s) * 1000))
         except (OSError, ValueError) as e:
             print(f"  ⚠️  ffmpeg 측정 실패: {e}")
 
@@ -5392,6 +5822,11 @@ class SFXManager:
     ─ ★ SFX 볼륨 하드 리미터: TTS 음성 대비 최대 60%
     """
 
+    # v11.1: {sfx_dir: (mtime 스탬프, 매핑)} — 영상마다 새로 생성돼도
+    # 파일이 안 바뀌었으면 JSON 파싱 + 태그별 exists 검사를 다시 하지 않음
+    # 스탬프 = mapping.json + sfx 폴더 + 카테고리 하위 폴더 mtime (파일 추가/삭제 감지)
+    _mapping_cache: dict = {}
+
     def __init__(self, base_dir: str = ""):
         """
         Args:
@@ -5405,13 +5840,17 @@ class SFXManager:
     def _load_mapping(self) -> dict:
         """mapping.json 로드 → {tag: {file, volume, category}}"""
         mapping_path = os.path.join(self.sfx_dir, "mapping.json")
-        if not os.path.exists(mapping_path):
+        try:
+            stamp = self._mapping_stamp(mapping_path)
+        except OSError:
             print(f"  ⚠️  SFX mapping.json 없음: {mapping_path}")
             return {}
+        cached = self._mapping_cache.get(self.sfx_dir)
+        if cached and cached[0] == stamp:
+            return self._copy_mapping(cached[1])
         try:
             with open(mapping_path, "r", encoding="utf-8") as f:
-                import json as _json
-                data = _json.load(f)
+                data = json.load(f)
             # 파일 존재 확인
             valid = {}
             for tag, info in data.items():
@@ -5422,11 +5861,25 @@ class SFXManager:
                 else:
                     print(f"  ⚠️  SFX 파일 없음 (스킵): {full_path}")
             print(f"  🔊 SFX 로드: {len(valid)}/{len(data)}개 태그 사용 가능")
-            return valid
+            self._mapping_cache[self.sfx_dir] = (stamp, valid)
+            return self._copy_mapping(valid)
         except Exception as e:
             print(f"  ⚠️  SFX mapping.json 로드 실패: {e}")
             return {}
 
+    def _mapping_stamp(self, mapping_path: str) -> tuple:
+        """mapping.json + sfx 폴더 + 하위 폴더 mtime → 캐시 유효성 스탬프"""
+        stamp = [os.stat(mapping_path).st_mtime_ns, os.stat(self.sfx_dir).st_mtime_ns]
+        with os.scandir(self.sfx_dir) as it:
+            stamp.extend(sorted((e.name, e.stat().st_mtime_ns)
+                                for e in it if e.is_dir()))
+        return tuple(stamp)
+
+    @staticmethod
+    def _copy_mapping(mapping: dict) -> dict:
+        """캐시 공유 매핑 → 인스턴스별 사본 (호출측 수정이 캐시에 번지지 않게)"""
+        return {tag: dict(info) for tag, info in mapping.items()}
+
     def get_sfx_path(self, tag: str) -> str:
         """태그 → SFX 파일 경로 반환 (없으면 빈 문자열)"""
         info = self.mapping.get(tag, {})
@@ -5513,52 +5966,18 @@ class SFXManager:
             print(f"  ⚠️  SFX 믹싱: voice 파일 없음")
             return False
 
-        # SFX 5개 제한 (FFmpeg 필터 복잡도 관리)
-        if len(sfx_events) > 5:
-            print(f"  ⚠️  SFX {len(sfx_events)}개 → 5개로 제한")
-            sfx_events = sfx_events[:5]
-
         try:
-            # ── FFmpeg filter_complex 빌드 ──
-            # [0:a] = voice (기준)
-            # [1:a], [2:a], ... = SFX 파일들
-            #
-            # 각 SFX에 adelay + volume 적용 후 amix로 합침
-            inputs = ["-i", os.path.abspath(voice_path)]
-            filter_parts = []
-            mix_inputs = ["[0:a]"]  # voice는 항상 첫 번째
-            weights = ["1"]  # voice weight = 1.0
-
-            for i, evt in enumerate(sfx_events):
-                sfx_idx = i + 1  # FFmpeg 입력 인덱스 (0=voice)
-                inputs.extend(["-i", os.path.abspath(evt["sfx_path"])])
-
-                delay_ms = max(0, evt["start_ms"])
-                vol = evt["volume"]  # 이미 0.6 이하로 클램핑됨
-
-                # adelay로 시작 위치 조절 + volume 조절
-                filter_parts.append(
-                    f"[{sfx_idx}:a]adelay={delay_ms}|{delay_ms},"
-                    f"volume={vol:.2f}[sfx{i}]"
-                )
-                mix_inputs.append(f"[sfx{i}]")
-                weights.append("1")  # 개별 volume 이미 적용됨
-
-            # amix로 최종 믹싱
-            n_inputs = len(mix_inputs)
-            weight_str = " ".join(weights)
-            mix_label = "".join(mix_inputs)
-            filter_parts.append(
-                f"{mix_label}amix=inputs={n_inputs}:duration=first"
-                f":weights={weight_str}:normalize=0"
-            )
-
+            # [0:a] = voice (기준), [1:a], [2:a], ... = SFX 파일들
+            sfx_inputs, filter_parts, out_label = self.build_sfx_graph(
+                sfx_events, base_label="[0:a]", first_input=1)
+            inputs = ["-i", os.path.abspath(voice_path), *sfx_inputs]
             filter_complex = ";".join(filter_parts)
 
             cmd = [
                 FFMPEG_PATH, "-y",
                 *inputs,
                 "-filter_complex", filter_complex,
+                "-map", out_label,
                 "-c:a", "libmp3lame", "-b:a", "192k", "-ar", "44100",
                 os.path.abspath(output_path),
             ]
@@ -5585,6 +6004,52 @@ class SFXManager:
             print(f"  ⚠️  SFX 믹싱 오류: {e}")
             return False
 
+    def build_sfx_graph(self, sfx_events: list[dict], base_label: str,
+                        first_input: int) -> tuple[list, list, str]:
+        """SFX 오버레이용 filter_complex 조각 생성
+
+        v11.1: 별도 패스 없이 마스터링/BGM 그래프에 바로 이어붙일 수 있도록 분리.
+
+        Args:
+            sfx_events: collect_sfx_from_chunks() 결과
+            base_label: SFX를 얹을 기준 오디오 라벨 (예: "[0:a]", "[mixed]")
+            first_input: 첫 SFX 파일의 FFmpeg 입력 인덱스
+
+        Returns:
+            (입력 인자 리스트, 필터 리스트, 최종 출력 라벨)
+        """
+        # SFX 5개 제한 (FFmpeg 필터 복잡도 관리)
+        if len(sfx_events) > 5:
+            print(f"  ⚠️  SFX {len(sfx_events)}개 → 5개로 제한")
+            sfx_events = sfx_events[:5]
+
+        inputs = []
+        filter_parts = []
+        mix_inputs = [base_label]  # voice는 항상 첫 번째
+        weights = ["1"]  # voice weight = 1.0
+
+        for i, evt in enumerate(sfx_events):
+            sfx_idx = first_input + i
+            inputs.extend(["-i", os.path.abspath(evt["sfx_path"])])
+
+            delay_ms = max(0, evt["start_ms"])
+            vol = evt["volume"]  # 이미 0.6 이하로 클램핑됨
+
+            # adelay로 시작 위치 조절 + volume 조절
+            filter_parts.append(
+                f"[{sfx_idx}:a]adelay={delay_ms}|{delay_ms},"
+                f"volume={vol:.2f}[sfx{i}]"
+            )
+            mix_inputs.append(f"[sfx{i}]")
+            weights.append("1")  # 개별 volume 이미 적용됨
+
+        # amix로 최종 믹싱
+        filter_parts.append(
+            f"{''.join(mix_inputs)}amix=inputs={len(mix_inputs)}:duration=first"
+            f":weights={' '.join(weights)}:normalize=0[sfxmix]"
+        )
+        return inputs, filter_parts, "[sfxmix]"
+
     @property
     def available_tags(self) -> list[str]:
         """사용 가능한 SFX 태그 목록"""
@@ -5602,12 +6067,21 @@ class VideoAssembler:
     - 장면 전환: 스크린샷 간 부드러운 전환
     """
 
+    # v11.1: 감정별 그라데이션 폴백 캐시 {(emotion, w, h): Image}
+    _gradient_cache: dict = {}
+
     def __init__(self, config: Config):
         self.config = config
         self.w = config.width
         self.h = config.height
         self.font = FontManager.get_font(config.font_size)
         self.font_bold = FontManager.get_font(config.font_size_highlight, bold=True)
+        # v11.1: 정지 구간 자막 오버레이 1칸 캐시 ((chunk_idx, text, ...), RGBA)
+        # 청크는 시간순으로 한 번씩만 지나가므로 현재 청크 것만 보관 (~8MB)
+        self._subtitle_overlay_slot = None
+        # v11.1: 자막 레이아웃(줄바꿈/세그먼트/폭) 캐시 — 프레임마다 textbbox 재측정 방지
+        self._subtitle_layout_cache = {}
+        self._cta_overlay = None  # v11.1: 완전 불투명 CTA 오버레이 (프레임 불변)
 
     def assemble(self, script_data: dict, chunks: list[dict],
                  screenshots: list[str], work_dir: str,
@@ -5632,6 +6106,9 @@ class VideoAssembler:
         # chunk_idx 자동 삽입 (자막 색상 번갈아 표시용)
         for ci, chunk in enumerate(chunks):
             chunk["chunk_idx"] = ci
+        self._subtitle_overlay_slot = None
+        self._subtitle_layout_cache.clear()
+        self._cta_overlay = None
 
         # Step 1: 오디오 합치기
         concat_audio = os.path.join(work_dir, "full_audio.mp3")
@@ -5649,86 +6126,59 @@ class VideoAssembler:
                 bg_video = vp
                 break
 
-        if not bg_video:
-            # 폴백: 검정 배경 생성
-            print("  ⚠️  Satisfying 배경 없음 → 검정 배경 폴백")
-            bg_video = os.path.join(work_dir, "black_bg.mp4")
-            cmd_bg = [
+        # Step 3: 배경 루프 + Mute + Dimming → 배경 프레임 JPG 직접 출력
+        # v11.1: 루프 mp4 인코딩 → 재디코딩 2패스를 1패스로 융합 (중간 파일 없음)
+        frames_dir = os.path.join(work_dir, "frames")
+        os.makedirs(frames_dir, exist_ok=True)
+        bg_frames_dir = os.path.join(work_dir, "_bg_frames")
+        os.makedirs(bg_frames_dir, exist_ok=True)
+        bg_pattern = os.path.join(bg_frames_dir, "bg_%06d.jpg")
+
+        bg_ok = False
+        if bg_video:
+            print(f"  🔄 배경 비디오 루프 + Dimming → 프레임 추출 중...")
+            # FFmpeg: stream_loop으로 루프 + eq=brightness로 어둡게 + 약한 blur
+            cmd_loop = [
                 FFMPEG_PATH, "-y",
-                "-f", "lavfi", "-i",
-                f"color=c=black:s={self.w}x{self.h}:r={self.config.fps}:d={total_sec + 1}",
-                "-c:v", "libx264", "-preset", "ultrafast", "-crf", "23",
-                "-pix_fmt", "yuv420p",
-                os.path.abspath(bg_video),
+                "-stream_loop", "-1",  # 무한 루프
+                "-i", os.path.abspath(bg_video),
+                "-t", f"{total_sec + 0.5}",  # 전체 길이
+                "-vf", (
+                    f"scale={self.w}:{self.h}:force_original_aspect_ratio=increase,"
+                    f"crop={self.w}:{self.h},"
+                    f"eq=brightness=-0.12:contrast=1.1,"
+                    f"gblur=sigma=1.5"
+                ),
+                "-map", "0:v:0", "-an", "-sn", "-dn",  # 영상 1트랙만 (오디오 Mute)
+                "-r", str(self.config.fps),
+                "-q:v", "2",
+                os.path.abspath(bg_pattern),
             ]
-            subprocess.run(cmd_bg, capture_output=True, text=True,
-                           encoding="utf-8", errors="replace", timeout=60)
-
-        # Step 3: 배경 루프 + Mute + Dimming → 중간 파일
-        print(f"  🔄 배경 비디오 루프 + Dimming 처리 중...")
-        looped_bg = os.path.join(work_dir, "looped_bg.mp4")
-
-        # FFmpeg: stream_loop으로 루프 + eq=brightness로 어둡게 + 약한 blur
-        cmd_loop = [
-            FFMPEG_PATH, "-y",
-            "-stream_loop", "-1",  # 무한 루프
-            "-i", os.path.abspath(bg_video),
-            "-t", f"{total_sec + 0.5}",  # 전체 길이
-            "-vf", (
-                f"scale={self.w}:{self.h}:force_original_aspect_ratio=increase,"
-                f"crop={self.w}:{self.h},"
-                f"eq=brightness=-0.12:contrast=1.1,"
-                f"gblur=sigma=1.5"
-            ),
-            "-an",  # 오디오 Mute
-            "-c:v", "libx264",
-            "-preset", "fast",
-            "-crf", "18",
-            "-pix_fmt", "yuv420p",
-            "-r", str(self.config.fps),
-            os.path.abspath(looped_bg),
-        ]
+            result = subprocess.run(cmd_loop, capture_output=True, text=True,
+                                    encoding="utf-8", errors="replace", timeout=300)
+            bg_ok = result.returncode == 0
+            if not bg_ok:
+                print(f"  ⚠️  배경 루프 실패: {result.stderr[-300:] if result.stderr else ''}")
+        else:
+            print("  ⚠️  Satisfying 배경 없음 → 검정 배경 폴백")
 
-        result = subprocess.run(cmd_loop, capture_output=True, text=True,
-                                encoding="utf-8", errors="replace", timeout=180)
-        if result.returncode != 0:
-            print(f"  ⚠️  배경 루프 실패: {result.stderr[-300:] if result.stderr else ''}")
-            # 폴백: 검정 배경
+        if not bg_ok:
+            # 폴백: 검정 배경 프레임
             cmd_bg = [
                 FFMPEG_PATH, "-y",
                 "-f", "lavfi", "-i",
-                f"color=c=black:s={self.w}x{self.h}:r={self.config.fps}:d={total_sec + 1}",
-                "-c:v", "libx264", "-preset", "ultrafast", "-crf", "23",
-                "-pix_fmt", "yuv420p",
-                os.path.abspath(looped_bg),
+                f"color=c=black:s={self.w}x{self.h}:r={self.config.fps}:d={total_sec + 0.5}",
+                "-q:v", "2",
+                os.path.abspath(bg_pattern),
             ]
             subprocess.run(cmd_bg, capture_output=True, text=True,
-                           encoding="utf-8", errors="replace", timeout=60)
-
-        print(f"  ✅ 배경 루프 완료!")
-
-        # Step 4: ASS 자막 파일 생성 (FFmpeg drawtext 대신 Pillow 프레임 렌더링)
-        # → Pillow 렌더링이 폰트 제어에 더 유리
-        frames_dir = os.path.join(work_dir, "frames")
-        os.makedirs(frames_dir, exist_ok=True)
+                           encoding="utf-8", errors="replace", timeout=120)
 
-        # 배경 비디오에서 프레임 추출
-        print(f"  🎞️  배경 프레임 추출 중...")
-        bg_frames_dir = os.path.join(work_dir, "_bg_frames")
-        os.makedirs(bg_frames_dir, exist_ok=True)
-
-        bg_pattern = os.path.join(bg_frames_dir, "bg_%06d.jpg")
-        cmd_extract = [
-            FFMPEG_PATH, "-y",
-            "-i", os.path.abspath(looped_bg),
-            "-q:v", "2",
-            os.path.abspath(bg_pattern),
-        ]
-        subprocess.run(cmd_extract, capture_output=True, text=True,
-                        encoding="utf-8", errors="replace", timeout=300)
+        print(f"  ✅ 배경 프레임 준비 완료!")
 
         # 추출된 배경 프레임 로드
-        bg_frame_files = sorted([f for f in os.listdir(bg_frames_dir) if f.endswith(".jpg")])
+        with os.scandir(bg_frames_dir) as it:
+            bg_frame_files = sorted(e.name for e in it if e.name.endswith(".jpg"))
         total_frames = len(bg_frame_files)
         if total_frames == 0:
             total_frames = int(total_sec * self.config.fps)
@@ -5754,53 +6204,71 @@ class VideoAssembler:
                     except Exception:
                         _bg_cache[bg_path] = None
                 cached = _bg_cache.get(bg_path)
-                return cached.copy() if cached else self._create_cinematic_gradient("neutral")
+                # v11.1: 렌더 단계는 전부 새 이미지를 반환(원본 불변) → 방어적 copy() 불필요
+                return cached if cached else self._create_cinematic_gradient("neutral")
             return self._create_cinematic_gradient("neutral")
 
         # 배경 캐시 크기 제한 (메모리 절약 — 최근 60프레임만)
-        cache_limit = self.config.fps * 2
-
-        for frame_idx in range(total_frames):
-            current_time_ms = (frame_idx / self.config.fps) * 1000
-
-            # 배경 프레임 로드 (캐시 활용)
-            frame = _load_bg_frame(frame_idx)
-
-            # 캐시 크기 제한
-            if len(_bg_cache) > cache_limit:
-                oldest_key = next(iter(_bg_cache))
-                del _bg_cache[oldest_key]
-
-            # 현재 대사 찾기
-            active_chunk = None
-            for ci, chunk in enumerate(chunks):
-                if chunk["start_ms"] <= current_time_ms <= chunk["end_ms"]:
-                    active_chunk = chunk
-                    break
+        fps = self.config.fps  # v11.1: 프레임 루프 불변값은 루프 밖에서 1회
+        cache_limit = fps * 2
+        progress_every = fps * 10
+        frame_prefix = os.path.join(frames_dir, "frame_")
+        # v11.1: JPEG 인코딩(PIL이 GIL 해제)은 워커 스레드에서 → 다음 프레임 렌더링과 겹침
+        save_pool = ThreadPoolExecutor(max_workers=2)
+        pending_saves = deque()
+
+        # 렌더링 도중 예외가 나도 대기 중 저장은 취소하고 워커 종료를 기다림
+        # (예외 처리/정리 경로와 frames_dir 쓰기가 겹치지 않도록)
+        try:
+            for frame_idx in range(total_frames):
+                current_time_ms = (frame_idx / fps) * 1000
+
+                # 배경 프레임 로드 (캐시 활용)
+                frame = _load_bg_frame(frame_idx)
+
+                # 캐시 크기 제한
+                if len(_bg_cache) > cache_limit:
+                    oldest_key = next(iter(_bg_cache))
+                    del _bg_cache[oldest_key]
+
+                # 현재 대사 찾기
+                active_chunk = None
+                for ci, chunk in enumerate(chunks):
+                    if chunk["start_ms"] <= current_time_ms <= chunk["end_ms"]:
+                        active_chunk = chunk
+                        break
 
-            # v9.0 현대적 자막 렌더링
-            if active_chunk:
-                frame = self._render_subtitle(frame, active_chunk, current_time_ms)
+                # v9.0 현대적 자막 렌더링
+                if active_chunk:
+                    frame = self._render_subtitle(frame, active_chunk, current_time_ms)
 
-            # 아웃트로: 마지막 2초
-            remaining_sec = (total_ms - current_time_ms) / 1000
-            if 0 <= remaining_sec <= 2.0:
-                frame = self._render_cta_outro(frame, remaining_sec)
+                # 아웃트로: 마지막 2초
+                remaining_sec = (total_ms - current_time_ms) / 1000
+                if 0 <= remaining_sec <= 2.0:
+                    frame = self._render_cta_outro(frame, remaining_sec)
 
-            # 저장 (JPEG quality 85 → 파일 크기 20% 감소, 시각 차이 무)
-            frame_path = os.path.join(frames_dir, f"frame_{frame_idx:06d}.jpg")
-            frame.save(frame_path, quality=85)
+                # 저장 (JPEG quality 85 → 파일 크기 20% 감소, 시각 차이 무)
+                self._save_frame_async(save_pool, pending_saves, frame,
+                                       f"{frame_prefix}{frame_idx:06d}.jpg", 85)
 
-            # 진행률 (10초마다)
-            if frame_idx % (self.config.fps * 10) == 0:
-                pct = (frame_idx / max(1, total_frames)) * 100
-                print(f"  📊 렌더링 진행: {pct:.0f}% ({frame_idx}/{total_frames})")
+                # 진행률 (10초마다)
+                if frame_idx % progress_every == 0:
+                    pct = (frame_idx / max(1, total_frames)) * 100
+                    print(f"  📊 렌더링 진행: {pct:.0f}% ({frame_idx}/{total_frames})")
 
+            for fut in pending_saves:
+                fut.result()
+        finally:
+            save_pool.shutdown(wait=True, cancel_futures=True)
         print(f"  ✅ 프레임 렌더링 완료!")
 
+        # v11.1: 인코딩 전에 배경 프레임 캐시 해제
+        _bg_cache.clear()
+        gc.collect()
+
         # Step 5: FFmpeg 최종 인코딩
-        title_safe = re.sub(r'[^\w가-힣]', '_',
-                            script_data.get("title", "shorts"))[:20]
+        title_safe = _SAFE_TITLE_RE.sub('_',
+                                     script_data.get("title", "shorts"))[:20]
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_filename = f"shorts_{title_safe}_{timestamp}.mp4"
         output_path = os.path.join(self.config.output_dir, output_filename)
@@ -5813,14 +6281,13 @@ class VideoAssembler:
 
         print(f"  🔧 FFmpeg CRF 인코딩 중...")
 
-        cmd = [
+        cmd_head = [
             FFMPEG_PATH, "-y",
             "-framerate", str(self.config.fps),
             "-i", abs_frames_pattern,
             "-i", abs_audio,
-            "-c:v", "libx264",
-            "-preset", "medium",
-            "-crf", "20",
+        ]
+        cmd_tail = [
             "-profile:v", "high",
             "-level", "4.1",
             "-maxrate", "8000k",
@@ -5835,8 +6302,7 @@ class VideoAssembler:
             abs_output,
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True,
-                                encoding="utf-8", errors="replace")
+        result = self._encode_video(cmd_head, cmd_tail)
 
         if result.returncode != 0:
             print(f"  ⚠️  FFmpeg 에러: {result.stderr[-500:] if result.stderr else 'unknown'}")
@@ -5851,11 +6317,46 @@ class VideoAssembler:
         # 임시 파일 정리
         shutil.rmtree(frames_dir, ignore_errors=True)
         shutil.rmtree(bg_frames_dir, ignore_errors=True)
-        if os.path.exists(looped_bg):
-            os.remove(looped_bg)
 
         return output_path
 
+    # v11.1: 검정 alpha 50 오버레이와 동일한 밝기 감소 LUT (x * 205/255)
+    _DIM_LUT = [int(v * 205 / 255 + 0.5) for v in range(256)] * 3
+
+    def _dim(self, img: Image.Image) -> Image.Image:
+        """Dimming(자막 가독성) — 프레임마다 RGBA 오버레이 합성 대신 LUT 1회 적용
+
+        Ken Burns(리사이즈)·crossfade(blend)·흑백 전환 모두 선형이라
+        소스에 미리 적용해도 결과 동일.
+        """
+        return img.point(self._DIM_LUT)
+
+    @staticmethod
+    def _save_frame_async(pool, pending: deque, frame: Image.Image,
+                          path: str, quality: int, max_pending: int = 8):
+        """프레임 JPEG 저장을 pool에 제출. 대기 중 프레임은 max_pending개로 제한 (메모리)"""
+        pending.append(pool.submit(frame.save, path, quality=quality))
+        if len(pending) > max_pending:
+            pending.popleft().result()  # 저장 실패 시 예외를 렌더 루프로 전파
+
+    def _encode_video(self, cmd_head: list, cmd_tail: list):
+        """v11.1: HW 인코더 우선 최종 인코딩 → 실패 시 libx264로 1회 재시도"""
+        video_args = _h264_encoder_args(self.config.x264_preset, self.config.x264_crf,
+                                        use_hw=self.config.hw_encoder)
+        tail = cmd_tail
+        if video_args[1] == "h264_qsv":
+            # QSV는 nv12 입력만 받음
+            tail = ["nv12" if a == "yuv420p" else a for a in cmd_tail]
+        result = subprocess.run(cmd_head + video_args + tail, capture_output=True,
+                                text=True, encoding="utf-8", errors="replace")
+        if result.returncode != 0 and video_args[1] != "libx264":
+            print(f"  ⚠️  HW 인코딩 실패 ({video_args[1]}) → libx264 재시도...")
+            sw_args = _h264_encoder_args(self.config.x264_preset, self.config.x264_crf,
+                                         use_hw=False)
+            result = subprocess.run(cmd_head + sw_args + cmd_tail, capture_output=True,
+                                    text=True, encoding="utf-8", errors="replace")
+        return result
+
     def _create_cinematic_gradient(self, emotion: str = "neutral") -> Image.Image:
         """v9.0: 감정별 3색 메시 그라데이션 배경 (비디오 없을 때 폴백)
 
@@ -5877,28 +6378,23 @@ class VideoAssembler:
             "surprise": [(40, 15, 10), (25, 12, 28), (12, 15, 38)],
             "relief":   [(15, 25, 20), (18, 20, 28), (22, 18, 35)],
         }
+        # v11.1: 프레임마다 호출되는 폴백 → (감정, 크기)별 1회만 생성
+        cache_key = (emotion if emotion in EMOTION_COLORS_3 else "neutral", self.w, self.h)
+        cached = self._gradient_cache.get(cache_key)
+        if cached is not None:
+            return cached.copy()
+
         colors = EMOTION_COLORS_3.get(emotion, EMOTION_COLORS_3["neutral"])
         c1, c2, c3 = colors
 
+        # v11.1: 상단→중간 / 중간→하단 2구간을 각각 linear_gradient로 만들어 이어붙임
+        mid_point = int(self.h * 0.45)  # 상단~중간 전환점
         img = Image.new("RGB", (self.w, self.h))
-        draw = ImageDraw.Draw(img)
-        mid_point = self.h * 0.45  # 상단~중간 전환점
-
-        for y in range(self.h):
-            if y < mid_point:
-                # 상단 → 중간
-                ratio = y / mid_point
-                r = int(c1[0] * (1 - ratio) + c2[0] * ratio)
-                g = int(c1[1] * (1 - ratio) + c2[1] * ratio)
-                b = int(c1[2] * (1 - ratio) + c2[2] * ratio)
-            else:
-                # 중간 → 하단
-                ratio = (y - mid_point) / (self.h - mid_point)
-                r = int(c2[0] * (1 - ratio) + c3[0] * ratio)
-                g = int(c2[1] * (1 - ratio) + c3[1] * ratio)
-                b = int(c2[2] * (1 - ratio) + c3[2] * ratio)
-            draw.line([(0, y), (self.w, y)], fill=(r, g, b))
-        return img
+        img.paste(self._vertical_gradient(self.w, mid_point, c1, c2), (0, 0))
+        img.paste(self._vertical_gradient(self.w, self.h - mid_point, c2, c3),
+                  (0, mid_point))
+        self._gradient_cache[cache_key] = img
+        return img.copy()
 
     def _generate_ai_image(self, scene_hint: str, work_dir: str,
                             idx: int, context_text: str = "") -> Optional[str]:
@@ -5922,17 +6418,20 @@ class VideoAssembler:
             else:
                 c1, c2 = (20, 22, 30), (35, 25, 20)
 
-            img = Image.new("RGB", (w, h))
-            for y in range(h):
-                ratio = y / h
-                r = int(c1[0] + (c2[0] - c1[0]) * ratio)
-                g = int(c1[1] + (c2[1] - c1[1]) * ratio)
-                b = int(c1[2] + (c2[2] - c1[2]) * ratio)
-                for x in range(w):
-                    img.putpixel((x, y), (r, g, b))
-
-            path = os.path.join(work_dir, f"ai_bg_{idx:03d}.png")
-            img.save(path, quality=85)
+            # v11.1: 색상·크기로 결정되는 결과물 → 디스크 캐시 (있으면 생성 스킵)
+            cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                     "data", "cache", "gradients")
+            os.makedirs(cache_dir, exist_ok=True)
+            c1_hex = "".join(f"{v:02x}" for v in c1)
+            c2_hex = "".join(f"{v:02x}" for v in c2)
+            path = os.path.join(cache_dir, f"grad_{w}x{h}_{c1_hex}_{c2_hex}.png")
+            if os.path.exists(path):
+                return path
+
+            # v11.1: putpixel 200만회 → 1px 컬럼 1회 계산 후 가로 확장
+            img = self._vertical_gradient(w, h, c1, c2)
+            # 매끈한 그라데이션 → zlib 최저 레벨로도 충분히 작음
+            img.save(path, optimize=False, compress_level=1)
             print(f"    🎨 그라데이션 배경 생성: {scene_hint[:40]}...")
             return path
         except Exception as e:
@@ -5989,10 +6488,16 @@ class VideoAssembler:
 
                     # ▼ 배경 레이어: 1.5배 확대 + GaussianBlur(20px) + 어둡게
                     bg_w, bg_h = int(self.w * 1.5), int(self.h * 1.5)
-                    bg_layer = fitted.resize((bg_w, bg_h), Image.LANCZOS)
                     left = (bg_w - self.w) // 2
                     top = (bg_h - self.h) // 2
-                    bg_layer = bg_layer.crop((left, top, left + self.w, top + self.h))
+                    # v11.1: 1.5배 전체 확대본(1620x2880) 생성 후 crop 대신
+                    # 크롭될 원본 영역(box)만 바로 리사이즈 → 중간 버퍼/복사 생략
+                    sx, sy = fitted.width / bg_w, fitted.height / bg_h
+                    bg_layer = fitted.resize(
+                        (self.w, self.h), Image.LANCZOS,
+                        box=(left * sx, top * sy,
+                             (left + self.w) * sx, (top + self.h) * sy),
+                    )
                     bg_layer = bg_layer.filter(ImageFilter.GaussianBlur(radius=20))
                     enhancer = ImageEnhance.Brightness(bg_layer)
                     bg_layer = enhancer.enhance(0.30)
@@ -6074,19 +6579,30 @@ class VideoAssembler:
 
     def _create_gradient_bg(self, idx: int) -> Image.Image:
         """그라데이션 폴백 배경"""
-        img = Image.new("RGB", (self.w, self.h))
-        draw = ImageDraw.Draw(img)
         gradients = [
             [(30, 25, 40), (50, 35, 25)],
             [(25, 35, 30), (40, 25, 40)],
             [(35, 30, 25), (25, 30, 45)],
         ]
         c1, c2 = gradients[idx % len(gradients)]
-        for y in range(self.h):
-            r = y / self.h
-            color = tuple(int(c1[i] * (1-r) + c2[i] * r) for i in range(3))
-            draw.line([(0, y), (self.w, y)], fill=color)
-        return img
+        return self._vertical_gradient(self.w, self.h, c1, c2)
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _gradient_ramp(h: int) -> Image.Image:
+        """높이 h의 1px 폭 0→255 RGB 램프 (높이별 1회 생성 후 재사용)"""
+        return Image.linear_gradient("L").resize((1, h)).convert("RGB")
+
+    @staticmethod
+    def _vertical_gradient(w: int, h: int, c1: tuple, c2: tuple) -> Image.Image:
+        """v11.1: 세로 2색 그라데이션 — Pillow C 프리미티브만 사용
+
+        기존: draw.line / putpixel 행·픽셀 단위 파이썬 루프
+        현재: 캐시된 램프 → RGB 3채널 LUT(768) point() 1회 → 가로 확장
+        """
+        lut = [int(a + (b - a) * v / 255) for a, b in zip(c1, c2) for v in range(256)]
+        column = VideoAssembler._gradient_ramp(h).point(lut)
+        return column.resize((w, h), Image.NEAREST)
 
     def _render_title_bar(self, frame: Image.Image, title: str,
                            alpha: float = 1.0) -> Image.Image:
@@ -6108,9 +6624,13 @@ class VideoAssembler:
         a = int(220 * alpha)
 
         # 배경: 그라데이션 (위쪽 불투명 → 아래쪽 반투명)
-        for y in range(bar_h + 10):
-            fade = max(0, a - int(y * 1.5))
-            draw.line([(0, y), (self.w, y)], fill=(10, 10, 10, fade))
+        # v11.1: 행마다 draw.line 대신 1px 알파 컬럼 → 가로 확장 → 1회 paste
+        fade_h = bar_h + 10
+        fade_col = Image.frombytes(
+            "L", (1, fade_h), bytes(max(0, a - int(y * 1.5)) for y in range(fade_h)))
+        fade = Image.new("RGBA", (self.w, fade_h), (10, 10, 10, 0))
+        fade.putalpha(fade_col.resize((self.w, fade_h), Image.NEAREST))
+        overlay.paste(fade, (0, 0))
 
         # 노란색 악센트 라인 (상단 3px)
         draw.rectangle([(0, 0), (self.w, 3)], fill=(255, 220, 0, a))
@@ -6133,12 +6653,17 @@ class VideoAssembler:
         숏츠에서 "좋아요/구독" 직접 유도는 역효과.
         대신 마지막 열린 질문을 크게 표시 + 댓글 아이콘으로 자연스럽게 유도.
         """
-        overlay = Image.new("RGBA", (self.w, self.h), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay)
-
         # 페이드인 (0→1 over 0.4초)
         alpha = min(1.0, (2.0 - remaining_sec) / 0.4)
 
+        # v11.1: 페이드인 이후(마지막 ~1.6초) 오버레이는 매 프레임 동일 → 1회 렌더 후 재사용
+        if alpha >= 1.0 and self._cta_overlay is not None:
+            frame = frame.convert("RGBA")
+            return Image.alpha_composite(frame, self._cta_overlay).convert("RGB")
+
+        overlay = Image.new("RGBA", (self.w, self.h), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(overlay)
+
         # 댓글 아이콘 (💬) + "댓글로 알려줘" 작은 텍스트
         font_icon = FontManager.get_font(40, bold=True)
         font_hint = FontManager.get_font(24, bold=False)
@@ -6167,6 +6692,9 @@ class VideoAssembler:
                    fill=(255, 255, 255, a),
                    stroke_width=2, stroke_fill=(0, 0, 0, a))
 
+        if alpha >= 1.0:
+            self._cta_overlay = overlay
+
         frame = frame.convert("RGBA")
         return Image.alpha_composite(frame, overlay).convert("RGB")
 
@@ -6194,22 +6722,27 @@ class VideoAssembler:
         alpha = 1.0
         fade_in_ms = 120
         fade_out_ms = 80
+
+        # v11.1: 등장/팝 애니메이션(~400ms)과 페이드아웃 사이 구간은 오버레이가 불변
+        # → 청크당 1회만 그리고 이후 프레임은 alpha_composite(C)만 수행
+        #   강조 단어가 없으면 팝 효과가 없으므로 페이드인(슬라이드) 직후부터 불변
+        anim_ms = 400 if important_words else fade_in_ms
+        is_static = elapsed >= anim_ms and remaining >= fade_out_ms
+        cache_key = (chunk.get("chunk_idx", -1), text, is_highlight, tuple(important_words))
+        if is_static:
+            slot = self._subtitle_overlay_slot
+            if slot is not None and slot[0] == cache_key:
+                frame = frame.convert("RGBA")
+                return Image.alpha_composite(frame, slot[1]).convert("RGB")
         if elapsed < fade_in_ms:
             alpha = elapsed / fade_in_ms
         elif remaining < fade_out_ms:
             alpha = remaining / fade_out_ms
         alpha = max(0.0, min(1.0, alpha))
 
-        # ── 폰트 (v10.0: 1.4배 크기 증가) ──
-        base_font_size = int(self.config.font_size * 1.96)  # 56 * 1.96 ≈ 110px
-        # 첫 자막 1.6배 (오프닝 임팩트)
         chunk_idx = chunk.get("chunk_idx", -1)
-        if chunk_idx == 0:
-            base_font_size = int(base_font_size * 1.6)
-        if is_highlight:
-            base_font_size = int(base_font_size * 1.15)
-        font = FontManager.get_shorts_font(base_font_size)
-        font_big = FontManager.get_shorts_font(int(base_font_size * 1.15))
+        font, font_big, lines, line_widths, line_heights, line_segments = \
+            self._subtitle_layout(text, is_highlight, chunk_idx == 0, important_words)
         stroke_px = 4
 
         # ── 색상 ──
@@ -6221,18 +6754,6 @@ class VideoAssembler:
 
         has_kinetic = bool(important_words)
 
-        # ── 줄바꿈 (단어 경계 기준) ──
-        max_chars = 14
-        lines = self._word_boundary_wrap(text, max_chars)
-
-        # ── 측정 ──
-        draw_temp = ImageDraw.Draw(frame)
-        line_heights, line_widths = [], []
-        for line in lines:
-            bbox = draw_temp.textbbox((0, 0), line, font=font, stroke_width=stroke_px)
-            line_widths.append(bbox[2] - bbox[0])
-            line_heights.append(bbox[3] - bbox[1])
-
         line_gap = 10
         total_h = sum(line_heights) + (len(lines) - 1) * line_gap
 
@@ -6277,16 +6798,10 @@ class VideoAssembler:
         # ── 텍스트 렌더링 ──
         text_y = text_block_y
         for i, line in enumerate(lines):
-            segments = self._segment_important(line, important_words)
-            total_seg_w = 0
-            for seg_text, is_imp in segments:
-                seg_font = font_big if is_imp else font
-                bbox = draw_temp.textbbox((0, 0), seg_text, font=seg_font, stroke_width=stroke_px)
-                total_seg_w += bbox[2] - bbox[0]
-
+            segments, total_seg_w = line_segments[i]
             cursor_x = (self.w - total_seg_w) // 2
 
-            for seg_text, is_imp in segments:
+            for seg_text, is_imp, seg_w in segments:
                 if is_imp and has_kinetic:
                     seg_font = font_big
                     seg_color = imp_color
@@ -6296,8 +6811,6 @@ class VideoAssembler:
                     seg_color = text_color
                     y_offset = 0
 
-                seg_bbox = draw_temp.textbbox((0, 0), seg_text, font=seg_font, stroke_width=stroke_px)
-                seg_w = seg_bbox[2] - seg_bbox[0]
                 seg_y = text_y + y_offset
 
                 # 1) 드롭 섀도우 (4px offset, 살짝 블러 느낌)
@@ -6323,10 +6836,63 @@ class VideoAssembler:
 
             text_y += line_heights[i] + line_gap
 
+        if is_static:
+            self._subtitle_overlay_slot = (cache_key, overlay)
+
         frame = frame.convert("RGBA")
         frame = Image.alpha_composite(frame, overlay)
         return frame.convert("RGB")
 
+    def _subtitle_layout(self, text: str, is_highlight: bool, is_first: bool,
+                         important_words: list) -> tuple:
+        """자막 폰트/줄바꿈/세그먼트 폭 측정 (청크당 1회 — 알파/애니메이션과 무관)"""
+        key = (text, is_highlight, is_first, tuple(important_words))
+        cached = self._subtitle_layout_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # ── 폰트 (v10.0: 1.4배 크기 증가) ──
+        base_font_size = int(self.config.font_size * 1.96)  # 56 * 1.96 ≈ 110px
+        # 첫 자막 1.6배 (오프닝 임팩트)
+        if is_first:
+            base_font_size = int(base_font_size * 1.6)
+        if is_highlight:
+            base_font_size = int(base_font_size * 1.15)
+        font = FontManager.get_shorts_font(base_font_size)
+        font_big = FontManager.get_shorts_font(int(base_font_size * 1.15))
+        stroke_px = 4
+
+        # ── 줄바꿈 (단어 경계 기준) ──
+        max_chars = 14
+        lines = self._word_boundary_wrap(text, max_chars)
+
+        # ── 측정 ──
+        draw_temp = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+        line_heights, line_widths, line_segments = [], [], []
+        for line in lines:
+            bbox = draw_temp.textbbox((0, 0), line, font=font, stroke_width=stroke_px)
+            line_w = bbox[2] - bbox[0]
+            line_widths.append(line_w)
+            line_heights.append(bbox[3] - bbox[1])
+            raw_segments = self._segment_important(line, important_words)
+            # 강조 단어 없는 줄(대부분) = 세그먼트 1개 = 줄 전체 → 방금 잰 폭 재사용
+            if len(raw_segments) == 1 and not raw_segments[0][1]:
+                line_segments.append(([(line, False, line_w)], line_w))
+                continue
+            segments = []
+            total_seg_w = 0
+            for seg_text, is_imp in raw_segments:
+                seg_font = font_big if is_imp else font
+                sb = draw_temp.textbbox((0, 0), seg_text, font=seg_font, stroke_width=stroke_px)
+                seg_w = sb[2] - sb[0]
+                segments.append((seg_text, is_imp, seg_w))
+                total_seg_w += seg_w
+            line_segments.append((segments, total_seg_w))
+
+        layout = (font, font_big, lines, line_widths, line_heights, line_segments)
+        self._subtitle_layout_cache[key] = layout
+        return layout
+
     def _word_boundary_wrap(self, text: str, max_chars: int) -> list[str]:
         """단어 경계 기준 줄바꿈 (글자수 기준보다 자연스러움)"""
         if len(text) <= max_chars:
@@ -6374,6 +6940,9 @@ class VideoAssembler:
         # chunk_idx 삽입
         for ci, chunk in enumerate(chunks):
             chunk["chunk_idx"] = ci
+        self._subtitle_overlay_slot = None
+        self._subtitle_layout_cache.clear()
+        self._cta_overlay = None
 
         # Step 1: 오디오
         concat_audio = os.path.join(work_dir, "full_audio.mp3")
@@ -6414,7 +6983,7 @@ class VideoAssembler:
                 try:
                     img = Image.open(ipath).convert("RGB")
                     img = img.resize((self.w, self.h), Image.LANCZOS)
-                    img_cache[ipath] = img
+                    img_cache[ipath] = self._dim(img)
                 except Exception:
                     img_cache[ipath] = None
 
@@ -6423,9 +6992,17 @@ class VideoAssembler:
         for st in scene_timeline:
             clip_path = st[3]
             if clip_path and clip_path not in clip_frame_cache and os.path.exists(clip_path):
-                clip_frame_cache[clip_path] = self._extract_clip_frames(
+                clip_frames = self._extract_clip_frames(
                     clip_path, self.config.fps, self.w, self.h
                 )
+                for fi in range(len(clip_frames)):
+                    clip_frames[fi] = self._dim(clip_frames[fi])
+                clip_frame_cache[clip_path] = clip_frames
+        # 클립별 마지막 사용 시점 → 지나간 클립 프레임은 렌더링 도중 즉시 해제
+        clip_last_ms = {}
+        for s_ms, e_ms, _, clip_path in scene_timeline:
+            if clip_path in clip_frame_cache:
+                clip_last_ms[clip_path] = max(e_ms, clip_last_ms.get(clip_path, 0))
 
         # 장면 전환 시간 계산
         _scene_highlights = {}
@@ -6437,117 +7014,138 @@ class VideoAssembler:
 
         prev_scene_idx = -1
         prev_frame = None
+        # v11.1: 프레임 루프 불변값은 루프 밖에서 1회
+        fps = self.config.fps
+        progress_every = fps * 10
+        frame_prefix = os.path.join(frames_dir, "frame_")
+        # v11.1: JPEG 인코딩(PIL이 GIL 해제)은 워커 스레드에서 → 다음 프레임 렌더링과 겹침
+        save_pool = ThreadPoolExecutor(max_workers=2)
+        pending_saves = deque()
+
+        # 렌더링 도중 예외가 나도 대기 중 저장은 취소하고 워커 종료를 기다림
+        # (예외 처리/정리 경로와 frames_dir 쓰기가 겹치지 않도록)
+        try:
+            for frame_idx in range(total_frames):
+                current_ms = (frame_idx / fps) * 1000
+
+                # 현재 장면 찾기
+                current_img_path = None
+                current_clip_path = None
+                scene_start_ms = 0
+                scene_end_ms = total_ms
+                scene_idx = 0
+                for si, (s_ms, e_ms, ipath, cpath) in enumerate(scene_timeline):
+                    if s_ms <= current_ms <= e_ms:
+                        current_img_path = ipath
+                        current_clip_path = cpath
+                        scene_start_ms = s_ms
+                        scene_end_ms = e_ms
+                        scene_idx = si
+                        break
 
-        for frame_idx in range(total_frames):
-            current_ms = (frame_idx / self.config.fps) * 1000
-
-            # 현재 장면 찾기
-            current_img_path = None
-            current_clip_path = None
-            scene_start_ms = 0
-            scene_end_ms = total_ms
-            scene_idx = 0
-            for si, (s_ms, e_ms, ipath, cpath) in enumerate(scene_timeline):
-                if s_ms <= current_ms <= e_ms:
-                    current_img_path = ipath
-                    current_clip_path = cpath
-                    scene_start_ms = s_ms
-                    scene_end_ms = e_ms
-                    scene_idx = si
-                    break
-
-            cur_emotion = self._get_current_emotion(chunks, current_ms)
-
-            # ★ 클립 장면: 클립 프레임 직접 사용 (Ken Burns 스킵)
-            if current_clip_path and current_clip_path in clip_frame_cache:
-                clip_frames = clip_frame_cache[current_clip_path]
-                if clip_frames:
-                    elapsed_in_scene_ms = current_ms - scene_start_ms
-                    # 클립 내 프레임 인덱스 (루프 재생)
-                    clip_frame_idx = int((elapsed_in_scene_ms / 1000.0) * self.config.fps)
-                    clip_frame_idx = clip_frame_idx % len(clip_frames)
-                    frame = clip_frames[clip_frame_idx].copy()
-                else:
-                    frame = self._create_cinematic_gradient(cur_emotion)
-            else:
-                # 이미지 장면: 기존 Ken Burns 로직
-                base_img = img_cache.get(current_img_path)
-                if base_img:
-                    frame = base_img.copy()
-                else:
-                    frame = self._create_cinematic_gradient(cur_emotion)
-
-                frame = self._apply_ken_burns(frame, current_ms,
-                                               scene_start_ms, scene_end_ms, scene_idx,
-                                               emotion=cur_emotion)
-
-            # ★ 장면 전환 효과 (crossfade / 흑백→컬러 / 빠른컷)
-            scene_key = current_clip_path or current_img_path
-            if scene_idx != prev_scene_idx and prev_scene_idx >= 0 and prev_frame:
-                elapsed_in_scene = current_ms - scene_start_ms
-                is_highlight = _scene_highlights.get(scene_key, False)
-
-                if cur_emotion == "shocked":
-                    trans_ms = 100
-                elif is_highlight:
-                    trans_ms = 300
+                cur_emotion = self._get_current_emotion(chunks, current_ms)
+
+                # ★ 클립 장면: 클립 프레임 직접 사용 (Ken Burns 스킵)
+                if current_clip_path and current_clip_path in clip_frame_cache:
+                    clip_frames = clip_frame_cache[current_clip_path]
+                    if clip_frames:
+                        elapsed_in_scene_ms = current_ms - scene_start_ms
+                        # 클립 내 프레임 인덱스 (루프 재생)
+                        clip_frame_idx = int((elapsed_in_scene_ms / 1000.0) * fps)
+                        clip_frame_idx = clip_frame_idx % len(clip_frames)
+                        # v11.1: 이후 단계(blend/자막/페이드)는 새 이미지를 반환 → copy() 생략
+                        frame = clip_frames[clip_frame_idx]
+                    else:
+                        frame = self._dim(self._create_cinematic_gradient(cur_emotion))
                 else:
-                    trans_ms = 300
-
-                if elapsed_in_scene < trans_ms:
-                    blend_ratio = elapsed_in_scene / trans_ms
-                    if is_highlight and cur_emotion != "shocked":
-                        from PIL import ImageOps
-                        gray_prev = ImageOps.grayscale(prev_frame).convert("RGB")
-                        frame = Image.blend(gray_prev, frame, blend_ratio)
+                    # 이미지 장면: 기존 Ken Burns 로직
+                    base_img = img_cache.get(current_img_path)
+                    if base_img:
+                        frame = base_img  # Ken Burns resize/crop이 새 이미지 생성
                     else:
-                        frame = Image.blend(prev_frame, frame, blend_ratio)
-
-            if scene_idx != prev_scene_idx:
-                prev_scene_idx = scene_idx
-            prev_frame = frame.copy()
-
-            # Dimming (자막 가독성)
-            overlay_dim = Image.new("RGBA", (self.w, self.h), (0, 0, 0, 50))
-            frame = frame.convert("RGBA")
-            frame = Image.alpha_composite(frame, overlay_dim).convert("RGB")
-
-            # 현재 대사 찾기
-            active_chunk = None
-            for chunk in chunks:
-                if chunk["start_ms"] <= current_ms <= chunk["end_ms"]:
-                    active_chunk = chunk
-                    break
-
-            # 말풍선 자막 (하단 30%)
-            if active_chunk:
-                frame = self._render_balloon_subtitle(frame, active_chunk, current_ms)
-
-            # 아웃트로
-            remaining_sec = (total_ms - current_ms) / 1000
-            if 0 <= remaining_sec <= 2.0:
-                frame = self._render_cta_outro(frame, remaining_sec)
-
-            # ★ 엔딩 페이드아웃: 마지막 1.5초 영상 fade to black
-            if remaining_sec <= 1.5 and remaining_sec > 0:
-                fade_alpha = int(255 * (1.0 - remaining_sec / 1.5))
-                fade_overlay = Image.new("RGBA", (self.w, self.h), (0, 0, 0, fade_alpha))
-                frame = frame.convert("RGBA")
-                frame = Image.alpha_composite(frame, fade_overlay).convert("RGB")
-
-            # 저장
-            frame_path = os.path.join(frames_dir, f"frame_{frame_idx:06d}.jpg")
-            frame.save(frame_path, quality=92)
+                        frame = self._dim(self._create_cinematic_gradient(cur_emotion))
+
+                    frame = self._apply_ken_burns(frame, current_ms,
+                                                   scene_start_ms, scene_end_ms, scene_idx,
+                                                   emotion=cur_emotion)
+
+                # ★ 장면 전환 효과 (crossfade / 흑백→컬러 / 빠른컷)
+                scene_key = current_clip_path or current_img_path
+                if scene_idx != prev_scene_idx and prev_scene_idx >= 0 and prev_frame:
+                    elapsed_in_scene = current_ms - scene_start_ms
+                    is_highlight = _scene_highlights.get(scene_key, False)
+
+                    if cur_emotion == "shocked":
+                        trans_ms = 100
+                    elif is_highlight:
+                        trans_ms = 300
+                    else:
+                        trans_ms = 300
 
-            if frame_idx % (self.config.fps * 10) == 0:
-                pct = (frame_idx / max(1, total_frames)) * 100
-                print(f"  📊 렌더링 진행: {pct:.0f}% ({frame_idx}/{total_frames})")
+                    if elapsed_in_scene < trans_ms:
+                        blend_ratio = elapsed_in_scene / trans_ms
+                        if is_highlight and cur_emotion != "shocked":
+                            gray_prev = ImageOps.grayscale(prev_frame).convert("RGB")
+                            frame = Image.blend(gray_prev, frame, blend_ratio)
+                        else:
+                            frame = Image.blend(prev_frame, frame, blend_ratio)
+
+                if scene_idx != prev_scene_idx:
+                    prev_scene_idx = scene_idx
+                    # v11.1: 더 이상 안 쓰는 클립 프레임(1080x1920 × 수백 장) 해제
+                    for cp in [cp for cp, last in clip_last_ms.items() if last < current_ms]:
+                        clip_frame_cache.pop(cp, None)
+                        del clip_last_ms[cp]
+                prev_frame = frame  # 이후 frame은 재할당만 됨 (제자리 수정 없음)
+
+                # Dimming (자막 가독성) — v11.1: 소스 이미지/클립 프레임에 미리 적용됨 (_dim)
+
+                # 현재 대사 찾기
+                active_chunk = None
+                for chunk in chunks:
+                    if chunk["start_ms"] <= current_ms <= chunk["end_ms"]:
+                        active_chunk = chunk
+                        break
 
+                # 말풍선 자막 (하단 30%)
+                if active_chunk:
+                    frame = self._render_balloon_subtitle(frame, active_chunk, current_ms)
+
+                # 아웃트로
+                remaining_sec = (total_ms - current_ms) / 1000
+                if 0 <= remaining_sec <= 2.0:
+                    frame = self._render_cta_outro(frame, remaining_sec)
+
+                # ★ 엔딩 페이드아웃: 마지막 1.5초 영상 fade to black
+                if remaining_sec <= 1.5 and remaining_sec > 0:
+                    fade_alpha = int(255 * (1.0 - remaining_sec / 1.5))
+                    fade_overlay = Image.new("RGBA", (self.w, self.h), (0, 0, 0, fade_alpha))
+                    frame = frame.convert("RGBA")
+                    frame = Image.alpha_composite(frame, fade_overlay).convert("RGB")
+
+                # 저장
+                self._save_frame_async(save_pool, pending_saves, frame,
+                                       f"{frame_prefix}{frame_idx:06d}.jpg", 92)
+
+                if frame_idx % progress_every == 0:
+                    pct = (frame_idx / max(1, total_frames)) * 100
+                    print(f"  📊 렌더링 진행: {pct:.0f}% ({frame_idx}/{total_frames})")
+
+            for fut in pending_saves:
+                fut.result()
+        finally:
+            save_pool.shutdown(wait=True, cancel_futures=True)
         print(f"  ✅ 프레임 렌더링 완료!")
 
+        # v11.1: 인코딩(+폴백) 전에 프레임 캐시 해제 → 피크 메모리 감소
+        clip_frame_cache.clear()
+        img_cache.clear()
+        prev_frame = None
+        gc.collect()
+
         # Step 4: FFmpeg 인코딩
-        title_safe = re.sub(r'[^\w가-힣]', '_',
-                            script_data.get("title", "shorts"))[:20]
+        title_safe = _SAFE_TITLE_RE.sub('_',
+                                     script_data.get("title", "shorts"))[:20]
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_filename = f"shorts_{title_safe}_{timestamp}.mp4"
         output_path = os.path.join(self.config.output_dir, output_filename)
@@ -6557,12 +7155,13 @@ class VideoAssembler:
         abs_output = os.path.abspath(output_path)
 
         print(f"  🔧 FFmpeg CRF 인코딩 중...")
-        cmd = [
+        cmd_head = [
             FFMPEG_PATH, "-y",
             "-framerate", str(self.config.fps),
             "-i", abs_frames,
             "-i", abs_audio,
-            "-c:v", "libx264", "-preset", "medium", "-crf", "20",
+        ]
+        cmd_tail = [
             "-profile:v", "high", "-level", "4.1",
             "-maxrate", "8000k", "-bufsize", "8000k",
             "-c:a", "aac", "-b:a", "256k", "-ar", "44100",
@@ -6572,8 +7171,7 @@ class VideoAssembler:
             "-metadata", f"title={script_data.get('title', 'Shorts')}",
             abs_output,
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True,
-                                encoding="utf-8", errors="replace")
+        result = self._encode_video(cmd_head, cmd_tail)
 
         if result.returncode != 0:
             print(f"  ⚠️  FFmpeg 에러 → Satisfying 폴백")
@@ -6583,9 +7181,6 @@ class VideoAssembler:
         size_mb = os.path.getsize(output_path) / (1024 * 1024)
         print(f"  ✅ 영상 완성! {output_path} ({size_mb:.1f}MB)")
 
-        # 클립 프레임 캐시 해제 (메모리 절약)
-        clip_frame_cache.clear()
-
         shutil.rmtree(frames_dir, ignore_errors=True)
         return output_path
 
@@ -6593,45 +7188,40 @@ class VideoAssembler:
                               target_w: int, target_h: int) -> list:
         """
         비디오 클립에서 전체 프레임을 PIL Image 리스트로 추출.
-        FFmpeg로 프레임 → JPG 추출 후 PIL로 로드.
+        v11.1: JPG 디스크 왕복 제거 → FFmpeg rawvideo(rgb24) 파이프를 프레임 단위로 읽음
         """
-        clip_frames_dir = clip_path + "_frames"
-        os.makedirs(clip_frames_dir, exist_ok=True)
-
-        frame_pattern = os.path.join(clip_frames_dir, "f_%05d.jpg")
+        frame_size = target_w * target_h * 3
         cmd = [
-            FFMPEG_PATH, "-y",
+            FFMPEG_PATH, "-v", "error",
             "-i", clip_path,
             "-vf", f"fps={fps},scale={target_w}:{target_h}:force_original_aspect_ratio=increase,crop={target_w}:{target_h}",
-            "-q:v", "3",
-            frame_pattern,
+            "-map", "0:v:0", "-an", "-sn", "-dn",
+            "-f", "rawvideo", "-pix_fmt", "rgb24",
+            "-",
         ]
+        frames = []
         try:
-            subprocess.run(
-                cmd, capture_output=True, text=True, timeout=60,
-                encoding="utf-8", errors="replace",
-            )
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                    stderr=subprocess.DEVNULL)
         except Exception as e:
             print(f"    ⚠️  클립 프레임 추출 실패: {e}")
             return []
 
-        frames = []
-        idx = 1
-        while True:
-            fpath = os.path.join(clip_frames_dir, f"f_{idx:05d}.jpg")
-            if not os.path.exists(fpath):
-                break
-            try:
-                img = Image.open(fpath).convert("RGB")
-                if img.size != (target_w, target_h):
-                    img = img.resize((target_w, target_h), Image.LANCZOS)
-                frames.append(img)
-            except Exception:
-                pass
-            idx += 1
-
-        # 임시 프레임 파일 정리
-        shutil.rmtree(clip_frames_dir, ignore_errors=True)
+        # 기존 subprocess timeout=60과 동일한 상한
+        killer = threading.Timer(60, proc.kill)
+        killer.start()
+        try:
+            while True:
+                buf = proc.stdout.read(frame_size)
+                if len(buf) < frame_size:
+                    break
+                frames.append(Image.frombytes("RGB", (target_w, target_h), buf))
+            proc.wait()
+        except Exception as e:
+            print(f"    ⚠️  클립 프레임 추출 실패: {e}")
+        finally:
+            killer.cancel()
+            proc.stdout.close()
         return frames
 
     # ── v9.0 감정 연동 Ken Burns 모션 프로필 ──
@@ -6730,26 +7320,6 @@ class VideoAssembler:
                 return c.get("emotion", "neutral")
         return "neutral"
 
-    def _draw_text_with_stroke(self, draw: ImageDraw.Draw,
-                                x: int, y: int, text: str,
-                                font: ImageFont.FreeTypeFont,
-                                color: tuple, alpha: float,
-                                stroke_px: int = 4):
-        """v4.2: Pillow 내장 stroke_width 사용 → 49루프→1콜 (20배 가속)"""
-        a = int(255 * alpha)
-        stroke_a = int(230 * alpha)
-        shadow_a = int(140 * alpha)
-
-        # 1) 그림자 (5px offset)
-        draw.text((x + 5, y + 5), text, font=font,
-                   fill=(0, 0, 0, shadow_a))
-
-        # 2) 외곽선 + 메인 텍스트 (Pillow built-in stroke_width)
-        draw.text((x, y), text, font=font,
-                   fill=(*color, a),
-                   stroke_width=stroke_px,
-                   stroke_fill=(0, 0, 0, stroke_a))
-
     def _concat_audio(self, chunks: list[dict], output: str, work_dir: str):
         """
         v6.0: pydub Silence Trim + Cross-fade 믹싱
@@ -6766,13 +7336,15 @@ class VideoAssembler:
 
         try:
             # 각 문장 앞뒤 무음 제거 → trimmed 파일 생성
+            # ★ 트리밍 결과는 PCM WAV(44100/mono)로 → MP3 인코더 지연/패딩이
+            #   이음새마다 쌓이지 않고, 최종 concat에서 한 번만 인코딩
             trimmed_files = []
             for i, chunk in enumerate(chunks):
                 audio_file = chunk.get("audio_file", "")
                 if not audio_file or not os.path.exists(audio_file):
                     continue
 
-                trimmed = os.path.join(work_dir, f"trimmed_{i:03d}.mp3")
+                trimmed = os.path.join(work_dir, f"trimmed_{i:03d}.wav")
                 # silenceremove: 앞뒤 무음 제거 (threshold -40dB)
                 cmd_trim = [
                     FFMPEG_PATH, "-y", "-i", os.path.abspath(audio_file),
@@ -6782,16 +7354,23 @@ class VideoAssembler:
                         "silenceremove=start_periods=1:start_silence=0.02:start_threshold=-40dB,"
                         "areverse"
                     ),
-                    "-c:a", "libmp3lame", "-b:a", "192k", "-ar", "44100",
+                    "-c:a", "pcm_s16le", "-ar", "44100", "-ac", "1",
                     os.path.abspath(trimmed),
                 ]
                 subprocess.run(cmd_trim, capture_output=True, text=True,
                                encoding="utf-8", errors="replace", timeout=10)
 
-                if os.path.exists(trimmed) and os.path.getsize(trimmed) > 500:
-                    trimmed_files.append(trimmed)
-                else:
-                    trimmed_files.append(os.path.abspath(audio_file))
+                if not (os.path.exists(trimmed) and os.path.getsize(trimmed) > 500):
+                    # 트리밍 실패 → 원본을 같은 WAV 포맷으로만 변환 (concat 입력 포맷 통일)
+                    subprocess.run([
+                        FFMPEG_PATH, "-y", "-i", os.path.abspath(audio_file),
+                        "-c:a", "pcm_s16le", "-ar", "44100", "-ac", "1",
+                        os.path.abspath(trimmed),
+                    ], capture_output=True, text=True,
+                       encoding="utf-8", errors="replace", timeout=10)
+                    if not (os.path.exists(trimmed) and os.path.getsize(trimmed) > 500):
+                        raise Exception(f"WAV 변환 실패: {os.path.basename(audio_file)}")
+                trimmed_files.append(trimmed)
 
             if not trimmed_files:
                 raise Exception("트리밍된 파일 없음")
@@ -6806,6 +7385,7 @@ class VideoAssembler:
                     f.write(f"file '{abs_path}'\n")
 
             # concat 후 acrossface 대신 간격 50ms로 타이트하게
+            # 입력이 전부 동일 포맷 PCM → 샘플 단위로 정확히 이어붙이고 MP3 인코딩은 여기서 1회
             subprocess.run([
                 FFMPEG_PATH, "-y", "-f", "concat", "-safe", "0",
                 "-i", os.path.abspath(concat_list),
@@ -6850,8 +7430,7 @@ class VideoAssembler:
             else:
                 return
 
-        # ── Step 2: Voice 마스터링 (강화 EQ + compressor) ──
-        print(f"  🎛️  Voice 마스터링...")
+        # ── Step 2~3: Voice 마스터링 + 드론 BGM + 덕킹 ──
         mastered_voice = os.path.join(work_dir, "voice_mastered.mp3")
         voice_filter = (
             "acompressor=threshold=-18dB:ratio=4:attack=5:release=50,"
@@ -6860,88 +7439,126 @@ class VideoAssembler:
             "equalizer=f=5000:t=q:w=1:g=1,"
             "loudnorm=I=-14:TP=-1:LRA=9"
         )
-        r = subprocess.run([
-            FFMPEG_PATH, "-y", "-i", raw_voice,
-            "-af", voice_filter,
-            "-c:a", "libmp3lame", "-b:a", "192k", "-ar", "44100",
-            mastered_voice
-        ], capture_output=True, text=True, encoding="utf-8", errors="replace")
-        if r.returncode != 0:
-            print(f"  ⚠️  Voice 마스터링 실패, raw 사용")
-            mastered_voice = raw_voice
-
-        # ── Step 3: BGM 생성 + Sidechain Ducking (-20dB) ──
-        if self.config.bgm_enabled:
-            print(f"  🎵 앰비언트 드론 BGM + Sidechain Ducking (-20dB)...")
-            total_sec = max(c["end_ms"] for c in chunks) / 1000 + 1
-            bgm_file = os.path.join(work_dir, "bgm.mp3")
-            # v4.2: 사인파 앰비언트 드론 (220Hz+330Hz+440Hz)
-            # 핑크노이즈 대신 따뜻한 드론 → 몰입감 + 집중도 UP
-            drone_src = (
-                f"sine=f=220:r=44100:d={total_sec:.1f},"
-                f"volume=0.03[s1];"
-                f"sine=f=330:r=44100:d={total_sec:.1f},"
-                f"volume=0.02[s2];"
-                f"sine=f=440:r=44100:d={total_sec:.1f},"
-                f"volume=0.015[s3];"
-                f"[s1][s2][s3]amix=inputs=3:duration=shortest,"
-                f"lowpass=f=500,"
-                f"afade=t=in:st=0:d=1.5,"
-                f"afade=t=out:st={max(0, total_sec - 2):.1f}:d=2,"
-                f"volume=0.4"
-            )
-            subprocess.run([
-                FFMPEG_PATH, "-y", "-f", "lavfi",
-                "-i", drone_src,
-                "-c:a", "libmp3lame", "-b:a", "64k", "-ar", "44100",
-                bgm_file
-            ], capture_output=True)
-
-            if not os.path.exists(bgm_file):
-                print(f"  ⚠️  BGM 생성 실패, voice만 사용")
-                shutil.move(mastered_voice, output)
-                return
+        duck_chain = (
+            "acompressor=threshold=0.008:ratio=20:attack=10:release=200"
+            ":detection=peak:link=average:level_sc=1"
+        )
 
-            ducked_output = os.path.join(work_dir, "final_mix.mp3")
-            abs_voice = os.path.abspath(mastered_voice)
-            abs_bgm = os.path.abspath(bgm_file)
+        # SFX 이벤트는 미리 수집 → 단일 패스 그래프에 합류
+        sfx_mgr = None
+        sfx_events = []
+        try:
+            sfx_mgr = SFXManager()
+            sfx_events = sfx_mgr.collect_sfx_from_chunks(chunks)
+        except Exception as e:
+            print(f"  ⚠️  SFX 시스템 오류 (무시): {e}")
 
-            # Sidechain: TTS 구간 BGM 30%로 감소 (attack 10ms, release 200ms)
-            duck_filter = (
-                "[1:a]acompressor=threshold=0.008:ratio=20:attack=10:release=200"
-                ":detection=peak:link=average:level_sc=1[bgm_ducked];"
-                "[0:a][bgm_ducked]amix=inputs=2:weights=1 0.15:duration=shortest"
-            )
-            r2 = subprocess.run([
-                FFMPEG_PATH, "-y",
-                "-i", abs_voice,
-                "-i", abs_bgm,
-                "-filter_complex", duck_filter,
+        # ★ v11.1: 단일 filter_complex 패스 (중간 mp3 인코딩 제거)
+        # 마스터링 + 드론 BGM + 덕킹 + SFX 오버레이를 한 번에 → 디코드/인코딩 1회
+        single_pass_ok = False
+        sfx_done = False
+        if self.config.bgm_enabled:
+            print(f"  🎛️  Voice 마스터링 + 드론 BGM + Ducking (단일 패스)...")
+            total_sec = max(c["end_ms"] for c in chunks) / 1000 + 1
+            graph_parts = [
+                f"{self._drone_bgm_src(total_sec)}[bgm]",
+                f"[0:a]{voice_filter}[vm]",
+                f"[bgm]{duck_chain}[bgm_ducked]",
+                f"[vm][bgm_ducked]amix=inputs=2:weights=1 0.15:duration=shortest[mixed]",
+            ]
+            extra_inputs = []
+            out_label = "[mixed]"
+            if sfx_events:
+                extra_inputs, sfx_parts, out_label = sfx_mgr.build_sfx_graph(
+                    sfx_events, base_label="[mixed]", first_input=1)
+                graph_parts.extend(sfx_parts)
+            r_single = subprocess.run([
+                FFMPEG_PATH, "-y", "-i", os.path.abspath(raw_voice),
+                *extra_inputs,
+                "-filter_complex", ";".join(graph_parts),
+                "-map", out_label,
                 "-c:a", "libmp3lame", "-b:a", "192k", "-ar", "44100",
-                ducked_output
+                os.path.abspath(output),
             ], capture_output=True, text=True, encoding="utf-8", errors="replace")
+            if r_single.returncode == 0 and os.path.exists(output):
+                single_pass_ok = True
+                sfx_done = bool(sfx_events)
+                print(f"  ✅ 마스터링 + BGM + Sidechain Ducking (-20dB) 완료"
+                      + (f" + SFX {min(len(sfx_events), 5)}개" if sfx_done else ""))
+            else:
+                print(f"  ⚠️  단일 패스 실패 → 단계별 폴백")
+
+        if not single_pass_ok:
+            # ── Step 2: Voice 마스터링 (강화 EQ + compressor) ──
+            print(f"  🎛️  Voice 마스터링...")
+            r = subprocess.run([
+                FFMPEG_PATH, "-y", "-i", raw_voice,
+                "-af", voice_filter,
+                "-c:a", "libmp3lame", "-b:a", "192k", "-ar", "44100",
+                mastered_voice
+            ], capture_output=True, text=True, encoding="utf-8", errors="replace")
+            if r.returncode != 0:
+                print(f"  ⚠️  Voice 마스터링 실패, raw 사용")
+                mastered_voice = raw_voice
+
+            # ── Step 3: BGM 생성 + Sidechain Ducking (-20dB) ──
+            if self.config.bgm_enabled:
+                print(f"  🎵 앰비언트 드론 BGM + Sidechain Ducking (-20dB)...")
+                total_sec = max(c["end_ms"] for c in chunks) / 1000 + 1
+                bgm_file = os.path.join(work_dir, "bgm.mp3")
+                # v4.2: 사인파 앰비언트 드론 (220Hz+330Hz+440Hz)
+                # 핑크노이즈 대신 따뜻한 드론 → 몰입감 + 집중도 UP
+                drone_src = self._drone_bgm_src(total_sec)
+                subprocess.run([
+                    FFMPEG_PATH, "-y", "-f", "lavfi",
+                    "-i", drone_src,
+                    "-c:a", "libmp3lame", "-b:a", "64k", "-ar", "44100",
+                    bgm_file
+                ], capture_output=True)
+
+                if not os.path.exists(bgm_file):
+                    print(f"  ⚠️  BGM 생성 실패, voice만 사용")
+                    shutil.move(mastered_voice, output)
+                    return
+
+                ducked_output = os.path.join(work_dir, "final_mix.mp3")
+                abs_voice = os.path.abspath(mastered_voice)
+                abs_bgm = os.path.abspath(bgm_file)
+
+                # Sidechain: TTS 구간 BGM 30%로 감소 (attack 10ms, release 200ms)
+                duck_filter = (
+                    f"[1:a]{duck_chain}[bgm_ducked];"
+                    "[0:a][bgm_ducked]amix=inputs=2:weights=1 0.15:duration=shortest"
+                )
+                r2 = subprocess.run([
+                    FFMPEG_PATH, "-y",
+                    "-i", abs_voice,
+                    "-i", abs_bgm,
+                    "-filter_complex", duck_filter,
+                    "-c:a", "libmp3lame", "-b:a", "192k", "-ar", "44100",
+                    ducked_output
+                ], capture_output=True, text=True, encoding="utf-8", errors="replace")
 
-            if r2.returncode == 0:
-                shutil.move(ducked_output, output)
-                print(f"  ✅ BGM + Sidechain Ducking (-20dB) 완료")
+                if r2.returncode == 0:
+                    shutil.move(ducked_output, output)
+                    print(f"  ✅ BGM + Sidechain Ducking (-20dB) 완료")
+                else:
+                    print(f"  ⚠️  Ducking 실패, voice만 사용")
+                    shutil.move(mastered_voice, output)
             else:
-                print(f"  ⚠️  Ducking 실패, voice만 사용")
                 shutil.move(mastered_voice, output)
-        else:
-            shutil.move(mastered_voice, output)
-            print(f"  ✅ Voice 마스터링 완료 (BGM 없음)")
+                print(f"  ✅ Voice 마스터링 완료 (BGM 없음)")
 
         # ── Step 4: SFX 효과음 오버레이 (★ BGM 덕킹 이후 최종 단계) ──
+        # 단일 패스에서 이미 믹싱했으면 스킵
         try:
-            sfx_mgr = SFXManager()
-            sfx_events = sfx_mgr.collect_sfx_from_chunks(chunks)
-            if sfx_events and os.path.exists(output):
+            if sfx_events and not sfx_done and os.path.exists(output):
                 sfx_output = os.path.join(work_dir, "final_with_sfx.mp3")
                 if sfx_mgr.mix_sfx_into_audio(output, sfx_events, sfx_output):
                     shutil.move(sfx_output, output)
                 else:
                     print(f"  ⚠️  SFX 믹싱 실패, SFX 없이 진행")
-            elif sfx_events:
+            elif sfx_events and not sfx_done:
                 print(f"  ⚠️  SFX 오버레이 스킵: output 파일 없음")
         except Exception as e:
             print(f"  ⚠️  SFX 시스템 오류 (무시): {e}")
@@ -6957,6 +7574,23 @@ class VideoAssembler:
                 except OSError:
                     pass
 
+    @staticmethod
+    def _drone_bgm_src(total_sec: float) -> str:
+        """v4.2: 사인파 앰비언트 드론 (220Hz+330Hz+440Hz) lavfi 그래프"""
+        return (
+            f"sine=f=220:r=44100:d={total_sec:.1f},"
+            f"volume=0.03[s1];"
+            f"sine=f=330:r=44100:d={total_sec:.1f},"
+            f"volume=0.02[s2];"
+            f"sine=f=440:r=44100:d={total_sec:.1f},"
+            f"volume=0.015[s3];"
+            f"[s1][s2][s3]amix=inputs=3:duration=shortest,"
+            f"lowpass=f=500,"
+            f"afade=t=in:st=0:d=1.5,"
+            f"afade=t=out:st={max(0, total_sec - 2):.1f}:d=2,"
+            f"volume=0.4"
+        )
+
     def _assemble_simple_fallback(self, audio: str, duration: float,
                                    chunks: list, output: str,
                                    work_dir: str) -> str:
@@ -7223,15 +7857,16 @@ class ShortsFactory:
                 )
                 output_files.append(output_path)
 
-                # 메타 저장
+                # 메타 저장 (meta/upload_info 공통 생성 시각 1회 계산)
                 duration_sec = max(c["end_ms"] for c in chunks) / 1000
+                created_at = datetime.now().isoformat(timespec="seconds")
                 meta = {
                     "video": output_path,
                     "script": script_data,
                     "chunks": len(chunks),
                     "duration_sec": duration_sec,
                     "screenshots": screenshots,
-                    "created": datetime.now().isoformat(),
+                    "created": created_at,
                 }
                 with open(output_path.replace(".mp4", "_meta.json"), "w",
                           encoding="utf-8") as f:
@@ -7250,7 +7885,7 @@ class ShortsFactory:
                     "shorts": True,
                     "duration_sec": round(duration_sec, 1),
                     "video_file": os.path.basename(output_path),
-                    "created": datetime.now().isoformat(),
+                    "created": created_at,
                 }
                 upload_path = output_path.replace(".mp4", "_upload_info.json")
                 with open(upload_path, "w", encoding="utf-8") as f:
@@ -7259,7 +7894,6 @@ class ShortsFactory:
 
             except Exception as e:
                 print(f"  ❌ 에러: {e}")
-                import traceback
                 traceback.print_exc()
             finally:
                 # work_dir 임시 파일 정리
@@ -7351,6 +7985,12 @@ def parse_args():
     out = p.add_argument_group("📁 출력")
     out.add_argument("--output", default="./output")
     out.add_argument("--quality", type=int, default=80)
+    out.add_argument("--preset", default="faster",
+                     choices=["ultrafast", "superfast", "veryfast", "faster",
+                              "fast", "medium", "slow"],
+                     help="x264 인코딩 프리셋 (기본 faster)")
+    out.add_argument("--crf", type=int, default=20,
+                     help="x264 CRF 화질 (낮을수록 고화질, 기본 20)")
 
     return p.parse_args()
 
@@ -7371,6 +8011,8 @@ async def main():
         tts_rate=args.rate,
         tts_pitch=args.pitch,
         quality=args.quality,
+        x264_preset=args.preset,
+        x264_crf=args.crf,
         output_dir=args.output,
     )
 
@@ -44,6 +44,7 @@ import subprocess
 import sys
 import time
 import traceback
+from collections import deque
 from datetime import datetime, date
 from pathlib import Path
 
@@ -78,12 +79,30 @@ VALID_SOURCES = ["viral", "natepann", "instiz", "fmkorea", "dcinside"]
 # ============================================================
 # 히스토리 관리 (하루 생산량 추적)
 # ============================================================
+# 루프마다 _load_history()가 호출되므로 (mtime, size)가 같으면 파싱 생략
+_history_cache: dict = {"key": None, "data": None}
+
+
+def _history_stat_key() -> tuple | None:
+    try:
+        st = HISTORY_FILE.stat()
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
 def _load_history() -> dict:
-    """생산 히스토리 로드"""
+    """생산 히스토리 로드 (파일 변경 없으면 캐시 재사용)"""
+    key = _history_stat_key()
+    if key is not None and _history_cache["key"] == key:
+        return _history_cache["data"]
     try:
-        if HISTORY_FILE.exists():
+        if key is not None:
             with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+                history = json.load(f)
+            _history_cache["key"] = key
+            _history_cache["data"] = history
+            return history
     except Exception:
         pass
     return {"daily": {}, "total": 0}
@@ -94,6 +113,8 @@ def _save_history(history: dict) -> None:
     HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(HISTORY_FILE, "w", encoding="utf-8") as f:
         json.dump(history, f, ensure_ascii=False, indent=2)
+    _history_cache["key"] = _history_stat_key()
+    _history_cache["data"] = history
 
 
 def _get_today_count(history: dict) -> int:
@@ -317,13 +338,16 @@ def run_single(
             return True, f"완료 ({elapsed:.1f}초)"
         else:
             print(f"  ❌ 실패 (exit={result.returncode}, {elapsed:.1f}초)")
-            # 에러 출력 마지막 10줄
-            stderr_lines = result.stderr.strip().split("\n")[-10:]
+            # 에러 출력 마지막 10줄 (뒤에서 10줄만 분리 → 전체 split 없음)
+            stderr_lines = result.stderr.strip().rsplit("\n", 10)[-10:]
             for line in stderr_lines:
                 print(f"     {line}")
-            # stdout에서도 에러 힌트 추출
-            stdout_errors = [l for l in result.stdout.split("\n") if "❌" in l or "Error" in l]
-            for line in stdout_errors[-3:]:
+            # stdout에서도 에러 힌트 추출 (최근 3개만 유지)
+            stdout_errors = deque(
+                (l for l in result.stdout.splitlines() if "❌" in l or "Error" in l),
+                maxlen=3,
+            )
+            for line in stdout_errors:
                 print(f"     {line.strip()}")
             return False, f"exit={result.returncode}"
 
@@ -589,21 +613,29 @@ def clean_output(clean_all: bool = False) -> None:
 
     removed = 0
 
+    # output/ 1회 스캔 — DirEntry가 타입/stat을 캐시 (glob 2회 + 파일마다 getsize/isdir 없음)
+    mp4_entries, work_dirs = [], []
+    with os.scandir(output_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".mp4") and entry.is_file():
+                mp4_entries.append(entry)
+            elif entry.name.startswith("_work_") and entry.is_dir():
+                work_dirs.append(entry)
+
     # 비정상 MP4 삭제 (0KB 또는 100KB 미만)
-    for mp4 in glob.glob(os.path.join(output_dir, "*.mp4")):
-        size = os.path.getsize(mp4)
+    for entry in mp4_entries:
+        size = entry.stat().st_size
         if size < 100 * 1024:  # 100KB 미만 → 비정상
-            os.remove(mp4)
-            print(f"  🗑️  삭제: {os.path.basename(mp4)} ({size/1024:.0f}KB)")
+            os.remove(entry.path)
+            print(f"  🗑️  삭제: {entry.name} ({size/1024:.0f}KB)")
             removed += 1
 
     if clean_all:
         # 임시 작업 디렉토리 삭제
-        for work in glob.glob(os.path.join(output_dir, "_work_*")):
-            if os.path.isdir(work):
-                shutil.rmtree(work, ignore_errors=True)
-                print(f"  🗑️  삭제: {os.path.basename(work)}/")
-                removed += 1
+        for entry in work_dirs:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            print(f"  🗑️  삭제: {entry.name}/")
+            removed += 1
 
         # __pycache__ 삭제
         for cache in glob.glob(os.path.join(str(SCRIPT_DIR), "**/__pycache__"), recursive=True):
@@ -3,7 +3,7 @@
 - output/ 내 *_upload_info.json 탐색
 - .env에서 YOUTUBE_CLIENT_ID, CLIENT_SECRET, REFRESH_TOKEN 읽기
 - shorts: true면 제목에 #Shorts 추가
-- uploaded_history.json으로 중복 업로드 방지
+- uploaded_history.jsonl(append-only)로 중복 업로드 방지
 
 실행: py youtube_uploader.py
 """
@@ -11,65 +11,152 @@
 import json
 import os
 import glob
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    import orjson  # 선택: 있으면 JSONL 직렬화/파싱 가속 (bytes 직접 쓰기)
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
 ROOT = Path(__file__).resolve().parent
 OUTPUT_DIR = ROOT / "output"
-HISTORY_PATH = ROOT / "uploaded_history.json"
-
-
-def load_history():
-    if not HISTORY_PATH.exists():
-        return []
-    try:
-        with open(HISTORY_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return []
+# 재개 가능 업로드 청크 크기 (256KB 배수) — 1MB 청크는 HTTP 왕복 오버헤드가 큼
+_UPLOAD_CHUNKSIZE = 64 * 1024 * 1024
+# 재시도 대상 HTTP 상태 (그 외 HttpError는 즉시 실패 처리)
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# YouTube는 레이트 리밋을 403으로 반환 → 이 reason이면 403도 재시도
+_RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+# 이보다 작은 파일은 재개 세션 없이 단일 multipart 요청으로 업로드
+_SINGLE_REQUEST_MAX = 5 * 1024 * 1024
 
+HISTORY_PATH = ROOT / "uploaded_history.json"    # 레거시 (읽기 전용)
+HISTORY_JSONL = ROOT / "uploaded_history.jsonl"  # 업로드 1건 = 1줄 추가
 
-def save_history(history):
-    with open(HISTORY_PATH, "w", encoding="utf-8") as f:
-        json.dump(history, f, ensure_ascii=False, indent=2)
 
+def load_history():
+    history = []
+    if HISTORY_PATH.exists():
+        try:
+            with open(HISTORY_PATH, "r", encoding="utf-8") as f:
+                history.extend(json.load(f))
+        except (json.JSONDecodeError, IOError):
+            pass
+    if HISTORY_JSONL.exists():
+        loads = orjson.loads if orjson else json.loads
+        try:
+            with open(HISTORY_JSONL, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        history.append(loads(line))
+                    except ValueError:
+                        continue  # 중단된 마지막 줄 등 (JSONDecodeError 포함)
+        except IOError:
+            pass
+    return history
+
+
+def append_history(entry):
+    """업로드 결과 1건을 JSONL 끝에 추가 (전체 재작성 없음)"""
+    if orjson:
+        line = orjson.dumps(entry) + b"\n"
+    else:
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+    with open(HISTORY_JSONL, "ab") as f:
+        f.write(line)
+
+
+# 프로세스 내 Credentials 캐시 (access token 재사용)
+_CREDS_CACHE = None
+
+
+def _get_credentials():
+    global _CREDS_CACHE
+    if _CREDS_CACHE is not None:
+        return _CREDS_CACHE
 
-def get_youtube_service():
     client_id = os.getenv("YOUTUBE_CLIENT_ID")
     client_secret = os.getenv("YOUTUBE_CLIENT_SECRET")
     refresh_token = os.getenv("YOUTUBE_REFRESH_TOKEN")
 
     if not all([client_id, client_secret, refresh_token]):
-        print("ERROR: .env에 YOUTUBE_CLIENT_ID, CLIENT_SECRET, REFRESH_TOKEN을 설정하세요.")
-        print("  py get_youtube_token.py 로 토큰을 발급받으세요.")
         return None
 
     from google.oauth2.credentials import Credentials
-    from googleapiclient.discovery import build
 
-    credentials = Credentials(
+    _CREDS_CACHE = Credentials(
         token=None,
         refresh_token=refresh_token,
         client_id=client_id,
         client_secret=client_secret,
         token_uri="https://oauth2.googleapis.com/token",
     )
+    return _CREDS_CACHE
+
+
+def _ensure_fresh_credentials(credentials, margin_sec=300):
+    """만료 5분 전이면 미리 갱신 → 업로드 요청 도중 토큰 갱신으로 멈추지 않게"""
+    from google.auth.transport.requests import Request
+
+    expiry = credentials.expiry  # google-auth: naive UTC
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    if not credentials.token or expiry is None or \
+            (expiry - now).total_seconds() < margin_sec:
+        credentials.refresh(Request())
+
+
+def get_youtube_service():
+    credentials = _get_credentials()
+    if credentials is None:
+        print("ERROR: .env에 YOUTUBE_CLIENT_ID, CLIENT_SECRET, REFRESH_TOKEN을 설정하세요.")
+        print("  py get_youtube_token.py 로 토큰을 발급받으세요.")
+        return None
+
+    from googleapiclient.discovery import build
 
     return build("youtube", "v3", credentials=credentials)
 
 
-def upload_video(youtube, info_path):
+def _upload_name(info_path):
+    return os.path.basename(info_path).replace("_upload_info.json", "")
+
+
+def _is_retryable_http(e):
+    """HttpError 재시도 여부 — 5xx/429, 또는 reason이 레이트 리밋인 403"""
+    status = e.resp.status
+    if status in _RETRYABLE_STATUS:
+        return True
+    if status != 403:
+        return False
+    try:
+        errors = json.loads(e.content).get("error", {}).get("errors", [])
+    except (ValueError, TypeError, AttributeError):
+        return False
+    return any(err.get("reason") in _RATE_LIMIT_REASONS for err in errors)
+
+
+def upload_video(youtube, info_path, name=""):
+    """name이 있으면 모든 로그 줄 앞에 [name] — 동시 업로드 시 어느 영상인지 구분"""
+    from googleapiclient.errors import HttpError
     from googleapiclient.http import MediaFileUpload
 
+    tag = f"[{name}] " if name else ""
     with open(info_path, "r", encoding="utf-8") as f:
         info = json.load(f)
 
     video_file = OUTPUT_DIR / info["video_file"]
     if not video_file.exists():
-        print(f"  SKIP: 영상 파일 없음 - {info['video_file']}")
+        print(f"  {tag}SKIP: 영상 파일 없음 - {info['video_file']}")
         return None
 
     title = (info.get("title") or "Untitled").strip()
@@ -96,27 +183,44 @@ def upload_video(youtube, info_path):
         },
     }
 
-    media = MediaFileUpload(str(video_file), mimetype="video/mp4", resumable=True, chunksize=1024 * 1024)
-    request = youtube.videos().insert(part="snippet,status", body=body, media_body=media)
+    if video_file.stat().st_size < _SINGLE_REQUEST_MAX:
+        media = MediaFileUpload(str(video_file), mimetype="video/mp4", resumable=False)
+    else:
+        media = MediaFileUpload(str(video_file), mimetype="video/mp4", resumable=True,
+                                chunksize=_UPLOAD_CHUNKSIZE)
+    # 응답에서 id만 사용 → fields로 snippet/status 에코 생략
+    request = youtube.videos().insert(part="snippet,status", body=body,
+                                      media_body=media, fields="id")
 
-    print(f"  업로드 중: {title}")
+    print(f"  {tag}업로드 중: {title}")
     response = None
     retries = 0
     while response is None and retries <= 5:
         try:
+            if not media.resumable():
+                response = request.execute()
+                break
+            # 같은 request/media를 계속 사용 → 실패 시 해당 청크부터 재개
             status, response = request.next_chunk()
+            retries = 0  # 재시도 한도는 청크 단위 (누적 X)
             if status:
-                print(f"  진행률: {int(status.progress() * 100)}%")
+                print(f"  {tag}진행률: {int(status.progress() * 100)}%")
         except Exception as e:
+            # 4xx(권한/쿼터/잘못된 메타데이터)는 재시도해도 동일 → 즉시 중단
+            # (403 레이트 리밋은 예외 — 백오프 후 재시도)
+            if isinstance(e, HttpError) and not _is_retryable_http(e):
+                print(f"  {tag}ERROR: 업로드 실패 (HTTP {e.resp.status}) - {e}")
+                return None
             retries += 1
             if retries > 5:
-                print(f"  ERROR: 업로드 실패 - {e}")
+                print(f"  {tag}ERROR: 업로드 실패 - {e}")
                 return None
-            time.sleep(2 ** retries)
+            # 지수 백오프 + full jitter
+            time.sleep(random.uniform(0, min(60, 2 * (2 ** retries))))
 
     video_id = response["id"]
     url = f"https://youtu.be/{video_id}"
-    print(f"  완료: {url}")
+    print(f"  {tag}완료: {url}")
 
     return {
         "video_id": video_id,
@@ -127,6 +231,73 @@ def upload_video(youtube, info_path):
     }
 
 
+_CREDS_LOCK = threading.Lock()
+_thread_local = threading.local()
+
+
+def _thread_service():
+    """googleapiclient Resource는 스레드 안전하지 않음 → 워커 스레드마다 1개"""
+    service = getattr(_thread_local, "service", None)
+    if service is None:
+        service = get_youtube_service()
+        _thread_local.service = service
+    return service
+
+
+def _upload_worker(info_path):
+    name = _upload_name(info_path)
+    print(f"[{name}] 시작")
+    try:
+        # Credentials는 공유 — 갱신만 잠금으로 직렬화
+        with _CREDS_LOCK:
+            _ensure_fresh_credentials(_get_credentials())
+    except Exception as e:
+        print(f"  [{name}] WARN: 토큰 사전 갱신 실패 - {e}")
+    return upload_video(_thread_service(), info_path, name)
+
+
+def upload_many(info_paths, max_workers=3, on_result=None):
+    """여러 영상을 동시 업로드 (업링크/RTT 대기 겹치기, 쿼터 버스트 방지로 최대 3개)
+
+    on_result(result)는 완료 순서대로 호출 스레드에서 실행됨.
+    반환: info_paths 순서의 결과 리스트 (실패는 None)
+    """
+    results = [None] * len(info_paths)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(info_paths)))) as ex:
+        futures = {ex.submit(_upload_worker, p): i for i, p in enumerate(info_paths)}
+        for fut in as_completed(futures):
+            try:
+                result = fut.result()
+            except Exception as e:
+                print(f"  [{_upload_name(info_paths[futures[fut]])}] ERROR: 업로드 예외 - {e}")
+                result = None
+            results[futures[fut]] = result
+            if result and on_result:
+                on_result(result)
+            print()  # 업로드 1건 종료 구분
+    return results
+
+
+def fetch_metadata_batch(youtube, video_ids):
+    """videos.list id=... 형식으로 최대 50개씩 묶어서 조회 → {video_id: item}"""
+    result = {}
+    ids = [v for v in video_ids if v]
+    for i in range(0, len(ids), 50):
+        chunk = ids[i:i + 50]
+        try:
+            resp = youtube.videos().list(
+                part="snippet,status",
+                id=",".join(chunk),
+                fields="items(id,snippet/title,status(uploadStatus,privacyStatus))",
+            ).execute()
+        except Exception as e:
+            print(f"  WARN: 메타데이터 조회 실패 - {e}")
+            continue
+        for item in resp.get("items", []):
+            result[item["id"]] = item
+    return result
+
+
 def main():
     youtube = get_youtube_service()
     if not youtube:
@@ -153,14 +324,27 @@ def main():
 
     print(f"업로드 대기: {len(pending)}개\n")
 
-    for info_path in pending:
-        name = os.path.basename(info_path).replace("_upload_info.json", "")
-        print(f"[{name}]")
-        result = upload_video(youtube, info_path)
-        if result:
-            history.append(result)
-            save_history(history)
-        print()
+    uploaded_now = []
+
+    def _on_result(result):
+        # 메인 스레드에서만 호출 → 히스토리 기록은 직렬
+        history.append(result)
+        append_history(result)
+        uploaded_now.append(result["video_id"])
+
+    upload_many(pending, on_result=_on_result)
+
+    # 이번 실행분 처리 상태 확인 (영상별 호출 대신 50개 단위 1회)
+    if uploaded_now:
+        meta = fetch_metadata_batch(youtube, uploaded_now)
+        for vid in uploaded_now:
+            item = meta.get(vid)
+            if not item:
+                continue
+            status = item.get("status", {})
+            print(f"  {vid}: {status.get('uploadStatus', '?')}"
+                  f" / {status.get('privacyStatus', '?')}"
+                  f" - {item.get('snippet', {}).get('title', '')}")
 
     uploaded_count = len([h for h in history if isinstance(h, dict)])
     print(f"총 {uploaded_count}개 업로드 완료.")